@@ -4,12 +4,38 @@
 from django.contrib import admin
 
 # Projects Imports
-from .models import User, Vendor, Asset, Employee, AssignAsset, AssetType, ClientAsset
+from .models import User, Vendor, Asset, Employee, AssignAsset, AssetType, ClientAsset, SpecField
 
 # Third Party Imports
+from import_export import resources, widgets
 from import_export.admin import ImportExportModelAdmin
 
 
+class SpecResource(resources.ModelResource):
+    """
+    Import/export for models with spec columns.
+
+    ``SpecField`` reports itself as a ``PositiveSmallIntegerField``, which would
+    give it an integer widget that cannot parse choice values like ``"16GB"``;
+    spec columns are exported and imported as their choice text instead.
+    """
+
+    @classmethod
+    def widget_from_django_field(cls, f, default=widgets.Widget):
+        if isinstance(f, SpecField):
+            return widgets.CharWidget
+        return super().widget_from_django_field(f, default)
+
+
+class AssetResource(SpecResource):
+    class Meta:
+        model = Asset
+
+
+class ClientAssetResource(SpecResource):
+    class Meta:
+        model = ClientAsset
+
 
 admin.site.register(User)
 
@@ -35,9 +61,9 @@ class VendorAdmin(ImportExportModelAdmin):
 
 @admin.register(Asset)
 class AssetAdmin(ImportExportModelAdmin):
-    pass
+    resource_classes = [AssetResource]
 
 
 @admin.register(ClientAsset)
 class ClientAdmin(ImportExportModelAdmin):
-    pass
\ No newline at end of file
+    resource_classes = [ClientAssetResource]
\ No newline at end of file
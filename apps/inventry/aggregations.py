@@ -0,0 +1,228 @@
+"""
+Dashboard aggregation engine.
+
+Every card on the dashboard is derived from a single grouped query keyed by
+(asset type, brand), read from the materialized ``InventorySummary`` table
+(see ``summary.py``) or, with ``get_asset_groups``, from live ``Asset`` rows.
+The per-type table, the per-brand remaining table and the totals are rolled
+up from those groups in Python, so the work done here is linear in the number
+of distinct (type, brand) pairs and never touches individual asset rows.
+
+Query budget for ``get_dashboard_stats`` (cached by ``get_dashboard_context``):
+    1. grouped ``InventorySummary`` query (type, brand -> count, remaining, price sums)
+    2. ``Employee`` count
+    3. ``ClientAsset`` count
+The ``today``, ``yesterday`` and ``all_assets`` entries are lazy querysets
+and only cost one query each if the template evaluates them.
+
+When the in-memory asset snapshot is enabled (see ``snapshot.py``) the
+(type, brand) groups are computed from it instead, without a query.
+"""
+
+# Python Imports
+from datetime import timedelta
+
+# Django Imports
+from django.db.models import Count, F, Q, Sum
+
+# Project Imports
+from .cache import cached
+from .models import Asset, AssignAsset, ClientAsset, Employee, InventorySummary
+from .snapshot import get_snapshot
+
+
+DASHBOARD_QUERY_BUDGET = 3
+
+
+def get_asset_groups(queryset=None) -> list:
+    """
+    Return one row per (asset type, brand) with the asset count, the number of
+    unassigned assets and the price sums for both.
+
+    Args:
+        queryset: Optional ``Asset`` queryset to aggregate, defaults to all assets.
+
+    Returns:
+        list: dicts with ``asset_type__asset_name``, ``asset_brand``, ``count``,
+        ``remaining``, ``asset_price`` and ``remaining_price`` keys.
+    """
+    if queryset is None:
+        queryset = Asset.objects.all()
+    unassigned = Q(is_assign=False)
+    return list(
+        queryset.order_by()
+        .values("asset_type__asset_name", "asset_brand")
+        .annotate(
+            count=Count("id"),
+            remaining=Count("id", filter=unassigned),
+            asset_price=Sum("price"),
+            remaining_price=Sum("price", filter=unassigned),
+        )
+        .order_by("asset_type__asset_name", "asset_brand")
+    )
+
+
+def get_type_summary(vendor=None, is_assign=None) -> list:
+    """
+    Return one row per asset type with its asset count, unassigned count and
+    price sum, computed with a single grouped query.
+
+    Args:
+        vendor: Optional ``Vendor`` (or id) to restrict the assets to.
+        is_assign (bool): Optional assignment state to restrict the assets to.
+
+    Returns:
+        list: dicts with ``asset_type``, ``asset_brand``, ``count``,
+        ``remaining`` and ``asset_price`` keys, see ``summarize_by_type``.
+    """
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        return summarize_by_type(snapshot.asset_groups(vendor=vendor, is_assign=is_assign))
+    queryset = Asset.objects.all()
+    if vendor is not None:
+        queryset = queryset.filter(vendor=vendor)
+    if is_assign is not None:
+        queryset = queryset.filter(is_assign=is_assign)
+    return summarize_by_type(get_asset_groups(queryset))
+
+
+def get_summary_groups() -> list:
+    """
+    Return the same rows as ``get_asset_groups`` for all assets, read from the
+    ``InventorySummary`` table instead of scanning ``Asset``.
+    """
+    return list(
+        InventorySummary.objects.filter(count__gt=0)
+        .values("asset_type__asset_name", "asset_brand")
+        .annotate(
+            remaining=Sum(F("count") - F("assigned_count")),
+            remaining_price=Sum(F("price_sum") - F("assigned_price_sum")),
+        )
+        .annotate(count=Sum("count"), asset_price=Sum("price_sum"))
+        .order_by("asset_type__asset_name", "asset_brand")
+    )
+
+
+def _add_price(total, price):
+    if price is None:
+        return total
+    if total is None:
+        return price
+    return total + price
+
+
+def summarize_by_type(groups) -> list:
+    """
+    Roll (type, brand) groups up to one row per asset type, in the shape used by
+    the ``asset_type_query`` dashboard table.
+    """
+    by_type = {}
+    for group in groups:
+        asset_type = group["asset_type__asset_name"]
+        if asset_type is None:
+            continue
+        row = by_type.get(asset_type)
+        if row is None:
+            row = by_type[asset_type] = {
+                "asset_type": asset_type,
+                "asset_brand": group["asset_brand"],
+                "asset_price": None,
+                "count": 0,
+                "remaining": 0,
+            }
+        row["count"] += group["count"]
+        row["remaining"] += group["remaining"]
+        row["asset_price"] = _add_price(row["asset_price"], group["asset_price"])
+    return list(by_type.values())
+
+
+def summarize_remaining_by_brand(groups) -> list:
+    """
+    Return the unassigned asset count for each (type, brand) pair that still has
+    stock, in the shape used by the ``remaining_assets`` dashboard table.
+    """
+    return [
+        {
+            "asset_type": group["asset_type__asset_name"],
+            "asset_brand": group["asset_brand"],
+            "count": group["remaining"],
+        }
+        for group in groups
+        if group["remaining"] and group["asset_type__asset_name"] is not None
+    ]
+
+
+def summarize_totals(groups) -> dict:
+    """
+    Return the overall asset count, remaining count and price sums across all groups.
+    """
+    totals = {"count": 0, "remaining": 0, "asset_price": None, "remaining_price": None}
+    for group in groups:
+        totals["count"] += group["count"]
+        totals["remaining"] += group["remaining"]
+        totals["asset_price"] = _add_price(totals["asset_price"], group["asset_price"])
+        totals["remaining_price"] = _add_price(
+            totals["remaining_price"], group["remaining_price"]
+        )
+    return totals
+
+
+def get_asset_items():
+    """
+    Return a lazy queryset of the per-asset rows listed on the dashboard.
+    """
+    return (
+        Asset.objects.filter(asset_type__isnull=False)
+        .values(
+            "quantity",
+            assetname=F("asset_type__asset_name"),
+            brand=F("asset_brand"),
+            assetprice=F("price"),
+            assetpurchasedate=F("purchase_date"),
+        )
+        .order_by("asset_type__asset_name", "id")
+    )
+
+
+def get_dashboard_stats() -> dict:
+    """
+    Compute the dashboard counters and tables within ``DASHBOARD_QUERY_BUDGET`` queries.
+
+    Returns:
+        dict: Plain, picklable values suitable for caching.
+    """
+    snapshot = get_snapshot()
+    groups = snapshot.asset_groups() if snapshot is not None else get_summary_groups()
+    totals = summarize_totals(groups)
+    return {
+        "total_asset_quantity": totals["count"],
+        "total_employee": Employee.objects.count(),
+        "total_asset_type": totals["count"],
+        "asset_type_query": summarize_by_type(groups),
+        "total_remaining_asset": totals["remaining"],
+        "total_client_asset": ClientAsset.objects.count(),
+        "remaining_assets": summarize_remaining_by_brand(groups),
+        "total_price": totals["asset_price"],
+        "total_remaining_price": totals["remaining_price"],
+    }
+
+
+def get_dashboard_context(today_date) -> dict:
+    """
+    Build the full ``DashboardView`` context, serving the statistics from the cache
+    while the inventory is unchanged.
+
+    Args:
+        today_date (date): The date used for the today/yesterday assignment counters.
+
+    Returns:
+        dict: The dashboard template context.
+    """
+    yesterday_date = today_date - timedelta(1)
+    context = {
+        "today": AssignAsset.objects.filter(created_at=today_date),
+        "yesterday": AssignAsset.objects.filter(created_at=yesterday_date),
+        "all_assets": get_asset_items(),
+    }
+    context.update(cached("dashboard", get_dashboard_stats))
+    return context
@@ -5,3 +5,5 @@ class InventryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.inventry'
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,116 @@
+"""
+Autocomplete endpoints for the asset and employee pickers.
+
+The assignment and client asset forms use ``django-autocomplete-light``
+Select2 widgets instead of rendering every asset and employee as an
+``<option>``: a bound widget only renders the selected objects, and the
+dropdown pages through these JSON endpoints as the user types. The typed
+text is matched word by word as a prefix through the full-text index (see
+``search.py``), so "dell 16" narrows the list to Dell assets with 16GB.
+"""
+
+# Python Imports
+
+# Django Imports
+from django import forms
+from django.contrib.auth.mixins import LoginRequiredMixin
+
+# Project Imports
+from .models import Asset, Employee
+from .search import is_enabled as search_enabled, matching_ids
+from .staticfiles import bundle_path
+
+# Third Party Imports
+from dal import autocomplete
+
+
+class PickerAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
+    """
+    Base view returning one page of prefix-matched objects.
+
+    The objects come from ``model`` or ``queryset`` as in Django's generic
+    list views, newest first.
+
+    Attributes:
+        entity (str): The search index entity matched against the typed text.
+        search_fields (list): ``django-autocomplete-light`` lookups (``^`` for a
+            prefix) used when the search index is unavailable.
+        value_field (str): Model field used as the option value.
+    """
+
+    entity = None
+    search_fields = []
+    value_field = "pk"
+    ordering = "-id"
+    paginate_by = 20
+
+    def get_search_results(self, queryset, search_term):
+        search_term = search_term.strip()
+        if search_term and search_enabled():
+            return queryset.filter(id__in=matching_ids(self.entity, search_term))
+        return super().get_search_results(queryset, search_term)
+
+    def get_result_value(self, result):
+        return str(getattr(result, self.value_field))
+
+
+class AssetAutocomplete(PickerAutocomplete):
+    queryset = Asset.objects.select_related("asset_type")
+    entity = "asset"
+    search_fields = ["^serial_number", "^asset_brand", "^asset_type__asset_name"]
+    unassigned_only = False
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.unassigned_only:
+            queryset = queryset.filter(is_assign=False)
+        return queryset
+
+
+class EmployeeAutocomplete(PickerAutocomplete):
+    model = Employee
+    entity = "employee"
+    search_fields = ["^first_name", "^last_name", "^employee_id", "^email"]
+
+
+class BundledSelect2Mixin:
+    """
+    Load select2 from the minified ``select2`` static bundle instead of the
+    unminified copy in the admin that ``django-autocomplete-light`` includes.
+    """
+
+    @property
+    def media(self):
+        media = super().media
+        bundled = {
+            "admin/js/vendor/select2/select2.full.js": bundle_path("select2", "js"),
+            "admin/css/vendor/select2/select2.css": bundle_path("select2", "css"),
+            "admin/css/vendor/select2/select2.min.css": bundle_path("select2", "css"),
+        }
+        return forms.Media(
+            js=[bundled.get(path, path) for path in media._js],
+            css={
+                medium: [bundled.get(path, path) for path in paths]
+                for medium, paths in media._css.items()
+            },
+        )
+
+
+class ModelSelect2(BundledSelect2Mixin, autocomplete.ModelSelect2):
+    """
+    ``ModelSelect2`` that renders the selected option of a ``to_field_name`` field.
+    """
+
+    def filter_choices_to_render(self, selected_choices):
+        field = self.choices.field.to_field_name or "pk"
+        self.choices.queryset = self.choices.queryset.filter(
+            **{f"{field}__in": [choice for choice in selected_choices if choice]}
+        )
+
+
+class ModelSelect2Multiple(BundledSelect2Mixin, autocomplete.ModelSelect2Multiple):
+    """
+    ``ModelSelect2Multiple`` that renders the selected options of a ``to_field_name`` field.
+    """
+
+    filter_choices_to_render = ModelSelect2.filter_choices_to_render
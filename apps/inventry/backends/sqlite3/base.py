@@ -0,0 +1,26 @@
+"""
+SQLite backend that can start transactions with ``BEGIN IMMEDIATE``.
+
+Django opens transactions with a deferred ``BEGIN``, which is what read-only
+transactions want. Transactions opened by ``atomic_write`` (see
+``apps/inventry/sqlite.py``) set ``begin_immediate`` and take the write lock
+up front instead, so concurrent writers queue on ``busy_timeout`` rather than
+failing with "database is locked" when they upgrade a read lock.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.db.backends.sqlite3 import base
+
+# Project Imports
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    begin_immediate = False
+
+    def _start_transaction_under_autocommit(self):
+        if self.begin_immediate:
+            self.cursor().execute("BEGIN IMMEDIATE")
+        else:
+            super()._start_transaction_under_autocommit()
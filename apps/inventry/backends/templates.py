@@ -0,0 +1,43 @@
+"""
+Django template backend that times rendering for the request profiler.
+
+``ProfilingMiddleware`` (see ``middleware.py``) reports the time spent
+rendering templates. Instead of patching ``Template.render`` for the whole
+process, the project's templates are loaded through this backend, whose
+templates add their render time to the profile of the current request. Outside
+a profiled request a render costs one context variable lookup.
+"""
+
+# Python Imports
+import time
+
+# Django Imports
+from django.template.backends import django
+
+# Project Imports
+from ..middleware import get_current_profile
+
+
+class Template(django.Template):
+
+    def render(self, context=None, request=None):
+        profile = get_current_profile()
+        if profile is None or profile.rendering:
+            # Templates rendered while rendering one are already timed.
+            return super().render(context, request)
+        profile.rendering = True
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            profile.template_time += time.perf_counter() - start
+            profile.rendering = False
+
+
+class DjangoTemplates(django.DjangoTemplates):
+
+    def from_string(self, template_code):
+        return Template(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return Template(super().get_template(template_name).template, self)
@@ -0,0 +1,374 @@
+"""
+Per-view benchmark suite.
+
+``run_view_benchmarks`` seeds a synthetic inventory (see ``seed.py``) at each
+requested size and requests every URL in ``apps/inventry/urls.py`` through the
+test client. It records the median wall time and query count and the peak
+Python memory of each view. Views that delete data on GET or only accept POST
+are listed as skipped. The result is a plain dict that the
+``benchmark_views`` command writes as JSON and can compare with an earlier
+report.
+
+``run_page_weight_report`` renders the login page and every HTML view once and
+adds up the bytes a browser downloads for it: the HTML plus each script,
+stylesheet and icon it references. Static files are measured as served, the
+smallest of the file and its ``.gz``/``.br`` variants in ``STATIC_ROOT`` when
+``collectstatic`` has run. Files on other hosts are listed, and only measured
+when ``fetch_external`` is set.
+
+Run them against a test database: the seeding step flushes the inventory tables.
+"""
+
+# Python Imports
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+import urllib.request
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+# Django Imports
+import django
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+
+# Project Imports
+from apps.inventry import urls
+from .models import Asset, AssignAsset, ClientAsset, Employee, User, Vendor
+from .seed import flush_inventory, seed_inventory
+
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_REPEAT = 3
+
+# URL name -> arguments, built from the fixtures picked in ``pick_fixtures``.
+URL_ARGS = {
+    "employee_update": lambda f: [f["employee"].employee_id],
+    "employee_details": lambda f: [f["employee"].id],
+    "client-update": lambda f: [f["client_asset"].id],
+    "vendor-update": lambda f: [f["vendor"].id],
+    "vendor_details": lambda f: [f["vendor"].id],
+    "asset-edit": lambda f: [f["asset"].id],
+    "asset_details": lambda f: [f["asset"].id],
+    "asset_detail": lambda f: [f["asset_type"]],
+    "asset_remaining_detail": lambda f: [f["asset_type"]],
+    "assets_record_list": lambda f: [f["asset_type"]],
+    "vendor_asset_detail": lambda f: [f["asset_type"], f["vendor"].id],
+    "assign-asset-detail": lambda f: [f["employee"].id, f["assignment"].id],
+    "assign-asset-edit": lambda f: [f["assignment"].id],
+    "assign-asset-count": lambda f: [f["employee"].email],
+    "export": lambda f: ["assets", "csv"],
+}
+
+# URL names whose GET handler changes data.
+MUTATING_VIEWS = {
+    "asset_delete", "asset-type-delete", "assign-asset-delete", "client-delete",
+    "employee_delete", "vendor-delete",
+}
+
+
+def iter_patterns(patterns=None):
+    for pattern in urls.urlpatterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_patterns(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern
+
+
+def pick_fixtures() -> dict:
+    """
+    Pick the heaviest rows to request detail pages for: the employee holding the
+    most assets, the vendor supplying the most and the most common asset type.
+    """
+    employee = (
+        Employee.objects.annotate(held=Count("assign_employee")).order_by("-held", "id").first()
+    )
+    vendor = Vendor.objects.annotate(supplied=Count("vendor_asset")).order_by("-supplied", "id").first()
+    asset_type = (
+        Asset.objects.values_list("asset_type__asset_name", flat=True)
+        .annotate(total=Count("id")).order_by("-total").first()
+    )
+    return {
+        "employee": employee,
+        "vendor": vendor,
+        "asset_type": asset_type,
+        "assignment": AssignAsset.objects.filter(employee=employee).order_by("id").first(),
+        "asset": Asset.objects.filter(vendor=vendor).order_by("id").first(),
+        "client_asset": ClientAsset.objects.order_by("id").first(),
+    }
+
+
+def skip_reason(pattern):
+    if pattern.name in MUTATING_VIEWS:
+        return "changes data on GET"
+    view_class = getattr(pattern.callback, "view_class", None)
+    if view_class is not None and not hasattr(view_class, "get"):
+        return "POST only"
+    return None
+
+
+def fetch(client, url):
+    response = client.get(url)
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+def measure(client, url, repeat):
+    """
+    Request ``url`` ``repeat`` times and return the status, median wall time,
+    query count and peak traced memory.
+    """
+    timings, queries = [], []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            fetch(client, url)
+            timings.append(time.perf_counter() - start)
+        queries.append(len(captured))
+
+    # Memory is traced in a separate request so tracing does not skew the timings.
+    tracemalloc.start()
+    try:
+        response = fetch(client, url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "wall_ms": round(statistics.median(timings) * 1000, 2),
+        "queries": max(queries),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_view_benchmarks(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, seed=0, progress=None) -> dict:
+    """
+    Benchmark every inventory view at each dataset size.
+
+    Args:
+        sizes (list): Asset counts to seed, see ``seed.default_counts`` for the other entities.
+        repeat (int): Requests per view; the median wall time is reported.
+        seed (int): Seed passed to ``seed_inventory``.
+        progress (callable): Optional callback receiving one line per measured view.
+
+    Returns:
+        dict: The JSON-serializable report.
+    """
+    user = User.objects.filter(email="benchmark@example.com").first() or User.objects.create_user(
+        username="benchmark", email="benchmark@example.com", password="benchmark"
+    )
+    client = Client(raise_request_exception=False)
+    client.force_login(user)
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "seed": seed,
+        "repeat": repeat,
+        "skipped": {},
+        "results": [],
+    }
+    for size in sizes:
+        flush_inventory()
+        counts = seed_inventory(size, seed=seed)
+        fixtures = pick_fixtures()
+        views = {}
+        for pattern in iter_patterns():
+            reason = skip_reason(pattern)
+            if reason:
+                report["skipped"][pattern.name] = reason
+                continue
+            args = URL_ARGS.get(pattern.name, lambda f: [])(fixtures)
+            url = reverse(pattern.name, args=args)
+            views[pattern.name] = {"url": url, **measure(client, url, repeat)}
+            if progress:
+                result = views[pattern.name]
+                progress(
+                    f"{size:>7} {pattern.name:<32} {result['status']} "
+                    f"{result['wall_ms']:>9.1f} ms {result['queries']:>5} queries "
+                    f"{result['peak_kib']:>9.1f} KiB"
+                )
+        report["results"].append({"size": size, "counts": counts, "views": views})
+    return report
+
+
+def compare_reports(previous, current, threshold=1.2, min_delta_ms=5):
+    """
+    Yield one line per view whose query count grew, or whose wall time grew by
+    more than ``threshold`` times and ``min_delta_ms``, between two reports.
+    """
+    previous_results = {result["size"]: result["views"] for result in previous["results"]}
+    for result in current["results"]:
+        before_views = previous_results.get(result["size"], {})
+        for name, after in result["views"].items():
+            before = before_views.get(name)
+            if before is None:
+                continue
+            if after["queries"] > before["queries"]:
+                yield (
+                    f"{result['size']:>7} {name}: queries {before['queries']} -> {after['queries']}"
+                )
+            if (
+                after["wall_ms"] > before["wall_ms"] * threshold
+                and after["wall_ms"] - before["wall_ms"] > min_delta_ms
+            ):
+                yield (
+                    f"{result['size']:>7} {name}: wall time "
+                    f"{before['wall_ms']} ms -> {after['wall_ms']} ms"
+                )
+
+
+class AssetParser(HTMLParser):
+    """
+    Collect the URLs of the scripts, stylesheets, icons and images of a page.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        url = None
+        if tag in ("script", "img"):
+            url = attrs.get("src")
+        elif tag == "link" and {"stylesheet", "icon", "apple-touch-icon"} & set(
+            (attrs.get("rel") or "").split()
+        ):
+            url = attrs.get("href")
+        url = (url or "").strip()
+        if url and url not in self.urls:
+            self.urls.append(url)
+
+
+def asset_size(url, fetch_external=False):
+    """
+    Return ``(bytes, kind)`` for one asset URL; ``bytes`` is None when unknown.
+
+    ``kind`` is "static", "external" or "missing".
+    """
+    if urlsplit(url).netloc:
+        if not fetch_external:
+            return None, "external"
+        request = urllib.request.Request(
+            url if urlsplit(url).scheme else f"https:{url}",
+            headers={"Accept-Encoding": "gzip, br"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return len(response.read()), "external"
+        except OSError:
+            return None, "external"
+
+    path = urlsplit(url).path
+    if not path.startswith(settings.STATIC_URL):
+        return None, "missing"
+    name = path[len(settings.STATIC_URL):]
+    collected = os.path.join(settings.STATIC_ROOT or "", name)
+    if settings.STATIC_ROOT and os.path.isfile(collected):
+        variants = [collected] + [
+            collected + suffix for suffix in (".gz", ".br") if os.path.isfile(collected + suffix)
+        ]
+        return min(os.path.getsize(variant) for variant in variants), "static"
+    source = finders.find(name)
+    if source is None:
+        return None, "missing"
+    return os.path.getsize(source), "static"
+
+
+def page_weight(response, fetch_external=False):
+    """
+    Add up the bytes of an HTML response and of the assets it references.
+    """
+    parser = AssetParser()
+    parser.feed(response.content.decode(response.charset or "utf-8", "replace"))
+    page = {
+        "status": response.status_code,
+        "html_bytes": len(response.content),
+        "static_requests": 0,
+        "static_bytes": 0,
+        "external": [],
+        "missing": [],
+    }
+    for asset_url in parser.urls:
+        size, kind = asset_size(asset_url, fetch_external)
+        if kind == "static":
+            page["static_requests"] += 1
+            page["static_bytes"] += size
+        else:
+            page[kind].append({"url": asset_url, "bytes": size})
+    page["total_bytes"] = page["html_bytes"] + page["static_bytes"] + sum(
+        asset["bytes"] or 0 for asset in page["external"]
+    )
+    return page
+
+
+def run_page_weight_report(assets=100, seed=0, fetch_external=False, progress=None) -> dict:
+    """
+    Measure the download size of the login page and every inventory page.
+
+    Args:
+        assets (int): Asset count to seed before rendering the pages.
+        seed (int): Seed passed to ``seed_inventory``.
+        fetch_external (bool): Download CDN assets to measure them too.
+        progress (callable): Optional callback receiving one line per page.
+
+    Returns:
+        dict: The JSON-serializable report.
+    """
+    user = User.objects.filter(email="benchmark@example.com").first() or User.objects.create_user(
+        username="benchmark", email="benchmark@example.com", password="benchmark"
+    )
+    client = Client(raise_request_exception=False)
+    client.force_login(user)
+    flush_inventory()
+    seed_inventory(assets, seed=seed)
+    fixtures = pick_fixtures()
+
+    pages = [("login", Client(), reverse("login"))]
+    for pattern in iter_patterns():
+        if not skip_reason(pattern):
+            args = URL_ARGS.get(pattern.name, lambda f: [])(fixtures)
+            pages.append((pattern.name, client, reverse(pattern.name, args=args)))
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "pages": {},
+    }
+    for name, page_client, url in pages:
+        response = fetch(page_client, url)
+        if response.streaming or "text/html" not in response.get("Content-Type", ""):
+            continue
+        page = report["pages"][name] = {"url": url, **page_weight(response, fetch_external)}
+        if progress:
+            progress(
+                f"{name:<32} {page['status']} {page['static_requests']:>3} static "
+                f"{page['static_bytes'] / 1024:>8.1f} KiB, {len(page['external']):>2} external, "
+                f"{len(page['missing']):>2} missing, total {page['total_bytes'] / 1024:>8.1f} KiB"
+            )
+    return report
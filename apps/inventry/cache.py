@@ -0,0 +1,92 @@
+"""
+Cache layer for the dashboard, summary and detail pages.
+
+Cached values are stored under ``inventory:v<version>:<name>:<params>``. Every
+write to the inventory replaces the version (see ``signals.py`` and the bulk
+services), which makes all previously cached entries unreachable at once, so
+no per-key bookkeeping is needed. Versions are random numbers written with a
+plain ``set`` rather than incremented: ``incr`` is a read and a write on the
+file-based backend, so two concurrent bumps could land on the same number,
+and a cleared or evicted cache does not bring back versions (and ETags, see
+``conditional.py``) that were handed out before. The backend is whatever
+``CACHES["default"]`` points to; it must be shared between worker processes
+(file-based, Redis, memcached) for invalidation to reach every worker.
+
+The asset snapshot (see ``snapshot.py``) has a version of its own, bumped
+only by writes to the assets and asset types it is built from, so employee,
+vendor and client writes do not make every worker rebuild it.
+
+Hits and misses are counted per process in the ``inventory_cache_lookups``
+Prometheus counter (see ``metrics.py``), so a hit costs no write to the shared
+cache.
+"""
+
+# Python Imports
+import secrets
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Project Imports
+from .metrics import CACHE_LOOKUPS
+
+
+VERSION_KEY = "inventory:version"
+SNAPSHOT_VERSION_KEY = "inventory:snapshot:version"
+
+
+def _new_version():
+    return secrets.randbelow(2 ** 31)
+
+
+def _get_version(key) -> int:
+    return cache.get_or_set(key, _new_version, timeout=None)
+
+
+def _bump_version(key):
+    cache.set(key, _new_version(), timeout=None)
+
+
+def get_cache_version() -> int:
+    return _get_version(VERSION_KEY)
+
+
+def invalidate_inventory_cache():
+    """
+    Make every cached inventory value stale by replacing the shared version.
+    """
+    _bump_version(VERSION_KEY)
+
+
+def get_snapshot_version() -> int:
+    return _get_version(SNAPSHOT_VERSION_KEY)
+
+
+def invalidate_asset_snapshot():
+    """
+    Make every worker rebuild its asset snapshot on next use.
+    """
+    _bump_version(SNAPSHOT_VERSION_KEY)
+
+
+def cached(name, builder, *params):
+    """
+    Return ``builder(*params)``, served from the cache while the inventory is unchanged.
+
+    Args:
+        name (str): Identifies the cached computation, usually the view.
+        builder (callable): Computes the value on a miss; the result must be picklable.
+        params: Arguments passed to ``builder`` and included in the cache key.
+    """
+    timeout = getattr(settings, "INVENTORY_CACHE_TIMEOUT", 300)
+    key = ":".join(["inventory", f"v{get_cache_version()}", name, *map(str, params)])
+    value = cache.get(key)
+    if value is not None:
+        CACHE_LOOKUPS.labels("hit").inc()
+        return value
+    CACHE_LOOKUPS.labels("miss").inc()
+    value = builder(*params)
+    cache.set(key, value, timeout)
+    return value
+
@@ -0,0 +1,349 @@
+"""
+Server-side processing endpoints for the jQuery DataTables list pages.
+
+Each ``DataTableView`` answers the DataTables request protocol (``draw``,
+``start``, ``length``, ``search[value]``, ``order[0][column]``,
+``order[0][dir]``) with one page of rows. Sorting is restricted to the
+whitelisted ``columns`` of the view, searching to its ``search_fields``, and
+both counts are computed in the database, so the cost of a request depends on
+the page size rather than on the size of the table.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils import formats
+from django.utils.timezone import template_localtime
+from django.views import View
+
+# Project Imports
+from .models import Asset, AssignAsset, ClientAsset, Employee, Vendor
+from .search import is_enabled as search_enabled, matching_ids, to_match_query
+
+
+DEFAULT_PAGE_LENGTH = 50
+MAX_PAGE_LENGTH = 500
+
+
+def _join(*parts):
+    """
+    Join the non-empty parts with spaces, so a missing last name is not shown as "None".
+    """
+    return " ".join(str(part) for part in parts if part not in (None, ""))
+
+
+def _display(value):
+    """
+    Format a date as the list templates did with ``{{ value }}``.
+    """
+    return formats.localize(template_localtime(value)) if value is not None else ""
+
+
+def _int_param(params, name, default):
+    try:
+        return int(params.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class DataTableView(LoginRequiredMixin, View):
+    """
+    Base view returning one DataTables page as JSON.
+
+    Attributes:
+        model: The model listed, when ``queryset`` is not given.
+        queryset (QuerySet): The rows listed; evaluated afresh on every request.
+        columns (list): ``(name, lookup)`` pairs in table column order. The index
+            sent in ``order[0][column]`` selects the lookup to sort by.
+        fields (list): Fields fetched with ``values()`` for every row.
+        search_fields (list): Lookups matched with ``icontains`` against ``search[value]``.
+        default_order (tuple): Ordering used when the request does not ask for one.
+    """
+
+    model = None
+    queryset = None
+    columns = []
+    fields = []
+    search_fields = []
+    default_order = ("id",)
+
+    def get_queryset(self):
+        """
+        Return the rows of the table, like ``MultipleObjectMixin.get_queryset``.
+        """
+        if self.queryset is not None:
+            return self.queryset.all()
+        if self.model is not None:
+            return self.model._default_manager.all()
+        name = self.__class__.__name__
+        raise ImproperlyConfigured(
+            f"{name} is missing a queryset. Define {name}.model, {name}.queryset, "
+            f"or override {name}.get_queryset()."
+        )
+
+    def serialize_row(self, row):
+        return row
+
+    def get_ordering(self, params):
+        index = _int_param(params, "order[0][column]", -1)
+        if not 0 <= index < len(self.columns):
+            return self.default_order
+        lookup = self.columns[index][1]
+        if params.get("order[0][dir]") == "desc":
+            return (f"-{lookup}", "-id")
+        return (lookup, "id")
+
+    def filter_queryset(self, queryset, term):
+        search = Q()
+        for lookup in self.search_fields:
+            search |= Q(**{f"{lookup}__icontains": term})
+        return queryset.filter(search)
+
+    def get(self, request):
+        params = request.GET
+        start = max(_int_param(params, "start", 0), 0)
+        length = _int_param(params, "length", DEFAULT_PAGE_LENGTH)
+        if not 0 < length <= MAX_PAGE_LENGTH:
+            length = MAX_PAGE_LENGTH
+
+        queryset = self.get_queryset()
+        records_total = queryset.count()
+        term = params.get("search[value]", "").strip()
+        if term and self.search_fields:
+            queryset = self.filter_queryset(queryset, term)
+            records_filtered = queryset.count()
+        else:
+            records_filtered = records_total
+
+        rows = (
+            queryset.order_by(*self.get_ordering(params))
+            .values(*self.fields)[start:start + length]
+        )
+        return JsonResponse({
+            "draw": _int_param(params, "draw", 0),
+            "recordsTotal": records_total,
+            "recordsFiltered": records_filtered,
+            "data": [self.serialize_row(row) for row in rows],
+        })
+
+
+class AssetDataTableView(DataTableView):
+    model = Asset
+    columns = [
+        ("asset_type", "asset_type__asset_name"),
+        ("asset_brand", "asset_brand"),
+        ("vendor", "vendor__first_name"),
+        ("serial_number", "serial_number"),
+    ]
+    fields = [
+        "id", "asset_type__asset_name", "asset_brand", "vendor__first_name",
+        "vendor__last_name", "serial_number",
+    ]
+    search_fields = [
+        "asset_type__asset_name", "asset_brand", "serial_number", "vendor__first_name",
+    ]
+
+    def filter_queryset(self, queryset, term):
+        # Like the asset list's own search, prefer the full-text index when there is one.
+        if search_enabled() and to_match_query(term):
+            return queryset.filter(id__in=matching_ids("asset", term))
+        return super().filter_queryset(queryset, term)
+
+    def serialize_row(self, row):
+        return {
+            "asset_type": row["asset_type__asset_name"],
+            "asset_brand": row["asset_brand"],
+            "vendor": _join(row["vendor__first_name"], row["vendor__last_name"]),
+            "serial_number": row["serial_number"],
+            "detail_url": reverse("asset_details", args=[row["id"]]),
+            "edit_url": reverse("asset-edit", args=[row["id"]]),
+            "delete_url": reverse("asset_delete", args=[row["id"]]),
+        }
+
+
+class RemainingAssetDataTableView(DataTableView):
+    queryset = Asset.objects.filter(is_assign=False)
+    columns = [
+        ("asset_type", "asset_type__asset_name"),
+        ("asset_brand", "asset_brand"),
+        ("price", "price"),
+        ("vendor", "vendor__first_name"),
+        ("system_configuration", "system_configuration"),
+        ("serial_number", "serial_number"),
+        ("invoice_number", "invoice_number"),
+        ("payment_status", "payment_status"),
+    ]
+    fields = [
+        "id", "asset_type__asset_name", "asset_brand", "price", "vendor__first_name",
+        "vendor__last_name", "system_configuration", "ram", "ssd", "operating_system",
+        "storage", "serial_number", "invoice_number", "payment_status",
+    ]
+    search_fields = [
+        "asset_type__asset_name", "asset_brand", "serial_number", "invoice_number",
+        "system_configuration",
+    ]
+
+    def serialize_row(self, row):
+        configuration = _join(*(
+            row[field]
+            for field in ("system_configuration", "ram", "ssd", "operating_system", "storage")
+        ))
+        return {
+            "asset_type": row["asset_type__asset_name"],
+            "asset_brand": row["asset_brand"],
+            "price": str(row["price"]),
+            "vendor": _join(row["vendor__first_name"], row["vendor__last_name"]),
+            "system_configuration": configuration,
+            "serial_number": row["serial_number"],
+            "invoice_number": row["invoice_number"],
+            "payment_status": row["payment_status"],
+        }
+
+
+class EmployeeDataTableView(DataTableView):
+    model = Employee
+    columns = [
+        ("name", "first_name"),
+        ("email", "email"),
+        ("date_of_joining", "date_of_joining"),
+        ("mobile_number", "mobile_number"),
+        ("technology_name", "technology_name"),
+        ("assets_held", "assets_held"),
+        ("held_value", "held_value"),
+        ("client_assets_held", "client_assets_held"),
+    ]
+    fields = [
+        "id", "employee_id", "first_name", "last_name", "email", "date_of_joining",
+        "mobile_number", "technology_name", "assets_held", "held_value", "client_assets_held",
+    ]
+    search_fields = ["first_name", "last_name", "email", "employee_id", "technology_name"]
+
+    def serialize_row(self, row):
+        return {
+            "name": _join(row["first_name"], row["last_name"]),
+            "email": row["email"],
+            "date_of_joining": _display(row["date_of_joining"]),
+            "mobile_number": row["mobile_number"],
+            "technology_name": row["technology_name"],
+            "assets_held": row["assets_held"],
+            "held_value": row["held_value"],
+            "client_assets_held": row["client_assets_held"],
+            "detail_url": reverse("employee_details", args=[row["id"]]),
+            "edit_url": reverse("employee_update", args=[row["employee_id"]]),
+            "delete_url": reverse("employee_delete", args=[row["employee_id"]]),
+        }
+
+
+class AssignAssetDataTableView(DataTableView):
+    model = AssignAsset
+    columns = [
+        ("employee", "employee__first_name"),
+        ("email", "employee__email"),
+        ("mobile_number", "employee__mobile_number"),
+        ("technology_name", "employee__technology_name"),
+        ("asset_type", "asset__asset_type__asset_name"),
+        ("asset_brand", "asset__asset_brand"),
+        ("date_of_assign", "date_of_assign"),
+    ]
+    fields = [
+        "id", "employee_id", "asset_id", "employee__first_name", "employee__last_name",
+        "employee__email", "employee__mobile_number", "employee__technology_name",
+        "asset__asset_type__asset_name", "asset__asset_brand", "date_of_assign",
+    ]
+    search_fields = [
+        "employee__first_name", "employee__last_name", "employee__email",
+        "asset__asset_type__asset_name", "asset__asset_brand", "asset__serial_number",
+    ]
+
+    def serialize_row(self, row):
+        return {
+            "employee": _join(row["employee__first_name"], row["employee__last_name"]),
+            "email": row["employee__email"],
+            "mobile_number": row["employee__mobile_number"],
+            "technology_name": row["employee__technology_name"],
+            "asset_type": row["asset__asset_type__asset_name"],
+            "asset_brand": row["asset__asset_brand"],
+            "date_of_assign": _display(row["date_of_assign"]),
+            "detail_url": reverse("assign-asset-detail", args=[row["employee_id"], row["id"]]),
+            "edit_url": reverse("assign-asset-edit", args=[row["id"]]),
+            "delete_url": reverse("assign-asset-delete", args=[row["asset_id"], row["employee_id"]]),
+        }
+
+
+class ClientDataTableView(DataTableView):
+    model = ClientAsset
+    columns = [
+        ("client_name", "client_name"),
+        ("project_owner", "project_owner"),
+        ("project", "project"),
+        ("employee", "employee__first_name"),
+        ("asset_type", "asset_type__asset_name"),
+        ("asset_brand", "asset_brand"),
+        ("configuration", "configuration"),
+        ("date_of_dispatch", "date_of_dispatch"),
+        ("serial_number", "serial_number"),
+        ("is_active", "is_active"),
+        ("is_dispatch", "is_dispatch"),
+    ]
+    fields = [
+        "id", "client_name", "project_owner", "project", "employee__first_name",
+        "employee__last_name", "employee__technology_name", "asset_type__asset_name",
+        "asset_brand", "configuration", "ram", "ssd", "operating_system",
+        "date_of_dispatch", "serial_number", "is_active", "is_dispatch",
+    ]
+    search_fields = [
+        "client_name", "project", "project_owner", "asset_brand", "serial_number",
+        "employee__first_name", "employee__last_name",
+    ]
+
+    def serialize_row(self, row):
+        configuration = _join(
+            *(row[field] for field in ("configuration", "ram", "ssd", "operating_system"))
+        )
+        return {
+            "client_name": row["client_name"],
+            "project_owner": row["project_owner"],
+            "project": row["project"],
+            "employee": _join(
+                row["employee__first_name"], row["employee__last_name"],
+                row["employee__technology_name"],
+            ),
+            "asset_type": row["asset_type__asset_name"],
+            "asset_brand": row["asset_brand"],
+            "configuration": configuration,
+            "date_of_dispatch": _display(row["date_of_dispatch"]) or "---",
+            "serial_number": row["serial_number"],
+            "is_active": row["is_active"],
+            "is_dispatch": row["is_dispatch"],
+            "edit_url": reverse("client-update", args=[row["id"]]),
+            "delete_url": reverse("client-delete", args=[row["id"]]),
+        }
+
+
+class VendorDataTableView(DataTableView):
+    model = Vendor
+    columns = [
+        ("name", "first_name"),
+        ("email", "email"),
+        ("mobile_number", "mobile_number"),
+        ("address", "address"),
+    ]
+    fields = ["id", "first_name", "last_name", "email", "mobile_number", "address"]
+    search_fields = ["first_name", "last_name", "email", "address"]
+    default_order = ("created_at", "id")
+
+    def serialize_row(self, row):
+        return {
+            "name": _join(row["first_name"], row["last_name"]),
+            "email": row["email"],
+            "mobile_number": row["mobile_number"],
+            "address": row["address"],
+            "detail_url": reverse("vendor_details", args=[row["id"]]),
+            "edit_url": reverse("vendor-update", args=[row["id"]]),
+            "delete_url": reverse("vendor-delete", args=[row["id"]]),
+        }
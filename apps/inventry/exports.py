@@ -0,0 +1,196 @@
+"""
+Streaming CSV/XLSX exports.
+
+Rows are read with ``values_list().iterator(chunk_size=...)`` so neither the
+queryset cache nor model instances are kept in memory. CSV is written row by
+row into a ``StreamingHttpResponse``; XLSX is written with a write-only
+openpyxl workbook into a temporary file that is then streamed back, since the
+zip container cannot be produced incrementally.
+"""
+
+# Python Imports
+import csv
+import tempfile
+
+# Django Imports
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import FileResponse, Http404, StreamingHttpResponse
+from django.views import View
+
+# Project Imports
+from .models import Asset, AssignAsset, ClientAsset, Employee, Vendor
+
+# Third Party Imports
+from openpyxl import Workbook
+
+
+CHUNK_SIZE = 2000
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+EXPORTS = {
+    "assets": (Asset.objects.all, [
+        ("ID", "id"),
+        ("Asset Type", "asset_type__asset_name"),
+        ("Brand", "asset_brand"),
+        ("Price", "price"),
+        ("Vendor First Name", "vendor__first_name"),
+        ("Vendor Last Name", "vendor__last_name"),
+        ("Serial Number", "serial_number"),
+        ("Invoice Number", "invoice_number"),
+        ("Invoice", "in_voice"),
+        ("Payment Status", "payment_status"),
+        ("Payment Date", "payment_date"),
+        ("Purchase Date", "purchase_date"),
+        ("System Configuration", "system_configuration"),
+        ("RAM", "ram"),
+        ("SSD", "ssd"),
+        ("Processor", "processor"),
+        ("Operating System", "operating_system"),
+        ("Storage", "storage"),
+        ("Assigned", "is_assign"),
+    ]),
+    "remaining-assets": (lambda: Asset.objects.filter(is_assign=False), [
+        ("ID", "id"),
+        ("Asset Type", "asset_type__asset_name"),
+        ("Brand", "asset_brand"),
+        ("Price", "price"),
+        ("Serial Number", "serial_number"),
+        ("Purchase Date", "purchase_date"),
+        ("System Configuration", "system_configuration"),
+        ("RAM", "ram"),
+        ("SSD", "ssd"),
+        ("Processor", "processor"),
+        ("Operating System", "operating_system"),
+        ("Storage", "storage"),
+    ]),
+    "assignments": (AssignAsset.objects.all, [
+        ("ID", "id"),
+        ("Employee ID", "employee__employee_id"),
+        ("Employee First Name", "employee__first_name"),
+        ("Employee Last Name", "employee__last_name"),
+        ("Employee Email", "employee__email"),
+        ("Asset ID", "asset_id"),
+        ("Asset Type", "asset__asset_type__asset_name"),
+        ("Brand", "asset__asset_brand"),
+        ("Serial Number", "asset__serial_number"),
+        ("Date of Assign", "date_of_assign"),
+        ("Created At", "created_at"),
+    ]),
+    "client-assets": (ClientAsset.objects.all, [
+        ("ID", "id"),
+        ("Client Name", "client_name"),
+        ("Project", "project"),
+        ("Project Owner", "project_owner"),
+        ("Employee ID", "employee__employee_id"),
+        ("Employee First Name", "employee__first_name"),
+        ("Employee Last Name", "employee__last_name"),
+        ("Asset Type", "asset_type__asset_name"),
+        ("Brand", "asset_brand"),
+        ("Configuration", "configuration"),
+        ("Serial Number", "serial_number"),
+        ("RAM", "ram"),
+        ("SSD", "ssd"),
+        ("Processor", "processor"),
+        ("Operating System", "operating_system"),
+        ("Storage", "storage"),
+        ("Active", "is_active"),
+        ("Dispatched", "is_dispatch"),
+        ("Date of Dispatch", "date_of_dispatch"),
+    ]),
+    "employees": (Employee.objects.all, [
+        ("ID", "id"),
+        ("Employee ID", "employee_id"),
+        ("First Name", "first_name"),
+        ("Last Name", "last_name"),
+        ("Email", "email"),
+        ("Mobile Number", "mobile_number"),
+        ("Date of Joining", "date_of_joining"),
+        ("Technology", "technology_name"),
+        ("Assets Held", "assets_held"),
+        ("Held Value", "held_value"),
+        ("Client Assets Held", "client_assets_held"),
+        ("Active", "is_active"),
+    ]),
+    "vendors": (Vendor.objects.all, [
+        ("ID", "id"),
+        ("First Name", "first_name"),
+        ("Last Name", "last_name"),
+        ("Email", "email"),
+        ("Mobile Number", "mobile_number"),
+        ("Address", "address"),
+        ("Active", "is_active"),
+    ]),
+}
+
+
+class Echo:
+    """
+    File-like object whose ``write`` returns the value instead of buffering it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def export_rows(resource):
+    """
+    Return the header row and a lazy iterator over the data rows of ``resource``.
+    """
+    get_queryset, columns = EXPORTS[resource]
+    headers = [header for header, _ in columns]
+    rows = (
+        get_queryset()
+        .order_by("id")
+        .values_list(*[lookup for _, lookup in columns])
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    return headers, rows
+
+
+def stream_csv(headers, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_xlsx(headers, rows, title):
+    """
+    Write the rows into a write-only workbook backed by a temporary file.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(headers)
+    for row in rows:
+        sheet.append(row)
+    output = tempfile.TemporaryFile()
+    workbook.save(output)
+    output.seek(0)
+    return output
+
+
+class ExportView(LoginRequiredMixin, View):
+    """
+    Stream a full table as ``<resource>.csv`` or ``<resource>.xlsx``.
+    """
+
+    def get(self, request, resource, file_format):
+        if resource not in EXPORTS:
+            raise Http404("Unknown export.")
+        headers, rows = export_rows(resource)
+        filename = f"{resource}.{file_format}"
+
+        if file_format == "csv":
+            response = StreamingHttpResponse(stream_csv(headers, rows), content_type="text/csv")
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+        if file_format == "xlsx":
+            return FileResponse(
+                write_xlsx(headers, rows, resource),
+                as_attachment=True,
+                filename=filename,
+                content_type=XLSX_CONTENT_TYPE,
+            )
+        raise Http404("Unknown export format.")
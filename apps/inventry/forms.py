@@ -8,7 +8,13 @@ from .models import (
     AssetType,
     AssignAsset,
     ClientAsset,
+    OS_CHOICES,
+    PROCESSOR_CHOICES,
+    RAM_CHOICES,
+    SSD_CHOICES,
+    STORAGE_CHOICES,
 )
+from .autocomplete import ModelSelect2, ModelSelect2Multiple
 # Django Imports
 from django.core.exceptions import ValidationError
 from django import forms
@@ -79,13 +85,14 @@ class EmployeeForm(forms.ModelForm):
             "technology_name",
         ]
 
+    # email and employee_id are unique among live employees through conditional
+    # constraints, which ModelForm does not validate, so they are checked here.
     def clean_email(self):
         email = self.cleaned_data.get("email")
         email_match = Employee.objects.filter(email=email).exclude(pk=self.instance.pk)
-        if self.instance and self.instance.pk and not email_match:
-            return email
-        else:
-            return email
+        if email and email_match.exists():
+            raise ValidationError("Employee with this Email already exists.")
+        return email
 
     def clean_employee_id(self):
         employee_id = self.cleaned_data.get("employee_id")
@@ -94,9 +101,9 @@ class EmployeeForm(forms.ModelForm):
         )
         if self.instance and self.instance.pk and not employee_id_match:
             return self.instance.employee_id
-        else:
-            # raise forms.ValidationError("employee id already exists")
-            return employee_id
+        if employee_id and employee_id_match.exists():
+            raise ValidationError("Employee with this Employee id already exists.")
+        return employee_id
 
     def clean_mobile_number(self):
 
@@ -135,6 +142,13 @@ class VendorForm(forms.ModelForm):
         model = Vendor
         fields = ["first_name", "last_name", "email", "mobile_number", "address"]
 
+    def clean_email(self):
+        email = self.cleaned_data.get("email")
+        email_match = Vendor.objects.filter(email=email).exclude(pk=self.instance.pk)
+        if email and email_match.exists():
+            raise ValidationError("Vendor with this Email already exists.")
+        return email
+
     def clean_mobile_number(self):
         phone_no = self.cleaned_data.get("mobile_number", None)
         ph_length = str(phone_no)
@@ -154,13 +168,13 @@ class VendorForm(forms.ModelForm):
 
 
 class AssetForm(forms.ModelForm):
-    active_vendor_list = Vendor.objects.filter(is_active=True)
+    active_vendor_list = Vendor.objects.all()
 
     asset_type = forms.ModelChoiceField(
         queryset=AssetType.objects.all(), empty_label="Select assets"
     )
     vendor = forms.ModelChoiceField(
-        queryset=Vendor.objects.filter(is_active=True), empty_label="Select vendor"
+        queryset=Vendor.objects.all(), empty_label="Select vendor"
     )
 
     asset_brand = forms.CharField(
@@ -205,46 +219,11 @@ class AssetForm(forms.ModelForm):
         ("done", "done"),
     )
 
-    RAM = (
-        ("", "Select RAM"),
-        ("4GB", "4GB"),
-        ("6GB", "6GB"),
-        ("8GB", "8GB"),
-        ("16GB", "16GB"),
-        ("32GB", "32GB"),
-        ("64GB", "64GB"),
-    )
-    SSD = (
-        ("", "Select SSD"),
-        ("120", "120"),
-        ("250", "250"),
-        ("256", "256"),
-        ("500", "500"),
-    )
-    PROCESSOR = (
-        ("", "Select Processor"),
-        ("i3", "i3"),
-        ("i5", "i5"),
-        ("i7", "i7"),
-        ("i9", "i9"),
-        ("i10", "i10"),
-    )
-    OS = (
-        ("", "Select OS"),
-        ("UBUNTU", "ubuntu"),
-        ("MAC OS", "mac os"),
-        ("WINDOW", "window"),
-        ("HACKINTOSH", "hackintosh"),
-    )
-    STORAGE = (
-        ("", "Select Storage"),
-        ("16", "16"),
-        ("32", "32"),
-        ("64", "64"),
-        ("128", "128"),
-        ("256", "256"),
-        ("512", "512"),
-    )
+    RAM = (("", "Select RAM"),) + RAM_CHOICES
+    SSD = (("", "Select SSD"),) + SSD_CHOICES
+    PROCESSOR = (("", "Select Processor"),) + PROCESSOR_CHOICES
+    OS = (("", "Select OS"),) + OS_CHOICES
+    STORAGE = (("", "Select Storage"),) + STORAGE_CHOICES
 
     class Meta:
         model = Asset
@@ -345,12 +324,14 @@ class AssetForm(forms.ModelForm):
 class AssignedAssetForm(forms.Form):
 
     asset = forms.ModelMultipleChoiceField(
-        queryset=Asset.objects.filter(is_assign=False),
+        queryset=Asset.objects.filter(is_assign=False).select_related("asset_type"),
+        widget=ModelSelect2Multiple(url="unassigned-asset-autocomplete"),
     )
     employee = forms.ModelChoiceField(
         queryset=Employee.objects.all(),
         to_field_name="email",
         empty_label="Select Employee",
+        widget=ModelSelect2(url="employee-email-autocomplete"),
     )
 
     date_of_assign = forms.DateField(
@@ -369,46 +350,11 @@ class AssignedAssetForm(forms.Form):
 
 
 class ClientForm(forms.ModelForm):
-    RAM = (
-        ("", "Select RAM"),
-        ("4GB", "4GB"),
-        ("6GB", "6GB"),
-        ("8GB", "8GB"),
-        ("16GB", "16GB"),
-        ("32GB", "32GB"),
-        ("64GB", "64GB"),
-    )
-    SSD = (
-        ("", "Select SSD"),
-        ("120", "120"),
-        ("250", "250"),
-        ("256", "256"),
-        ("500", "500"),
-    )
-    PROCESSOR = (
-        ("", "Select Processor"),
-        ("i3", "i3"),
-        ("i5", "i5"),
-        ("i7", "i7"),
-        ("i9", "i9"),
-        ("i10", "i10"),
-    )
-    OS = (
-        ("", "Select OS"),
-        ("UBUNTU", "ubuntu"),
-        ("MAC OS", "mac os"),
-        ("WINDOW", "window"),
-        ("HACKINTOSH", "hackintosh"),
-    )
-    STORAGE = (
-        ("", "Select Storage"),
-        ("16", "16"),
-        ("32", "32"),
-        ("64", "64"),
-        ("128", "128"),
-        ("256", "256"),
-        ("512", "512"),
-    )
+    RAM = (("", "Select RAM"),) + RAM_CHOICES
+    SSD = (("", "Select SSD"),) + SSD_CHOICES
+    PROCESSOR = (("", "Select Processor"),) + PROCESSOR_CHOICES
+    OS = (("", "Select OS"),) + OS_CHOICES
+    STORAGE = (("", "Select Storage"),) + STORAGE_CHOICES
 
     client_name = forms.CharField(
         widget=forms.TextInput(attrs={"class": "form-control"})
@@ -444,7 +390,9 @@ class ClientForm(forms.ModelForm):
     description = forms.CharField(
         widget=forms.TextInput(attrs={"class": "form-control"}), required=False
     )
-    employee = forms.ModelChoiceField(queryset=Employee.objects.all())
+    employee = forms.ModelChoiceField(
+        queryset=Employee.objects.all(), widget=ModelSelect2(url="employee-autocomplete")
+    )
 
     ram = forms.ChoiceField(choices=RAM, required=False)
 
@@ -493,10 +441,12 @@ class AssignedAssetsForm(forms.ModelForm):
     #     self.fields["asset"].queryset = querysets
 
     asset = forms.ModelMultipleChoiceField(
-        queryset=Asset.objects.all())
+        queryset=Asset.objects.select_related("asset_type"),
+        widget=ModelSelect2Multiple(url="asset-autocomplete"),
+    )
 
     employee = forms.ModelChoiceField(
-        queryset=Employee.objects.all()
+        queryset=Employee.objects.all(), widget=ModelSelect2(url="employee-autocomplete")
     )
 
     date_of_assign = forms.DateField(
@@ -511,3 +461,21 @@ class AssignedAssetsForm(forms.ModelForm):
     class Meta:
         model = AssignAsset
         fields = ["asset", "employee", "date_of_assign"]
+
+
+class AssetImportForm(forms.Form):
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={"class": "form-control", "accept": ".csv,.xlsx"})
+    )
+    dry_run = forms.BooleanField(required=False, initial=True)
+    create_asset_types = forms.BooleanField(required=False)
+    chunk_size = forms.IntegerField(
+        min_value=1, max_value=10000, initial=1000,
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+
+    def clean_file(self):
+        upload = self.cleaned_data.get("file")
+        if not upload.name.lower().endswith((".csv", ".xlsx")):
+            raise ValidationError("Please upload a .csv or .xlsx file")
+        return upload
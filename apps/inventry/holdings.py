@@ -0,0 +1,115 @@
+"""
+Per-employee holdings counters.
+
+``Employee`` stores what each employee holds: ``assets_held`` (assigned live
+assets), ``held_value`` (their summed price), ``client_assets_held`` (live client
+assets not yet dispatched) and ``is_have_asset``. The employee table shows and
+sorts by them without joining ``AssignAsset`` and ``ClientAsset``.
+
+The counters of an employee are recomputed from live data with a single
+``UPDATE`` whenever something they hold changes: the receivers in
+``signals.py`` cover saves and deletes of assignments, client assets and
+assets, and the set-based services and the importer call
+``refresh_employee_holdings`` / ``refresh_asset_holders`` inside their own
+transaction. ``check_employee_holdings`` reports drift and
+``rebuild_employee_holdings`` recomputes every employee.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.db.models import Count, DecimalField, Exists, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+# Project Imports
+from .models import AssignAsset, ClientAsset, Employee
+
+
+HOLDING_FIELDS = ("assets_held", "held_value", "client_assets_held", "is_have_asset")
+
+
+def _held_assets():
+    return AssignAsset.objects.filter(
+        employee=OuterRef("pk"), asset__isnull=False, asset__deleted_at__isnull=True
+    )
+
+
+def _grouped(queryset, aggregate):
+    return Subquery(
+        queryset.order_by().values("employee").annotate(total=aggregate).values("total")
+    )
+
+
+def live_holdings() -> dict:
+    """
+    Return the expressions computing each holdings field from live data.
+    """
+    held_clients = ClientAsset.objects.filter(employee=OuterRef("pk"), is_dispatch=False)
+    return {
+        "assets_held": Coalesce(_grouped(_held_assets(), Count("id")), 0),
+        "held_value": Coalesce(
+            _grouped(_held_assets(), Sum("asset__price")),
+            Value(0),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        ),
+        "client_assets_held": Coalesce(_grouped(held_clients, Count("id")), 0),
+        "is_have_asset": Exists(_held_assets()),
+    }
+
+
+def refresh_employee_holdings(employee_ids) -> int:
+    """
+    Recompute the holdings of ``employee_ids`` (deleted employees included).
+
+    Returns:
+        int: The number of employees updated.
+    """
+    employee_ids = {employee_id for employee_id in employee_ids if employee_id is not None}
+    if not employee_ids:
+        return 0
+    return Employee.all_objects.filter(pk__in=employee_ids).update(**live_holdings())
+
+
+def refresh_asset_holders(asset_ids) -> int:
+    """
+    Recompute the holdings of the employees assigned any of ``asset_ids``.
+    """
+    holders = AssignAsset.objects.filter(asset_id__in=asset_ids, employee__isnull=False)
+    return Employee.all_objects.filter(
+        pk__in=holders.values("employee_id")
+    ).update(**live_holdings())
+
+
+def rebuild_employee_holdings() -> int:
+    """
+    Recompute the holdings of every employee.
+
+    Returns:
+        int: The number of employees updated.
+    """
+    return Employee.all_objects.update(**live_holdings())
+
+
+def check_employee_holdings() -> list:
+    """
+    Compare the stored holdings with live data.
+
+    Returns:
+        list: ``(employee id, stored, live)`` tuples for every employee that has drifted.
+    """
+    live = {f"live_{field}": expression for field, expression in live_holdings().items()}
+    drifted = Q()
+    for field in HOLDING_FIELDS:
+        drifted |= ~Q(**{field: F(f"live_{field}")})
+    rows = (
+        Employee.all_objects.annotate(**live).filter(drifted)
+        .values("id", *HOLDING_FIELDS, *live).order_by("id")
+    )
+    return [
+        (
+            row["id"],
+            {field: row[field] for field in HOLDING_FIELDS},
+            {field: row[f"live_{field}"] for field in HOLDING_FIELDS},
+        )
+        for row in rows
+    ]
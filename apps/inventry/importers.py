@@ -0,0 +1,350 @@
+"""
+Bulk asset import pipeline.
+
+Spreadsheets are read row by row (``csv`` or a read-only openpyxl workbook),
+foreign keys are resolved through ``AssetType``/``Vendor`` maps loaded once
+up front, and rows are validated and written in chunks with
+``bulk_create``/``bulk_update``. Existing assets are matched on
+``serial_number`` and updated in place, and the written rows are reindexed
+for search in the same transaction. A dry run performs the same validation
+and matching but writes nothing.
+"""
+
+# Python Imports
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+# Django Imports
+from django.conf import settings
+from django.db.models import Q
+
+# Project Imports
+from .cache import invalidate_asset_snapshot, invalidate_inventory_cache
+from .holdings import refresh_asset_holders
+from .models import (
+    OS_CHOICES, PROCESSOR_CHOICES, RAM_CHOICES, SSD_CHOICES, STORAGE_CHOICES, Asset, AssetType,
+    Vendor,
+)
+from .rollups import refresh_purchases
+from .search import index_queryset
+from .sqlite import atomic_write
+from .summary import rebuild_inventory_summary
+
+# Third Party Imports
+from openpyxl import load_workbook
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Spreadsheet header (lowercased, spaces as underscores) -> Asset field.
+COLUMN_ALIASES = {
+    "asset_type": "asset_type",
+    "type": "asset_type",
+    "asset_brand": "asset_brand",
+    "brand": "asset_brand",
+    "price": "price",
+    "vendor": "vendor",
+    "vendor_email": "vendor_email",
+    "vendor_first_name": "vendor_first_name",
+    "vendor_last_name": "vendor_last_name",
+    "serial_number": "serial_number",
+    "invoice_number": "invoice_number",
+    "in_voice": "in_voice",
+    "invoice": "in_voice",
+    "payment_status": "payment_status",
+    "purchase_date": "purchase_date",
+    "system_configuration": "system_configuration",
+    "ram": "ram",
+    "ssd": "ssd",
+    "processor": "processor",
+    "operating_system": "operating_system",
+    "storage": "storage",
+}
+
+CHOICE_FIELDS = {
+    "payment_status": Asset.PAYMENT_CHOICES,
+    "in_voice": Asset.INVOICE_CHOICES,
+    "ram": RAM_CHOICES,
+    "ssd": SSD_CHOICES,
+    "processor": PROCESSOR_CHOICES,
+    "operating_system": OS_CHOICES,
+    "storage": STORAGE_CHOICES,
+}
+
+VENDOR_COLUMNS = {"vendor", "vendor_email", "vendor_first_name", "vendor_last_name"}
+
+TEXT_FIELDS = ("asset_brand", "serial_number", "invoice_number", "system_configuration")
+
+UPDATE_FIELDS = [
+    "asset_type", "asset_brand", "price", "vendor", "invoice_number", "in_voice",
+    "payment_status", "payment_date", "purchase_date", "system_configuration", "ram",
+    "ssd", "processor", "operating_system", "storage",
+]
+
+
+def _normalize_header(header):
+    return str(header or "").strip().lower().replace(" ", "_")
+
+
+def read_rows(file_obj, filename):
+    """
+    Yield one ``{field: value}`` dict per spreadsheet row without loading the whole file.
+    """
+    if filename.lower().endswith(".xlsx"):
+        workbook = load_workbook(file_obj, read_only=True, data_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+    else:
+        if isinstance(file_obj.read(0), bytes):
+            file_obj = io.TextIOWrapper(file_obj, encoding="utf-8-sig")
+        rows = csv.reader(file_obj)
+
+    headers = [COLUMN_ALIASES.get(_normalize_header(header)) for header in next(rows, [])]
+    for values in rows:
+        if not any(value not in (None, "") for value in values):
+            continue
+        yield {
+            field: value for field, value in zip(headers, values) if field is not None
+        }
+
+
+class ImportReport:
+    """
+    Counts, per-row errors and a sample of field changes for one import run.
+    """
+
+    MAX_CHANGES = 100
+
+    def __init__(self, dry_run):
+        self.dry_run = dry_run
+        self.rows = 0
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.errors = []
+        self.changes = []
+
+    def add_change(self, row_number, serial_number, changes):
+        if len(self.changes) < self.MAX_CHANGES:
+            self.changes.append((row_number, serial_number, changes))
+
+    def summary(self):
+        prefix = "Dry run: would have" if self.dry_run else "Import"
+        return (
+            f"{prefix} created {self.created}, updated {self.updated}, "
+            f"left {self.unchanged} unchanged and rejected {len(self.errors)} "
+            f"of {self.rows} rows."
+        )
+
+
+class AssetImporter:
+    """
+    Validate and write asset rows in chunks.
+
+    Args:
+        chunk_size (int): Rows validated and written per transaction.
+        dry_run (bool): Validate and diff without writing anything.
+        create_asset_types (bool): Create unknown asset types instead of rejecting the row.
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False, create_asset_types=False):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.create_asset_types = create_asset_types
+        self.report = ImportReport(dry_run)
+        self.asset_types = {
+            asset_type.asset_name.lower(): asset_type for asset_type in AssetType.objects.all()
+        }
+        self.vendors_by_email = {}
+        self.vendors_by_name = {}
+        for vendor in Vendor.objects.all():
+            if vendor.email:
+                self.vendors_by_email[vendor.email.lower()] = vendor
+            name = " ".join(filter(None, [vendor.first_name, vendor.last_name]))
+            self.vendors_by_name[name.lower()] = vendor
+
+    def run(self, rows):
+        rows = enumerate(rows, start=2)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            self.import_chunk(chunk)
+        if not self.dry_run and (self.report.created or self.report.updated):
+            rebuild_inventory_summary()
+            invalidate_asset_snapshot()
+            invalidate_inventory_cache()
+        return self.report
+
+    def resolve_asset_type(self, name):
+        name = str(name or "").strip()
+        if not name:
+            raise ValueError("asset_type is required")
+        asset_type = self.asset_types.get(name.lower())
+        if asset_type is None:
+            if not self.create_asset_types:
+                raise ValueError(f"unknown asset type {name!r}")
+            asset_type = AssetType(asset_name=name)
+            if not self.dry_run:
+                asset_type.save()
+            self.asset_types[name.lower()] = asset_type
+        return asset_type
+
+    def resolve_vendor(self, row):
+        email = str(row.get("vendor_email") or "").strip()
+        name = str(row.get("vendor") or "").strip()
+        if not name and (row.get("vendor_first_name") or row.get("vendor_last_name")):
+            name = " ".join(
+                str(part).strip()
+                for part in (row.get("vendor_first_name"), row.get("vendor_last_name"))
+                if part not in (None, "")
+            )
+        if "@" in name:
+            email, name = name, ""
+        if email:
+            vendor = self.vendors_by_email.get(email.lower())
+        elif name:
+            vendor = self.vendors_by_name.get(name.lower())
+        else:
+            return None
+        if vendor is None:
+            raise ValueError(f"unknown vendor {email or name!r}")
+        return vendor
+
+    @staticmethod
+    def clean_date(value):
+        """
+        Accept a spreadsheet date cell, a date in ``DATE_INPUT_FORMATS`` (as typed
+        in the asset form) or an ISO date.
+        """
+        if isinstance(value, datetime):
+            return value.date()
+        if value in (None, "") or isinstance(value, date):
+            return value or None
+        value = str(value).strip()
+        for date_format in settings.DATE_INPUT_FORMATS:
+            try:
+                return datetime.strptime(value, date_format).date()
+            except ValueError:
+                continue
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"invalid purchase_date {value!r}")
+
+    def clean_row(self, row):
+        """
+        Convert one raw row into ``Asset`` field values, raising ``ValueError`` on bad data.
+        """
+        values = {"asset_type": self.resolve_asset_type(row.get("asset_type"))}
+        if VENDOR_COLUMNS.intersection(row):
+            values["vendor"] = self.resolve_vendor(row)
+        for field in TEXT_FIELDS:
+            if field in row:
+                value = row[field]
+                values[field] = str(value).strip() if value not in (None, "") else None
+        if not values.get("asset_brand"):
+            raise ValueError("asset_brand is required")
+
+        try:
+            values["price"] = Decimal(str(row.get("price")).strip()).quantize(Decimal("0.01"))
+        except (InvalidOperation, ValueError):
+            raise ValueError(f"invalid price {row.get('price')!r}")
+
+        if "purchase_date" in row:
+            values["purchase_date"] = self.clean_date(row["purchase_date"])
+
+        for field, choices in CHOICE_FIELDS.items():
+            value = row.get(field)
+            if value in (None, ""):
+                continue
+            value = str(value).strip()
+            allowed = {key for key, _ in choices}
+            if value not in allowed:
+                raise ValueError(f"invalid {field} {value!r}")
+            values[field] = value
+        return values
+
+    @staticmethod
+    def diff(asset, values):
+        """
+        Return ``{field: (current, new)}`` for every value that differs from ``asset``.
+        """
+        changes = {}
+        for field, value in values.items():
+            if field in ("asset_type", "vendor"):
+                current = getattr(asset, f"{field}_id")
+                new = value.pk if value is not None else None
+            else:
+                current, new = getattr(asset, field), value
+            if current != new and not (current in (None, "") and new is None):
+                changes[field] = (current, new)
+        return changes
+
+    def import_chunk(self, chunk):
+        cleaned = []
+        for row_number, row in chunk:
+            self.report.rows += 1
+            try:
+                cleaned.append((row_number, self.clean_row(row)))
+            except ValueError as e:
+                self.report.errors.append((row_number, str(e)))
+
+        serials = [values["serial_number"] for _, values in cleaned if values.get("serial_number")]
+        existing = {
+            asset.serial_number: asset
+            for asset in Asset.objects.filter(serial_number__in=serials)
+        }
+
+        to_create, to_update, purchase_keys = [], {}, set()
+        for row_number, values in cleaned:
+            serial_number = values.get("serial_number")
+            asset = existing.get(serial_number) if serial_number else None
+            if asset is None:
+                asset = Asset(**values)
+                asset.payment_date = asset.payment()
+                to_create.append(asset)
+                if serial_number:
+                    existing[serial_number] = asset
+                continue
+
+            changes = self.diff(asset, values)
+            if not changes:
+                self.report.unchanged += 1
+                continue
+            purchase_keys.add((asset.purchase_date, asset.asset_type_id))
+            for field in changes:
+                setattr(asset, field, values[field])
+            if "payment_status" in changes:
+                asset.payment_date = asset.payment()
+            self.report.add_change(row_number, serial_number, changes)
+            if asset.pk is not None:
+                to_update[asset.pk] = asset
+                purchase_keys.add((asset.purchase_date, asset.asset_type_id))
+
+        self.report.created += len(to_create)
+        self.report.updated += len(to_update)
+        if self.dry_run:
+            return
+        with atomic_write():
+            # bulk_create returns no primary keys on SQLite; new rows follow the current maximum.
+            last_id = Asset.objects.order_by("-id").values_list("id", flat=True).first() or 0
+            Asset.objects.bulk_create(to_create, batch_size=self.chunk_size)
+            Asset.objects.bulk_update(
+                list(to_update.values()), UPDATE_FIELDS, batch_size=self.chunk_size
+            )
+            index_queryset(Asset.objects.filter(Q(id__gt=last_id) | Q(pk__in=list(to_update))))
+            # Updated prices change the held value of whoever holds the assets.
+            refresh_asset_holders(list(to_update))
+            refresh_purchases(
+                purchase_keys | {(asset.purchase_date, asset.asset_type_id) for asset in to_create}
+            )
+
+
+def import_assets(file_obj, filename, **options):
+    """
+    Import assets from a CSV or XLSX file object and return the ``ImportReport``.
+    """
+    return AssetImporter(**options).run(read_rows(file_obj, filename))
@@ -0,0 +1,367 @@
+"""
+Append-only assignment ledger.
+
+``AssignAsset`` and ``ClientAsset`` rows only say who holds something now:
+editing or deleting an assignment loses who held it before. Every change of
+holder is therefore also appended to ``AssignmentEvent``, in the transaction
+making the change:
+
+* ``assign``: a held-by-nobody asset or client asset is given to an employee,
+* ``reassign``: it moves from one employee to another,
+* ``release``: it is taken back (assignment deleted, asset or client asset
+  deleted, employee offboarded),
+* ``dispatch``: a client asset is dispatched to the client.
+
+An asset is held by the employee of its assignment while the asset is live; a
+client asset by its employee while it is live and not dispatched, the same
+definitions as ``holdings.py``. The writers do not describe the change
+themselves: ``record_asset_holders`` / ``record_client_asset_holders`` compare
+the live holder of the given ids with the last event of each and append an
+event where they differ. The receivers in ``signals.py`` call them on saves
+and deletes, and the set-based services inside their own transaction.
+
+Each event also counts towards the day's ``DailyActivity`` row of its asset
+type (see ``rollups.py``).
+
+The ledger is ordered by ``id``. Every ``ASSIGNMENT_CHECKPOINT_INTERVAL``
+events an ``AssignmentCheckpoint`` stores the full holdings after its last
+event, so ``holdings_at`` starts from the nearest checkpoint and replays at
+most one interval of events instead of the whole history.
+
+An event takes effect when it is recorded (``recorded_at``), unless the date
+entered with it (``effective_on``: the date of assignment or dispatch) is an
+earlier day; a backdated event takes effect from the start of that day. For
+a point in time, ``holdings_at`` replays the events up to the first one not
+yet in effect, then applies the backdated events recorded after it. The
+recording time itself is kept, so daily activity still counts events on the
+day they were recorded.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Max, Q, Subquery
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Project Imports
+from .models import (
+    Asset, AssignAsset, AssignmentCheckpoint, AssignmentCheckpointHolding, AssignmentEvent,
+    ClientAsset,
+)
+from .rollups import record_events
+from .sqlite import atomic_write
+
+
+SUBJECTS = ("asset", "client_asset")
+BATCH_SIZE = 2000
+
+
+def get_checkpoint_interval() -> int:
+    return getattr(settings, "ASSIGNMENT_CHECKPOINT_INTERVAL", 10000)
+
+
+def _live_asset_holders(asset_ids=None):
+    assignments = AssignAsset.objects.filter(
+        asset__isnull=False, asset__deleted_at__isnull=True, employee__isnull=False
+    )
+    if asset_ids is not None:
+        assignments = assignments.filter(asset_id__in=asset_ids)
+    holders = assignments.values_list("asset_id", "employee_id", "date_of_assign")
+    return {asset_id: (employee_id, on) for asset_id, employee_id, on in holders}, {}
+
+
+def _live_client_asset_holders(client_asset_ids=None):
+    client_assets = ClientAsset.objects.filter(employee__isnull=False)
+    if client_asset_ids is not None:
+        client_assets = client_assets.filter(id__in=client_asset_ids)
+    holders, dispatched = {}, {}
+    for client_asset_id, employee_id, is_dispatch, date_of_dispatch in client_assets.values_list(
+        "id", "employee_id", "is_dispatch", "date_of_dispatch"
+    ):
+        if is_dispatch:
+            dispatched[client_asset_id] = date_of_dispatch
+        else:
+            holders[client_asset_id] = (employee_id, None)
+    return holders, dispatched
+
+
+LIVE_HOLDERS = {"asset": _live_asset_holders, "client_asset": _live_client_asset_holders}
+SUBJECT_MODELS = {"asset": Asset, "client_asset": ClientAsset}
+
+
+def recorded_holders(subject, ids=None) -> dict:
+    """
+    Return the holder after the last event of each ``subject`` id (``None`` if released).
+    """
+    events = AssignmentEvent.objects.filter(**{f"{subject}__isnull": False})
+    if ids is not None:
+        events = events.filter(**{f"{subject}__in": ids})
+    last = events.order_by().values(subject).annotate(last=Max("id")).values("last")
+    return dict(
+        AssignmentEvent.objects.filter(id__in=Subquery(last)).values_list(f"{subject}_id", "employee_id")
+    )
+
+
+def _changes(subject, ids=None):
+    """
+    Yield ``(subject id, recorded holder, live holder, date, dispatched)`` where the two differ.
+    """
+    live, dispatched = LIVE_HOLDERS[subject](ids)
+    recorded = recorded_holders(subject, ids)
+    subject_ids = set(recorded) | set(live) if ids is None else ids
+    for subject_id in sorted(subject_ids):
+        previous = recorded.get(subject_id)
+        holder, on = live.get(subject_id, (None, None))
+        if previous != holder:
+            is_dispatched = holder is None and subject_id in dispatched
+            yield subject_id, previous, holder, dispatched.get(subject_id, on), is_dispatched
+
+
+def _kind(previous, holder, dispatched):
+    if previous is None:
+        return AssignmentEvent.ASSIGN
+    if holder is not None:
+        return AssignmentEvent.REASSIGN
+    return AssignmentEvent.DISPATCH if dispatched else AssignmentEvent.RELEASE
+
+
+def _record(subject, ids=None) -> int:
+    if ids is not None:
+        ids = {subject_id for subject_id in ids if subject_id is not None}
+        if not ids:
+            return 0
+    changes = list(_changes(subject, ids))
+    if not changes:
+        return 0
+    asset_types = SUBJECT_MODELS[subject].all_objects.values_list("id", "asset_type_id")
+    if ids is not None:
+        asset_types = asset_types.filter(id__in=[change[0] for change in changes])
+    asset_types = dict(asset_types)
+    events = [
+        AssignmentEvent(
+            kind=_kind(previous, holder, dispatched),
+            employee_id=holder,
+            previous_employee_id=previous,
+            asset_type_id=asset_types.get(subject_id),
+            effective_on=on,
+            **{f"{subject}_id": subject_id},
+        )
+        for subject_id, previous, holder, on, dispatched in changes
+    ]
+    AssignmentEvent.objects.bulk_create(events, batch_size=BATCH_SIZE)
+    record_events(events)
+    _schedule_checkpoint()
+    return len(events)
+
+
+def record_asset_holders(asset_ids) -> int:
+    """
+    Append an event for each of ``asset_ids`` whose holder changed since its last event.
+
+    Returns:
+        int: The number of events appended.
+    """
+    return _record("asset", asset_ids)
+
+
+def record_client_asset_holders(client_asset_ids) -> int:
+    """
+    Append an event for each of ``client_asset_ids`` whose holder changed since its last event.
+
+    Returns:
+        int: The number of events appended.
+    """
+    return _record("client_asset", client_asset_ids)
+
+
+def sync_assignment_ledger() -> int:
+    """
+    Append the events that bring the ledger in line with every live holder.
+
+    Returns:
+        int: The number of events appended.
+    """
+    return sum(_record(subject) for subject in SUBJECTS)
+
+
+def check_assignment_ledger() -> list:
+    """
+    Compare the holders recorded in the ledger with live data.
+
+    Returns:
+        list: ``(subject, id, recorded holder, live holder)`` tuples for every mismatch.
+    """
+    return [
+        (subject, subject_id, previous, holder)
+        for subject in SUBJECTS
+        for subject_id, previous, holder, _, _ in _changes(subject)
+    ]
+
+
+def _last_event_id():
+    return AssignmentEvent.objects.order_by("-id").values_list("id", flat=True).first()
+
+
+def _last_checkpoint(last_event=None):
+    checkpoints = AssignmentCheckpoint.objects.order_by("-last_event")
+    if last_event is not None:
+        checkpoints = checkpoints.filter(last_event__lte=last_event)
+    return checkpoints.first()
+
+
+def _schedule_checkpoint():
+    checkpoint = _last_checkpoint()
+    since = checkpoint.last_event if checkpoint else 0
+    if _last_event_id() - since >= get_checkpoint_interval():
+        transaction.on_commit(create_checkpoint)
+
+
+def create_checkpoint():
+    """
+    Store the holdings after the last event, unless a checkpoint already covers it.
+
+    Returns:
+        AssignmentCheckpoint: The new checkpoint, or ``None``.
+    """
+    try:
+        with atomic_write():
+            last_event = _last_event_id()
+            latest = _last_checkpoint()
+            if last_event is None or (latest and latest.last_event >= last_event):
+                return None
+            holdings = _replay(last_event)
+            checkpoint = AssignmentCheckpoint.objects.create(
+                last_event=last_event, holdings=len(holdings)
+            )
+            _insert_holdings(checkpoint, holdings)
+    except IntegrityError:
+        # Another process stored a checkpoint at the same event.
+        return None
+    return checkpoint
+
+
+def _insert_holdings(checkpoint, holdings):
+    # A checkpoint holds a row per held item; executemany skips building model
+    # instances for each, which took most of the time with bulk_create.
+    table = AssignmentCheckpointHolding._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table} (checkpoint_id, asset_id, client_asset_id, employee_id) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                (
+                    checkpoint.pk,
+                    subject_id if subject == "asset" else None,
+                    subject_id if subject == "client_asset" else None,
+                    employee_id,
+                )
+                for (subject, subject_id), employee_id in holdings.items()
+            ],
+        )
+
+
+def _subject_key(asset_id, client_asset_id):
+    return ("asset", asset_id) if asset_id is not None else ("client_asset", client_asset_id)
+
+
+def _replay(last_event, employee=None, asset=None, client_asset=None) -> dict:
+    """
+    Return the holdings after ``last_event``, from the nearest checkpoint and the events since.
+    """
+    holdings = {}
+    checkpoint = _last_checkpoint(last_event)
+    events = AssignmentEvent.objects.filter(id__lte=last_event)
+    if checkpoint is not None:
+        rows = checkpoint.holding_rows.all()
+        if employee is not None:
+            rows = rows.filter(employee=employee)
+        if asset is not None:
+            rows = rows.filter(asset=asset)
+        if client_asset is not None:
+            rows = rows.filter(client_asset=client_asset)
+        for asset_id, client_asset_id, employee_id in rows.values_list(
+            "asset_id", "client_asset_id", "employee_id"
+        ):
+            holdings[_subject_key(asset_id, client_asset_id)] = employee_id
+        events = events.filter(id__gt=checkpoint.last_event)
+
+    # Moving something away from an employee names them as previous_employee,
+    # so their events alone decide what they hold.
+    if employee is not None:
+        events = events.filter(Q(employee=employee) | Q(previous_employee=employee))
+    if asset is not None:
+        events = events.filter(asset=asset)
+    if client_asset is not None:
+        events = events.filter(client_asset=client_asset)
+    _apply(holdings, events)
+
+    if employee is not None:
+        employee_id = getattr(employee, "pk", employee)
+        holdings = {key: holder for key, holder in holdings.items() if holder == employee_id}
+    return holdings
+
+
+def _apply(holdings, events):
+    for asset_id, client_asset_id, employee_id in events.order_by("id").values_list(
+        "asset_id", "client_asset_id", "employee_id"
+    ):
+        key = _subject_key(asset_id, client_asset_id)
+        if employee_id is None:
+            holdings.pop(key, None)
+        else:
+            holdings[key] = employee_id
+
+
+def _in_effect(when) -> Q:
+    """
+    Match the events in effect at ``when``: recorded by then, or backdated to its day or earlier.
+    """
+    backdated = Q(effective_on__lte=timezone.localdate(when), effective_on__lt=F("recorded_on"))
+    return Q(recorded_at__lte=when) | backdated
+
+
+def holdings_at(when=None, employee=None, asset=None, client_asset=None) -> dict:
+    """
+    Return who held what at ``when``, optionally for one employee, asset or client asset.
+
+    Args:
+        when (datetime): The point in time; the latest state when omitted.
+        employee, asset, client_asset: Optional instance or primary key restricting the result.
+
+    Returns:
+        dict: Maps ``("asset", id)`` and ``("client_asset", id)`` keys to the holding employee's id.
+    """
+    filters = {"employee": employee, "asset": asset, "client_asset": client_asset}
+    if when is None:
+        last_event = _last_event_id()
+        return {} if last_event is None else _replay(last_event, **filters)
+
+    events = AssignmentEvent.objects.annotate(recorded_on=TruncDate("recorded_at"))
+    # Events are recorded in id order, so only events recorded after ``when`` can be pending.
+    pending = (
+        events.filter(recorded_at__gt=when).exclude(_in_effect(when))
+        .order_by("id").values_list("id", flat=True).first()
+    )
+    if pending is None:
+        last_event = _last_event_id()
+    else:
+        last_event = events.filter(id__lt=pending).order_by("-id").values_list("id", flat=True).first()
+    holdings = {} if last_event is None else _replay(last_event, **filters)
+    if pending is None:
+        return holdings
+
+    # A backdated event can move something to or from the employee after an
+    # event naming neither, so these are applied for every employee.
+    backdated = events.filter(_in_effect(when), id__gt=pending)
+    if asset is not None:
+        backdated = backdated.filter(asset=asset)
+    if client_asset is not None:
+        backdated = backdated.filter(client_asset=client_asset)
+    _apply(holdings, backdated)
+    if employee is not None:
+        employee_id = getattr(employee, "pk", employee)
+        holdings = {key: holder for key, holder in holdings.items() if holder == employee_id}
+    return holdings
@@ -0,0 +1,124 @@
+# Python Imports
+import time
+from decimal import Decimal
+
+# Django Imports
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Project Imports
+from apps.inventry.aggregations import get_type_summary
+from apps.inventry.models import Asset, AssetType, Vendor
+
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+TYPES = ("Laptop", "Monitor", "Keyboard", "Mouse", "Headset")
+BRANDS = ("Dell", "HP", "Apple", "Lenovo", "Asus", "Acer", "Samsung", "LG")
+
+
+class Rollback(Exception):
+    pass
+
+
+def legacy_type_summary(**filters):
+    """
+    The per-brand query and nested merge loop the summary views used before
+    ``get_type_summary``, kept here as the benchmark baseline.
+    """
+    asset_list = []
+    for brand_name in Asset.objects.filter(**filters).values_list("asset_brand", flat=True).distinct():
+        for data in Asset.objects.filter(asset_brand=brand_name, **filters).select_related("asset_type"):
+            asset_list.append({
+                "asset_type": data.asset_type.asset_name,
+                "asset_brand": data.asset_brand,
+                "asset_price": data.price,
+                "count": 1,
+                "remaining": 0 if data.is_assign else 1,
+            })
+
+    result = []
+    for asset in asset_list:
+        found = False
+        for res in result:
+            if res["asset_type"] == asset["asset_type"]:
+                res["count"] += 1
+                res["asset_price"] += asset["asset_price"]
+                res["remaining"] += asset["remaining"]
+                found = True
+                break
+        if not found:
+            result.append(asset)
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the legacy per-brand merge loop against the grouped asset summary query "
+        "on synthetic inventories. All generated rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+            help="Asset counts to benchmark.",
+        )
+        parser.add_argument(
+            "--skip-legacy-above", type=int, default=None,
+            help="Do not run the legacy implementation for sizes larger than this.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options["sizes"], options["skip_legacy_above"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, sizes, skip_legacy_above):
+        asset_types = [AssetType.objects.create(asset_name=f"Benchmark {name}") for name in TYPES]
+        vendor = Vendor.objects.create(
+            first_name="Benchmark", last_name="Vendor", email="benchmark@example.com",
+            mobile_number=0,
+        )
+
+        created = 0
+        for size in sorted(sizes):
+            Asset.objects.bulk_create(
+                (
+                    Asset(
+                        asset_type=asset_types[i % len(asset_types)],
+                        asset_brand=BRANDS[i % len(BRANDS)],
+                        price=Decimal(100 + i % 900),
+                        vendor=vendor,
+                        is_assign=i % 3 == 0,
+                    )
+                    for i in range(created, size)
+                ),
+                batch_size=2000,
+            )
+            created = max(created, size)
+
+            start = time.perf_counter()
+            grouped = get_type_summary(vendor=vendor)
+            grouped_time = time.perf_counter() - start
+
+            if skip_legacy_above is not None and size > skip_legacy_above:
+                self.stdout.write(f"{size:>8} assets: grouped {grouped_time * 1000:9.1f} ms, legacy skipped")
+                continue
+
+            start = time.perf_counter()
+            legacy = legacy_type_summary(vendor=vendor)
+            legacy_time = time.perf_counter() - start
+
+            by_type = {row["asset_type"]: (row["count"], row["remaining"], row["asset_price"]) for row in grouped}
+            matches = all(
+                by_type.get(row["asset_type"]) == (row["count"], row["remaining"], row["asset_price"])
+                for row in legacy
+            ) and len(by_type) == len(legacy)
+            self.stdout.write(
+                f"{size:>8} assets: legacy {legacy_time * 1000:9.1f} ms, "
+                f"grouped {grouped_time * 1000:9.1f} ms, "
+                f"speedup {legacy_time / grouped_time:6.1f}x"
+                + ("" if matches else "  RESULTS DIFFER")
+            )
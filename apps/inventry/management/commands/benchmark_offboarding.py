@@ -0,0 +1,97 @@
+# Python Imports
+import time
+from decimal import Decimal
+
+# Django Imports
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+# Project Imports
+from apps.inventry.middleware import QueryCounter
+from apps.inventry.models import Asset, AssetType, AssignAsset, ClientAsset, Employee, Vendor
+from apps.inventry.services import assign_assets, offboard_employees
+
+
+DEFAULT_HOLDINGS = [1, 10, 100, 1000]
+
+
+class Rollback(Exception):
+    pass
+
+
+def legacy_offboard(employee):
+    """
+    The per-assignment loop employee deletion needed before ``offboard_employees``,
+    kept here as the benchmark baseline.
+    """
+    for assignment in AssignAsset.objects.filter(employee=employee):
+        assignment.asset.is_assign = False
+        assignment.asset.save()
+        assignment.delete()
+    for client_asset in ClientAsset.objects.filter(employee=employee, is_dispatch=False):
+        client_asset.employee = None
+        client_asset.save()
+    employee.delete()
+
+
+class Command(BaseCommand):
+    help = (
+        "Count the queries and time needed to offboard an employee holding a growing number "
+        "of assets, with the per-row loop and with offboard_employees. All rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--holdings", type=int, nargs="+", default=DEFAULT_HOLDINGS,
+            help="Numbers of assets the offboarded employee holds.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options["holdings"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, holdings):
+        asset_type = AssetType.objects.create(asset_name="Benchmark Laptop")
+        vendor = Vendor.objects.create(
+            first_name="Benchmark", last_name="Vendor", email="benchmark@example.com",
+            mobile_number=0,
+        )
+        for held in holdings:
+            results = {}
+            for name, offboard in (("legacy", legacy_offboard), ("set-based", self.offboard)):
+                employee = Employee.objects.create(
+                    first_name="Departing", last_name=name, mobile_number=0,
+                )
+                brand = f"Benchmark {name} {held}"
+                Asset.objects.bulk_create(
+                    Asset(asset_type=asset_type, asset_brand=brand, price=Decimal(100), vendor=vendor)
+                    for _ in range(held)
+                )
+                # bulk_create does not set primary keys on SQLite.
+                asset_ids = list(Asset.objects.filter(asset_brand=brand).values_list("id", flat=True))
+                assign_assets(asset_ids, employee)
+                ClientAsset.objects.bulk_create(
+                    ClientAsset(client_name="Client", project="Project", asset_brand="Dell",
+                                employee=employee, project_owner="Owner")
+                    for _ in range(max(1, held // 10))
+                )
+                queries = QueryCounter()
+                with connection.execute_wrapper(queries):
+                    start = time.perf_counter()
+                    offboard(employee)
+                    elapsed = time.perf_counter() - start
+                released = not Asset.objects.filter(id__in=asset_ids, is_assign=True).exists()
+                results[name] = (queries.count, elapsed, released)
+
+            self.stdout.write(f"{held:>6} assets: " + "; ".join(
+                f"{name} {count:>5} queries {elapsed * 1000:8.1f} ms"
+                + ("" if released else " NOT RELEASED")
+                for name, (count, elapsed, released) in results.items()
+            ))
+
+    def offboard(self, employee):
+        offboard_employees([employee])
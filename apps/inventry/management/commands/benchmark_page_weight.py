@@ -0,0 +1,57 @@
+# Python Imports
+import json
+
+# Django Imports
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+# Project Imports
+from apps.inventry.benchmarks import run_page_weight_report
+
+
+DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Render every inventory page in a throwaway test database and report the bytes a "
+        "browser downloads for it (HTML, scripts, stylesheets and images) as JSON. Run "
+        "collectstatic first to measure the compressed files WhiteNoise serves."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--assets", type=int, default=100, help="Assets to seed.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the data.")
+        parser.add_argument(
+            "--fetch-external", action="store_true",
+            help="Download assets loaded from other hosts to include their size.",
+        )
+        parser.add_argument(
+            "--output", default="page_weight_report.json", help="Where to write the JSON report.",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with override_settings(CACHES=DUMMY_CACHE):
+                report = run_page_weight_report(
+                    assets=options["assets"],
+                    seed=options["seed"],
+                    fetch_external=options["fetch_external"],
+                    progress=self.stdout.write,
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        pages = report["pages"].values()
+        self.stdout.write(
+            f"{len(pages)} pages: {sum(page['total_bytes'] for page in pages) / len(pages) / 1024:.1f} KiB "
+            f"and {sum(page['static_requests'] + len(page['external']) for page in pages) / len(pages):.1f} "
+            "asset requests per page on average."
+        )
+        with open(options["output"], "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}."))
@@ -0,0 +1,94 @@
+# Python Imports
+import statistics
+import time
+from decimal import Decimal
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+# Project Imports
+from apps.inventry.aggregations import get_asset_groups
+from apps.inventry.models import Asset, Vendor
+from apps.inventry.seed import seed_inventory
+from apps.inventry.snapshot import build_snapshot, np
+
+
+DEFAULT_SIZES = [10000, 100000]
+
+
+class Rollback(Exception):
+    pass
+
+
+def to_cents(groups):
+    # SQLite sums decimals as floating point; the snapshot sums exact cents.
+    cent = Decimal("0.01")
+    return [
+        {key: value.quantize(cent) if isinstance(value, Decimal) else value for key, value in group.items()}
+        for group in groups
+    ]
+
+
+def median_ms(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the grouped asset queries with the NumPy asset snapshot on seeded "
+        "inventories: build time, memory per asset and time per grouping. All "
+        "generated rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Asset counts to seed.",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement.")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if np is None:
+            raise CommandError("The asset snapshot requires NumPy (pip install numpy).")
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, options):
+        seeded = 0
+        for size in sorted(options["sizes"]):
+            seed_inventory(size - seeded, seed=options["seed"] + seeded)
+            seeded = size
+
+            start = time.perf_counter()
+            snapshot = build_snapshot(version=0)
+            build_ms = (time.perf_counter() - start) * 1000
+            vendor = Vendor.objects.order_by("id").first()
+
+            cases = {
+                "all": ({}, Asset.objects.all()),
+                "vendor": ({"vendor": vendor}, Asset.objects.filter(vendor=vendor)),
+                "remaining": ({"is_assign": False}, Asset.objects.filter(is_assign=False)),
+            }
+            self.stdout.write(
+                f"{len(snapshot):>8} assets: snapshot built in {build_ms:.0f} ms, "
+                f"{snapshot.nbytes / max(len(snapshot), 1):.1f} bytes/asset"
+            )
+            for name, (filters, queryset) in cases.items():
+                matches = to_cents(snapshot.asset_groups(**filters)) == to_cents(get_asset_groups(queryset))
+                query_ms = median_ms(lambda: get_asset_groups(queryset), options["repeat"])
+                snapshot_ms = median_ms(lambda: snapshot.asset_groups(**filters), options["repeat"])
+                self.stdout.write(
+                    f"    {name:<10} query {query_ms:8.2f} ms, snapshot {snapshot_ms:6.3f} ms, "
+                    f"speedup {query_ms / snapshot_ms:6.1f}x"
+                    + ("" if matches else "  RESULTS DIFFER")
+                )
@@ -0,0 +1,148 @@
+# Python Imports
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+
+# Django Imports
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.test.utils import override_settings
+
+# Project Imports
+from apps.inventry.aggregations import get_type_summary
+from apps.inventry.models import Asset
+from apps.inventry.seed import seed_inventory
+from apps.inventry.sqlite import atomic_write
+
+
+# SQLite's own defaults: rollback journal, full fsync, 5 s Python-level timeout
+# and Django's deferred BEGIN for writes too.
+DEFAULT_MODE = ({"journal_mode": "DELETE", "synchronous": "FULL"}, {}, False)
+DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+def run_worker(seed, duration, write_ratio, asset_ids, immediate, results):
+    """
+    Mix dashboard-style reads and single-asset writes until ``duration`` runs out.
+    """
+    rng = random.Random(seed)
+    atomic = atomic_write if immediate else transaction.atomic
+    writes = locked = 0
+    read_times = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if rng.random() < write_ratio:
+                with atomic():
+                    asset = Asset.objects.get(pk=rng.choice(asset_ids))
+                    asset.is_assign = not asset.is_assign
+                    asset.save()
+                writes += 1
+            else:
+                get_type_summary()
+                list(Asset.objects.select_related("asset_type", "vendor").order_by("-id")[:50])
+                read_times.append(time.perf_counter() - start)
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+    connections.close_all()
+    results.put((read_times, writes, locked))
+
+
+class Command(BaseCommand):
+    help = (
+        "Run concurrent reader/writer processes against a database with SQLite's default "
+        "settings and one with SQLITE_PRAGMAS applied, and compare their throughput."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+        parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run.")
+        parser.add_argument(
+            "--write-ratio", type=float, default=0.2, help="Share of operations that write.",
+        )
+        parser.add_argument("--assets", type=int, default=5000, help="Assets to seed.")
+
+    def handle(self, *args, **options):
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor != "sqlite":
+            self.stderr.write("This benchmark only applies to SQLite.")
+            return
+
+        original = dict(connection.settings_dict)
+        # Next to the real database, so both runs hit the production disk.
+        directory = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(original["NAME"])))
+        modes = {
+            "default": DEFAULT_MODE,
+            "tuned": (settings.SQLITE_PRAGMAS, original.get("OPTIONS", {}), True),
+        }
+        try:
+            results = {}
+            for mode, (pragmas, db_options, immediate) in modes.items():
+                with override_settings(
+                    SQLITE_PRAGMAS=pragmas, SQLITE_OPTIMIZE_INTERVAL=None, CACHES=DUMMY_CACHE
+                ):
+                    self.use_database(os.path.join(directory, f"{mode}.sqlite3"), db_options)
+                    call_command("migrate", verbosity=0)
+                    seed_inventory(options["assets"])
+                    asset_ids = list(Asset.objects.values_list("id", flat=True))
+                    connections.close_all()
+                    for workers in options["workers"]:
+                        results[mode, workers] = self.run(workers, asset_ids, immediate, options)
+        finally:
+            connection.close()
+            connection.settings_dict.clear()
+            connection.settings_dict.update(original)
+            shutil.rmtree(directory, ignore_errors=True)
+
+        for workers in options["workers"]:
+            default, tuned = results["default", workers], results["tuned", workers]
+            self.stdout.write(f"{workers:>3} workers: " + "; ".join(
+                f"{mode} {result['ops']:.1f} ops/s, read p95 {result['read_p95_ms']:.1f} ms, "
+                f"{result['locked']} locked"
+                for mode, result in (("default", default), ("tuned", tuned))
+            ) + f"; throughput {tuned['ops'] / max(default['ops'], 1e-9):.2f}x")
+
+    def use_database(self, path, db_options):
+        connection = connections[DEFAULT_DB_ALIAS]
+        connection.close()
+        connection.settings_dict["NAME"] = path
+        connection.settings_dict["OPTIONS"] = dict(db_options)
+
+    def run(self, workers, asset_ids, immediate, options):
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        processes = [
+            context.Process(
+                target=run_worker,
+                args=(
+                    index, options["duration"], options["write_ratio"], asset_ids, immediate,
+                    queue,
+                ),
+            )
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        read_times, writes, locked = [], 0, 0
+        for _ in processes:
+            worker_reads, worker_writes, worker_locked = queue.get()
+            read_times += worker_reads
+            writes += worker_writes
+            locked += worker_locked
+        for process in processes:
+            process.join()
+        read_times.sort()
+        return {
+            "writes": writes,
+            "locked": locked,
+            "ops": (len(read_times) + writes) / options["duration"],
+            "read_p95_ms": read_times[int(len(read_times) * 0.95)] * 1000 if read_times else 0,
+        }
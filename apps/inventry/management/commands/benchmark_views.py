@@ -0,0 +1,76 @@
+# Python Imports
+import json
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+# Project Imports
+from apps.inventry.benchmarks import (
+    DEFAULT_REPEAT, DEFAULT_SIZES, compare_reports, run_view_benchmarks,
+)
+
+
+DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic inventories in a throwaway test database and record wall time, "
+        "query count and peak memory for every inventory view as a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Asset counts to benchmark.",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=DEFAULT_REPEAT, help="Requests per view and size.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the data.")
+        parser.add_argument(
+            "--output", default="benchmark_report.json", help="Where to write the JSON report.",
+        )
+        parser.add_argument(
+            "--compare", metavar="REPORT",
+            help="Earlier report to compare against; regressions are listed after the run.",
+        )
+        parser.add_argument(
+            "--with-cache", action="store_true",
+            help="Keep the configured cache instead of measuring uncached views.",
+        )
+
+    def handle(self, *args, **options):
+        previous = None
+        if options["compare"]:
+            try:
+                with open(options["compare"]) as report_file:
+                    previous = json.load(report_file)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Cannot read {options['compare']}: {e}")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with override_settings(**({} if options["with_cache"] else {"CACHES": DUMMY_CACHE})):
+                report = run_view_benchmarks(
+                    sizes=options["sizes"],
+                    repeat=options["repeat"],
+                    seed=options["seed"],
+                    progress=self.stdout.write,
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        with open(options["output"], "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}."))
+
+        if previous is not None:
+            regressions = list(compare_reports(previous, report))
+            for line in regressions:
+                self.stdout.write(self.style.WARNING(line))
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS("No regressions against the earlier report."))
@@ -0,0 +1,48 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from apps.inventry.ledger import check_assignment_ledger, create_checkpoint, sync_assignment_ledger
+from apps.inventry.sqlite import atomic_write
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the holders recorded in the assignment ledger with live assignments and "
+        "append the missing events; optionally store a checkpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report the drift and fail if there is any.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            action="store_true",
+            help="Store a checkpoint of the holdings after the last event.",
+        )
+
+    def handle(self, *args, **options):
+        drift = check_assignment_ledger()
+        for subject, subject_id, recorded, live in drift:
+            self.stdout.write(f"{subject} {subject_id}: recorded holder {recorded} != live {live}")
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("The assignment ledger matches live data."))
+        elif options["check"]:
+            raise CommandError(f"{len(drift)} holders differ from the assignment ledger.")
+        else:
+            with atomic_write():
+                appended = sync_assignment_ledger()
+            self.stdout.write(self.style.SUCCESS(f"Appended {appended} events."))
+
+        if options["checkpoint"]:
+            checkpoint = create_checkpoint()
+            if checkpoint is None:
+                self.stdout.write("The latest checkpoint is up to date.")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Stored {checkpoint}."))
@@ -0,0 +1,36 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from apps.inventry.cache import invalidate_inventory_cache
+from apps.inventry.holdings import check_employee_holdings, refresh_employee_holdings
+from apps.inventry.sqlite import atomic_write
+
+
+class Command(BaseCommand):
+    help = "Compare the employee holdings counters with live assignments and fix any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report the drift and fail if there is any.",
+        )
+
+    def handle(self, *args, **options):
+        drift = check_employee_holdings()
+        for employee_id, stored, live in drift:
+            self.stdout.write(f"employee {employee_id}: stored {stored} != live {live}")
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Employee holdings match live data."))
+            return
+        if options["check"]:
+            raise CommandError(f"{len(drift)} employees have drifted holdings.")
+
+        with atomic_write():
+            fixed = refresh_employee_holdings(employee_id for employee_id, _, _ in drift)
+        invalidate_inventory_cache()
+        self.stdout.write(self.style.SUCCESS(f"Fixed the holdings of {fixed} employees."))
@@ -0,0 +1,51 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from apps.inventry.importers import DEFAULT_CHUNK_SIZE, import_assets
+
+
+class Command(BaseCommand):
+    help = "Bulk import assets from a CSV or XLSX file, matching existing assets by serial number."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to a .csv or .xlsx file.")
+        parser.add_argument(
+            "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+            help="Rows validated and written per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Validate and report the changes without writing anything.",
+        )
+        parser.add_argument(
+            "--create-asset-types", action="store_true",
+            help="Create asset types that do not exist yet instead of rejecting the row.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        try:
+            if path.lower().endswith(".xlsx"):
+                file_obj = open(path, "rb")
+            else:
+                file_obj = open(path, newline="", encoding="utf-8-sig")
+        except OSError as e:
+            raise CommandError(e)
+
+        with file_obj:
+            report = import_assets(
+                file_obj, path,
+                chunk_size=options["chunk_size"],
+                dry_run=options["dry_run"],
+                create_asset_types=options["create_asset_types"],
+            )
+
+        for row_number, serial_number, changes in report.changes:
+            for field, (current, new) in changes.items():
+                self.stdout.write(f"row {row_number} [{serial_number}] {field}: {current!r} -> {new!r}")
+        for row_number, error in report.errors:
+            self.stderr.write(f"row {row_number}: {error}")
+        self.stdout.write(self.style.SUCCESS(report.summary()))
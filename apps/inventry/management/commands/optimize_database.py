@@ -0,0 +1,30 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# Project Imports
+from apps.inventry.sqlite import optimize_database
+
+
+class Command(BaseCommand):
+    help = "Refresh SQLite planner statistics (ANALYZE, PRAGMA optimize) and checkpoint the WAL."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full", action="store_true",
+            help="Analyze every row instead of a sample of each index.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("optimize_database only supports SQLite.")
+        connection.ensure_connection()
+        optimize_database(connection, analysis_limit=0 if options["full"] else 1000)
+        busy, log_frames, checkpointed = connection.connection.execute(
+            "PRAGMA wal_checkpoint(TRUNCATE)"
+        ).fetchone()
+        self.stdout.write(self.style.SUCCESS(
+            f"Statistics refreshed; checkpointed {checkpointed} of {log_frames} WAL frames."
+        ))
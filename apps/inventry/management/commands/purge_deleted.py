@@ -0,0 +1,44 @@
+# Python Imports
+from datetime import timedelta
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+# Project Imports
+from apps.inventry.services import SOFT_DELETE_MODELS, purge_deleted
+
+
+class Command(BaseCommand):
+    help = (
+        "Permanently remove assets, client assets, employees and vendors that were "
+        "soft-deleted more than SOFT_DELETE_RETENTION_DAYS days ago. Run it periodically (cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=getattr(settings, "SOFT_DELETE_RETENTION_DAYS", 90),
+            help="Purge rows deleted more than this many days ago.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only count the rows that would be purged.",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative.")
+        before = timezone.now() - timedelta(days=options["days"])
+        if options["dry_run"]:
+            counts = {
+                model._meta.label: model.all_objects.dead().filter(deleted_at__lt=before).count()
+                for model in SOFT_DELETE_MODELS
+            }
+        else:
+            counts = purge_deleted(before)
+        for label, count in counts.items():
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Would purge' if options['dry_run'] else 'Purged'} {sum(counts.values())} rows "
+            f"deleted before {before:%Y-%m-%d %H:%M}."
+        ))
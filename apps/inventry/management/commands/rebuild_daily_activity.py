@@ -0,0 +1,36 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from apps.inventry.cache import invalidate_inventory_cache
+from apps.inventry.rollups import check_daily_activity, rebuild_daily_activity
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the daily activity rollups from the assignment ledger and live assets, "
+        "or check them for drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare the rollups with the ledger and assets and fail if they differ.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            drift = check_daily_activity()
+            for key, stored, live in sorted(drift, key=lambda row: (row[0][0], row[0][1] or 0)):
+                self.stdout.write(f"{key}: stored {stored} != live {live}")
+            if drift:
+                raise CommandError(f"{len(drift)} daily activity rows have drifted.")
+            self.stdout.write(self.style.SUCCESS("Daily activity matches the ledger and assets."))
+            return
+
+        rows = rebuild_daily_activity()
+        invalidate_inventory_cache()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily activity rows."))
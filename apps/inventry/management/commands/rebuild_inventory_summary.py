@@ -0,0 +1,34 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from apps.inventry.cache import invalidate_inventory_cache
+from apps.inventry.summary import check_inventory_summary, rebuild_inventory_summary
+
+
+class Command(BaseCommand):
+    help = "Rebuild the inventory summary table from live asset data, or check it for drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare the summary with live data and fail if they differ.",
+        )
+
+    def handle(self, *args, **options):
+        drift = check_inventory_summary()
+        for key, stored, live in drift:
+            self.stdout.write(f"{key}: stored {stored} != live {live}")
+
+        if options["check"]:
+            if drift:
+                raise CommandError(f"{len(drift)} inventory summary rows have drifted.")
+            self.stdout.write(self.style.SUCCESS("Inventory summary matches live data."))
+            return
+
+        rows = rebuild_inventory_summary()
+        invalidate_inventory_cache()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} inventory summary rows."))
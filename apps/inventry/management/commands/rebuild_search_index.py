@@ -0,0 +1,33 @@
+# Python Imports
+import time
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Project Imports
+from apps.inventry.search import ENTITIES, is_enabled, rebuild_search_index
+from apps.inventry.sqlite import atomic_write
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from live data."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entity",
+            nargs="+",
+            choices=list(ENTITIES),
+            help="Only rebuild these entities (default: all).",
+        )
+
+    def handle(self, *args, **options):
+        if not is_enabled():
+            raise CommandError("Full-text search requires the SQLite backend.")
+        start = time.perf_counter()
+        with atomic_write():
+            counts = rebuild_search_index(options["entity"])
+        for entity, count in counts.items():
+            self.stdout.write(f"{entity}: {count} documents")
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt the search index in {time.perf_counter() - start:.1f}s."
+        ))
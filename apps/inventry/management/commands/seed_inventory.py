@@ -0,0 +1,36 @@
+# Python Imports
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Project Imports
+from apps.inventry.seed import flush_inventory, seed_inventory
+
+
+class Command(BaseCommand):
+    help = "Deterministically generate a synthetic inventory of realistic shape."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--assets", type=int, default=1000, help="Number of assets.")
+        parser.add_argument("--asset-types", type=int, help="Number of asset types (at most 10).")
+        parser.add_argument("--vendors", type=int, help="Number of vendors.")
+        parser.add_argument("--employees", type=int, help="Number of employees.")
+        parser.add_argument("--client-assets", type=int, help="Number of client assets.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+        parser.add_argument(
+            "--flush", action="store_true",
+            help="Delete all existing inventory rows (not users) before seeding.",
+        )
+
+    def handle(self, *args, **options):
+        if options["flush"]:
+            flush_inventory()
+        counts = {
+            name: options[name]
+            for name in ("asset_types", "vendors", "employees", "client_assets")
+            if options[name] is not None
+        }
+        created = seed_inventory(options["assets"], seed=options["seed"], **counts)
+        self.stdout.write(self.style.SUCCESS(
+            "Created " + ", ".join(f"{count} {name.replace('_', ' ')}" for name, count in created.items()) + "."
+        ))
@@ -0,0 +1,124 @@
+"""
+Prometheus metrics.
+
+``MetricsMiddleware`` (see ``middleware.py``) records request latency,
+response size and SQL query count labelled by URL name, and per-worker
+request counters; ``cache.py`` counts inventory cache hits and misses.
+``metrics_view`` serves them in the Prometheus text format.
+
+Under gunicorn, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory shared
+by the workers (``gunicorn.conf.py`` clears it on start and marks exited
+workers dead), so every worker writes its samples there and the endpoint
+aggregates them whichever worker serves the scrape. Without it, the metrics of
+the current process are served.
+
+Behind a reverse proxy every request arrives from the proxy's address, so the
+endpoint is protected by a bearer token: scrapes send ``Authorization: Bearer
+<METRICS_TOKEN>`` (``authorization`` in the Prometheus scrape config).
+``METRICS_ALLOWED_IPS`` additionally admits scrapers by ``REMOTE_ADDR`` and is
+only meaningful when clients connect to the application server directly.
+
+Dashboard p99 alert and cache hit ratio, for example::
+
+    histogram_quantile(0.99, sum by (le) (
+        rate(inventory_request_latency_seconds_bucket{url_name="dashboard"}[5m])))
+    sum(rate(inventory_cache_lookups_total{result="hit"}[5m]))
+        / sum(rate(inventory_cache_lookups_total[5m]))
+"""
+
+# Python Imports
+import os
+import secrets
+
+# Django Imports
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+# Project Imports
+
+# Third Party Imports
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    generate_latest, multiprocess,
+)
+
+
+LABELS = ("url_name", "method")
+
+REQUEST_LATENCY = Histogram(
+    "inventory_request_latency_seconds",
+    "Request latency by URL name.",
+    LABELS,
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+RESPONSE_SIZE = Histogram(
+    "inventory_response_size_bytes",
+    "Response body size by URL name (streaming responses are not measured).",
+    LABELS,
+    buckets=(1024, 8192, 32768, 131072, 524288, 2097152, 8388608),
+)
+REQUEST_QUERIES = Histogram(
+    "inventory_request_queries",
+    "SQL queries per request by URL name.",
+    LABELS,
+    buckets=(1, 2, 5, 10, 20, 50, 100, 500, 1000),
+)
+REQUESTS = Counter(
+    "inventory_requests",
+    "Requests by URL name, method and status code.",
+    LABELS + ("status",),
+)
+WORKER_REQUESTS = Counter(
+    "inventory_worker_requests",
+    "Requests handled by each worker process.",
+    ("worker",),
+)
+CACHE_LOOKUPS = Counter(
+    "inventory_cache_lookups",
+    "Inventory cache lookups by result.",
+    ("result",),
+)
+WORKER_IN_FLIGHT = Gauge(
+    "inventory_worker_requests_in_flight",
+    "Requests currently being handled by each worker process.",
+    multiprocess_mode="all",
+)
+
+
+class _DefaultCollector:
+    """
+    Expose the process-local default registry through another registry.
+    """
+
+    def collect(self):
+        return REGISTRY.collect()
+
+
+def get_registry():
+    registry = CollectorRegistry()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(_DefaultCollector())
+    return registry
+
+
+def is_scraper(request) -> bool:
+    """
+    Return whether the request carries ``METRICS_TOKEN`` or comes from ``METRICS_ALLOWED_IPS``.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token:
+        authorization = request.META.get("HTTP_AUTHORIZATION", "")
+        if secrets.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+            return True
+    return request.META.get("REMOTE_ADDR") in getattr(settings, "METRICS_ALLOWED_IPS", ())
+
+
+def metrics_view(request):
+    """
+    Serve all metrics in the Prometheus text format to authorized scrapers.
+    """
+    if not is_scraper(request):
+        return HttpResponseForbidden()
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,224 @@
+"""
+Request profiling and metrics middleware.
+
+When ``PROFILING_ENABLED`` is set, a ``PROFILING_SAMPLE_RATE`` share of
+requests is profiled: every SQL statement is timed through a connection
+``execute_wrapper`` together with the project frame that issued it, and
+template rendering is timed by the project's template backend (see
+``backends/templates.py``). The
+totals are sent back in a ``Server-Timing`` header and one JSON line per
+request, with the slowest statements and repeated queries, is written to the
+``apps.inventry.profiling`` logger (a rotating file, see ``LOGGING`` in
+settings). Requests that are not sampled pay nothing beyond one random draw.
+
+``MetricsMiddleware`` feeds the Prometheus metrics defined in ``metrics.py``.
+"""
+
+# Python Imports
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+# Django Imports
+from django.conf import settings
+from django.db import connections
+
+# Project Imports
+from .metrics import (
+    REQUEST_LATENCY, REQUEST_QUERIES, REQUESTS, RESPONSE_SIZE, WORKER_IN_FLIGHT,
+    WORKER_REQUESTS,
+)
+
+
+logger = logging.getLogger("apps.inventry.profiling")
+
+_current_profile = ContextVar("inventory_profile", default=None)
+
+def get_current_profile():
+    """
+    Return the ``RequestProfile`` of the request being profiled, if any.
+    """
+    return _current_profile.get()
+
+
+def _call_site():
+    """
+    Return ``path:line in function`` for the innermost project frame outside this module.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(str(settings.BASE_DIR))
+            and filename != __file__
+            and "site-packages" not in filename
+        ):
+            path = os.path.relpath(filename, settings.BASE_DIR)
+            return f"{path}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class RequestProfile:
+    """
+    Collects the SQL statements and template time of one request.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.template_time = 0.0
+        self.rendering = False
+        self.view = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                "sql": sql,
+                "params": repr(params),
+                "duration": time.perf_counter() - start,
+                "call_site": _call_site(),
+            })
+
+    @property
+    def db_time(self):
+        return sum(query["duration"] for query in self.queries)
+
+    def slowest(self, count):
+        slowest = sorted(self.queries, key=lambda query: -query["duration"])[:count]
+        return [
+            {
+                "sql": query["sql"],
+                "params": query["params"],
+                "duration_ms": round(query["duration"] * 1000, 3),
+                "call_site": query["call_site"],
+            }
+            for query in slowest
+        ]
+
+    def repeated(self):
+        """
+        Return exact duplicates (same SQL and parameters) and similar statements
+        (same SQL, different parameters, the usual N+1 signature) run more than once.
+        """
+        exact = Counter((query["sql"], query["params"]) for query in self.queries)
+        similar = Counter(query["sql"] for query in self.queries)
+        call_sites = {}
+        for query in self.queries:
+            call_sites.setdefault(query["sql"], query["call_site"])
+        return {
+            "duplicates": [
+                {"sql": sql, "params": params, "count": count, "call_site": call_sites[sql]}
+                for (sql, params), count in exact.most_common()
+                if count > 1
+            ],
+            "similar": [
+                {"sql": sql, "count": count, "call_site": call_sites[sql]}
+                for sql, count in similar.most_common()
+                if count > 1
+            ],
+        }
+
+
+class ProfilingMiddleware:
+    """
+    Profile a sample of requests and report SQL and template timings.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            return self.get_response(request)
+        if random.random() >= getattr(settings, "PROFILING_SAMPLE_RATE", 1.0):
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        request._profile = profile
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        total_time = time.perf_counter() - start
+
+        db_time = profile.db_time
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={db_time * 1000:.1f};desc="{len(profile.queries)} queries"',
+            f"tpl;dur={profile.template_time * 1000:.1f}",
+            f"total;dur={total_time * 1000:.1f}",
+        ])
+        logger.info(json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "view": profile.view,
+            "status": response.status_code,
+            "total_ms": round(total_time * 1000, 3),
+            "db_ms": round(db_time * 1000, 3),
+            "template_ms": round(profile.template_time * 1000, 3),
+            "queries": len(profile.queries),
+            "slowest": profile.slowest(getattr(settings, "PROFILING_SLOW_QUERY_COUNT", 5)),
+            **profile.repeated(),
+        }, default=str))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = getattr(request, "_profile", None)
+        if profile is not None:
+            view = getattr(view_func, "view_class", view_func)
+            profile.view = f"{view.__module__}.{view.__qualname__}"
+
+
+class QueryCounter:
+    """
+    ``execute_wrapper`` that only counts statements.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """
+    Record latency, response size and query count per URL name for Prometheus.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.worker = str(os.getpid())
+
+    def __call__(self, request):
+        queries = QueryCounter()
+        start = time.perf_counter()
+        with WORKER_IN_FLIGHT.track_inprogress(), ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(queries))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = request.resolver_match
+        labels = (match.url_name or match.view_name if match else "<unresolved>", request.method)
+        REQUEST_LATENCY.labels(*labels).observe(elapsed)
+        REQUEST_QUERIES.labels(*labels).observe(queries.count)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(*labels).observe(len(response.content))
+        REQUESTS.labels(*labels, response.status_code).inc()
+        WORKER_REQUESTS.labels(self.worker).inc()
+        return response
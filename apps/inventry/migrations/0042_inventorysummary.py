@@ -0,0 +1,62 @@
+# Generated by Django 3.2.11 on 2026-10-18 01:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Q, Sum
+
+
+def populate_inventory_summary(apps, schema_editor):
+    Asset = apps.get_model('inventry', 'Asset')
+    InventorySummary = apps.get_model('inventry', 'InventorySummary')
+    assigned = Q(is_assign=True)
+    rows = (
+        Asset.objects.order_by()
+        .values('asset_type_id', 'asset_brand', 'vendor_id')
+        .annotate(
+            count=Count('id'),
+            assigned_count=Count('id', filter=assigned),
+            price_sum=Sum('price'),
+            assigned_price_sum=Sum('price', filter=assigned),
+        )
+    )
+    InventorySummary.objects.bulk_create(
+        InventorySummary(
+            asset_type_id=row['asset_type_id'],
+            asset_brand=row['asset_brand'],
+            vendor_id=row['vendor_id'],
+            count=row['count'],
+            assigned_count=row['assigned_count'],
+            price_sum=row['price_sum'] or 0,
+            assigned_price_sum=row['assigned_price_sum'] or 0,
+        )
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0041_remove_vendor_vendor_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventorySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asset_brand', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('assigned_count', models.IntegerField(default=0)),
+                ('price_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('assigned_price_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('asset_type', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='inventory_summary', to='inventry.assettype')),
+                ('vendor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='inventory_summary', to='inventry.vendor')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='inventorysummary',
+            constraint=models.UniqueConstraint(fields=('asset_type', 'asset_brand', 'vendor'), name='unique_inventory_summary_key'),
+        ),
+        migrations.RunPython(populate_inventory_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 3.2.11 on 2026-10-18 01:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0042_inventorysummary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['asset_type', 'asset_brand'], name='asset_type_brand_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['asset_brand'], name='asset_brand_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['vendor', 'is_assign'], name='asset_vendor_assign_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['payment_status'], name='asset_payment_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(condition=models.Q(('is_assign', False)), fields=['asset_type', 'asset_brand'], name='asset_remaining_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignasset',
+            index=models.Index(fields=['created_at'], name='assignasset_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientasset',
+            index=models.Index(condition=models.Q(('is_dispatch', False)), fields=['employee'], name='clientasset_held_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientasset',
+            index=models.Index(condition=models.Q(('is_dispatch', True)), fields=['date_of_dispatch'], name='clientasset_dispatched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['id'], name='employee_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['created_at'], name='vendor_active_created_idx'),
+        ),
+    ]
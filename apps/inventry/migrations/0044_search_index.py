@@ -0,0 +1,82 @@
+# Generated by Django 3.2.11 on 2026-10-18 03:12
+
+from django.db import migrations
+
+
+CREATE_SEARCH_INDEX = """
+CREATE VIRTUAL TABLE inventry_search USING fts5(
+    entity UNINDEXED,
+    title,
+    body,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+# Title matches weigh five times more than body matches; entity carries no text.
+SET_RANK = "INSERT INTO inventry_search (inventry_search, rank) VALUES ('rank', 'bm25(0, 5.0, 1.0)')"
+
+
+def _words(*columns):
+    return "trim(" + " || ' ' || ".join(f"coalesce({column}, '')" for column in columns) + ")"
+
+
+POPULATE_SEARCH_INDEX = [
+    f"""
+    INSERT INTO inventry_search (rowid, entity, title, body)
+    SELECT a.id * 4, 'asset',
+           {_words('t.asset_name', 'a.asset_brand')},
+           {_words('a.serial_number', 'a.invoice_number', 'a.system_configuration', 'v.first_name', 'v.last_name')}
+    FROM inventry_asset a
+    LEFT JOIN inventry_assettype t ON t.id = a.asset_type_id
+    LEFT JOIN inventry_vendor v ON v.id = a.vendor_id
+    """,
+    f"""
+    INSERT INTO inventry_search (rowid, entity, title, body)
+    SELECT id * 4 + 1, 'employee',
+           {_words('first_name', 'last_name')},
+           {_words('employee_id', 'email', 'technology_name')}
+    FROM inventry_employee
+    """,
+    f"""
+    INSERT INTO inventry_search (rowid, entity, title, body)
+    SELECT id * 4 + 2, 'vendor',
+           {_words('first_name', 'last_name')},
+           {_words('email', 'address')}
+    FROM inventry_vendor
+    """,
+    f"""
+    INSERT INTO inventry_search (rowid, entity, title, body)
+    SELECT c.id * 4 + 3, 'client_asset',
+           {_words('c.client_name', 'c.project')},
+           {_words('c.project_owner', 'c.asset_brand', 't.asset_name', 'c.serial_number')}
+    FROM inventry_clientasset c
+    LEFT JOIN inventry_assettype t ON t.id = c.asset_type_id
+    """,
+]
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 is SQLite-only; search.py turns itself off on other backends.
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(CREATE_SEARCH_INDEX)
+    schema_editor.execute(SET_RANK)
+    for statement in POPULATE_SEARCH_INDEX:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS inventry_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0043_hot_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,140 @@
+# Generated by Django 3.2.11 on 2026-10-18 02:28
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_inactive_deleted(apps, schema_editor):
+    # deleted_at was auto_now and only held the last save time.
+    for name in ('Asset', 'AssignAsset', 'ClientAsset', 'Employee', 'Vendor'):
+        apps.get_model('inventry', name).objects.update(deleted_at=None)
+    # Inactive employees and vendors were hidden from every list: they become the deleted ones.
+    for name, search_code in (('Employee', 1), ('Vendor', 2)):
+        model = apps.get_model('inventry', name)
+        inactive = model.objects.filter(is_active=False)
+        inactive.update(deleted_at=F('modified_at'))
+        if schema_editor.connection.vendor == 'sqlite':
+            with schema_editor.connection.cursor() as cursor:
+                cursor.executemany(
+                    'DELETE FROM inventry_search WHERE rowid = %s',
+                    [(pk * 4 + search_code,) for pk in inactive.values_list('id', flat=True)],
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0044_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='asset',
+            name='asset_remaining_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='clientasset',
+            name='clientasset_held_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='clientasset',
+            name='clientasset_dispatched_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='employee',
+            name='employee_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vendor',
+            name='vendor_active_created_idx',
+        ),
+        migrations.AlterField(
+            model_name='asset',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='assignasset',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='clientasset',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='email',
+            field=models.EmailField(blank=True, db_index=True, max_length=30, null=True),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='employee_id',
+            field=models.CharField(blank=True, max_length=30, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vendor',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='vendor',
+            name='email',
+            field=models.EmailField(blank=True, max_length=30, null=True),
+        ),
+        migrations.RunPython(mark_inactive_deleted, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_assign', False)), fields=['asset_type', 'asset_brand'], name='asset_remaining_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', False)), fields=['deleted_at'], name='asset_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientasset',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_dispatch', False)), fields=['employee'], name='clientasset_held_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientasset',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('is_dispatch', True)), fields=['date_of_dispatch'], name='clientasset_dispatched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientasset',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', False)), fields=['deleted_at'], name='clientasset_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['id'], name='employee_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', False)), fields=['deleted_at'], name='employee_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at'], name='vendor_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', False)), fields=['deleted_at'], name='vendor_deleted_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='employee',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('email',), name='unique_live_employee_email'),
+        ),
+        migrations.AddConstraint(
+            model_name='employee',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('employee_id',), name='unique_live_employee_id'),
+        ),
+        migrations.AddConstraint(
+            model_name='vendor',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('email',), name='unique_live_vendor_email'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 3.2.11 on 2026-10-18 02:31
+
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_employee_holdings(apps, schema_editor):
+    AssignAsset = apps.get_model('inventry', 'AssignAsset')
+    ClientAsset = apps.get_model('inventry', 'ClientAsset')
+    Employee = apps.get_model('inventry', 'Employee')
+    held = AssignAsset.objects.filter(
+        employee=OuterRef('pk'), asset__isnull=False, asset__deleted_at__isnull=True
+    )
+    held_clients = ClientAsset.objects.filter(
+        employee=OuterRef('pk'), is_dispatch=False, deleted_at__isnull=True
+    )
+
+    def grouped(queryset, aggregate):
+        return Subquery(queryset.order_by().values('employee').annotate(total=aggregate).values('total'))
+
+    Employee.objects.update(
+        assets_held=Coalesce(grouped(held, Count('id')), 0),
+        held_value=Coalesce(
+            grouped(held, Sum('asset__price')), Value(0),
+            output_field=models.DecimalField(max_digits=14, decimal_places=2),
+        ),
+        client_assets_held=Coalesce(grouped(held_clients, Count('id')), 0),
+        is_have_asset=Exists(held),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0045_soft_delete'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='assets_held',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='client_assets_held',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='held_value',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.RunPython(populate_employee_holdings, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['assets_held'], name='employee_assets_held_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['held_value'], name='employee_held_value_idx'),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 3.2.11 on 2026-10-18 02:53
+
+from datetime import datetime, time, timezone
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def _start_of(day):
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def record_opening_balance(apps, schema_editor):
+    # Earlier changes were never recorded: start the ledger from what is held
+    # now, dated with the assignment and dispatch dates.
+    AssignAsset = apps.get_model('inventry', 'AssignAsset')
+    AssignmentEvent = apps.get_model('inventry', 'AssignmentEvent')
+    ClientAsset = apps.get_model('inventry', 'ClientAsset')
+    events = []
+    for asset_id, employee_id, date_of_assign, created_at in AssignAsset.objects.filter(
+        asset__isnull=False, asset__deleted_at__isnull=True, employee__isnull=False
+    ).values_list('asset_id', 'employee_id', 'date_of_assign', 'created_at'):
+        events.append(AssignmentEvent(
+            kind='assign', asset_id=asset_id, employee_id=employee_id,
+            recorded_at=_start_of(date_of_assign or created_at), effective_on=date_of_assign,
+        ))
+    for client_asset in ClientAsset.objects.filter(
+        employee__isnull=False, deleted_at__isnull=True
+    ).only('id', 'employee_id', 'is_dispatch', 'date_of_dispatch', 'created_at', 'modified_at'):
+        events.append(AssignmentEvent(
+            kind='assign', client_asset_id=client_asset.id, employee_id=client_asset.employee_id,
+            recorded_at=_start_of(client_asset.created_at),
+        ))
+        if client_asset.is_dispatch:
+            dispatched = client_asset.date_of_dispatch
+            events.append(AssignmentEvent(
+                kind='dispatch', client_asset_id=client_asset.id,
+                previous_employee_id=client_asset.employee_id,
+                recorded_at=max(
+                    _start_of(dispatched) if dispatched else client_asset.modified_at,
+                    _start_of(client_asset.created_at),
+                ),
+                effective_on=dispatched,
+            ))
+    events.sort(key=lambda event: event.recorded_at)
+    AssignmentEvent.objects.bulk_create(events, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0046_employee_holdings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssignmentCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_event', models.PositiveBigIntegerField(unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('holdings', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AssignmentEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('assign', 'Assign'), ('reassign', 'Reassign'), ('release', 'Release'), ('dispatch', 'Dispatch')], max_length=10)),
+                ('recorded_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('effective_on', models.DateField(blank=True, null=True)),
+                ('asset', models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='assignment_events', to='inventry.asset')),
+                ('client_asset', models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='assignment_events', to='inventry.clientasset')),
+                ('employee', models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='inventry.employee')),
+                ('previous_employee', models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='inventry.employee')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AssignmentCheckpointHolding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asset', models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='inventry.asset')),
+                ('checkpoint', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='holding_rows', to='inventry.assignmentcheckpoint')),
+                ('client_asset', models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='inventry.clientasset')),
+                ('employee', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='inventry.employee')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='assignmentevent',
+            index=models.Index(fields=['recorded_at'], name='assignmentevent_recorded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentevent',
+            index=models.Index(condition=models.Q(('asset__isnull', False)), fields=['asset', 'id'], name='assignmentevent_asset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentevent',
+            index=models.Index(condition=models.Q(('client_asset__isnull', False)), fields=['client_asset', 'id'], name='assignmentevent_client_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentevent',
+            index=models.Index(fields=['employee', 'id'], name='assignmentevent_employee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentevent',
+            index=models.Index(fields=['previous_employee', 'id'], name='assignmentevent_previous_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='assignmentevent',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('asset__isnull', False), ('client_asset__isnull', True)), models.Q(('asset__isnull', True), ('client_asset__isnull', False)), _connector='OR'), name='assignmentevent_one_subject'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentcheckpointholding',
+            index=models.Index(fields=['checkpoint', 'employee'], name='checkpoint_employee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentcheckpointholding',
+            index=models.Index(fields=['checkpoint', 'asset'], name='checkpoint_asset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentcheckpointholding',
+            index=models.Index(fields=['checkpoint', 'client_asset'], name='checkpoint_client_idx'),
+        ),
+        migrations.RunPython(record_opening_balance, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 3.2.11 on 2026-10-18 03:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+
+
+def record_event_asset_types(apps, schema_editor):
+    Asset = apps.get_model('inventry', 'Asset')
+    AssignmentEvent = apps.get_model('inventry', 'AssignmentEvent')
+    ClientAsset = apps.get_model('inventry', 'ClientAsset')
+    for subject, model in (('asset', Asset), ('client_asset', ClientAsset)):
+        AssignmentEvent.objects.filter(**{f'{subject}__isnull': False}).update(
+            asset_type_id=Subquery(
+                model.objects.filter(pk=OuterRef(f'{subject}_id')).values('asset_type_id')[:1]
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0047_assignment_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignmentevent',
+            name='asset_type',
+            field=models.ForeignKey(db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='inventry.assettype'),
+        ),
+        migrations.CreateModel(
+            name='DailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('assignments', models.PositiveIntegerField(default=0)),
+                ('releases', models.PositiveIntegerField(default=0)),
+                ('dispatches', models.PositiveIntegerField(default=0)),
+                ('purchases', models.PositiveIntegerField(default=0)),
+                ('spend', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('asset_type', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_activity', to='inventry.assettype')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='dailyactivity',
+            constraint=models.UniqueConstraint(fields=('day', 'asset_type'), name='unique_daily_activity_key'),
+        ),
+        migrations.RunPython(record_event_asset_types, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 3.2.11 on 2026-10-18 03:06
+
+import apps.inventry.models
+from django.db import migrations, models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Concat, Trim
+
+
+SPEC_FIELDS = ('ram', 'ssd', 'processor', 'operating_system', 'storage')
+CONFIGURATION_FIELDS = {'asset': 'system_configuration', 'clientasset': 'configuration'}
+
+
+def _spec_codes(model, field):
+    choices = model._meta.get_field(field).choices
+    return {value: str(code) for code, (value, _) in enumerate(choices, start=1)}
+
+
+def encode_specs(apps, schema_editor):
+    # Values outside the choices were never offered by a form or the importer;
+    # keep them in the free-text configuration rather than dropping them.
+    for model_name, configuration in CONFIGURATION_FIELDS.items():
+        model = apps.get_model('inventry', model_name)
+        for field in SPEC_FIELDS:
+            codes = _spec_codes(model, field)
+            unknown = model._base_manager.exclude(
+                Q(**{f'{field}__in': [*codes, '']}) | Q(**{f'{field}__isnull': True})
+            )
+            unknown.update(**{configuration: Trim(Concat(
+                F(configuration), Value(' '), F(field), output_field=models.CharField()
+            ))})
+            model._base_manager.update(**{field: Case(
+                *[When(**{field: value}, then=Value(code)) for value, code in codes.items()],
+                default=Value('0'),
+            )})
+
+
+def decode_specs(apps, schema_editor):
+    for model_name in CONFIGURATION_FIELDS:
+        model = apps.get_model('inventry', model_name)
+        for field in SPEC_FIELDS:
+            codes = _spec_codes(model, field)
+            model._base_manager.update(**{field: Case(
+                *[When(**{field: code}, then=Value(value)) for value, code in codes.items()],
+                default=Value(''),
+            )})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventry', '0048_daily_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode_specs, decode_specs),
+        migrations.AlterField(
+            model_name='asset',
+            name='operating_system',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('UBUNTU', 'ubuntu'), ('MAC OS', 'mac os'), ('WINDOW', 'window'), ('HACKINTOSH', 'hackintosh')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='asset',
+            name='processor',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('i3', 'i3'), ('i5', 'i5'), ('i7', 'i7'), ('i9', 'i9'), ('i10', 'i10')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='asset',
+            name='ram',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('4GB', '4GB'), ('6GB', '6GB'), ('8GB', '8GB'), ('16GB', '16GB'), ('32GB', '32GB'), ('64GB', '64GB')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='asset',
+            name='ssd',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('120', '120'), ('250', '250'), ('256', '256'), ('500', '500')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='asset',
+            name='storage',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('16', '16'), ('32', '32'), ('64', '64'), ('128', '128'), ('256', '256'), ('512', '512')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='clientasset',
+            name='operating_system',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('UBUNTU', 'ubuntu'), ('MAC OS', 'mac os'), ('WINDOW', 'window'), ('HACKINTOSH', 'hackintosh')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='clientasset',
+            name='processor',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('i3', 'i3'), ('i5', 'i5'), ('i7', 'i7'), ('i9', 'i9'), ('i10', 'i10')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='clientasset',
+            name='ram',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('4GB', '4GB'), ('6GB', '6GB'), ('8GB', '8GB'), ('16GB', '16GB'), ('32GB', '32GB'), ('64GB', '64GB')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='clientasset',
+            name='ssd',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('120', '120'), ('250', '250'), ('256', '256'), ('500', '500')], default=''),
+        ),
+        migrations.AlterField(
+            model_name='clientasset',
+            name='storage',
+            field=apps.inventry.models.SpecField(blank=True, choices=[('16', '16'), ('32', '32'), ('64', '64'), ('128', '128'), ('256', '256'), ('512', '512')], default=''),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['is_assign', 'asset_type', 'ram', 'processor', 'operating_system', 'ssd', 'storage', 'asset_brand'], name='asset_spec_idx'),
+        ),
+    ]
@@ -2,11 +2,16 @@
 import datetime
 
 # Django Imports
+from django.core import exceptions
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.dispatch import Signal
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
 # Project Imports
+from .sqlite import atomic_write
 
 # Third Party Imports
 
@@ -35,6 +40,99 @@ TECHNOLOGY_CHOICES = (
 )
 
 
+# Hardware specs of assets and client assets, shared by the models, forms and importer.
+RAM_CHOICES = (
+    ("4GB", "4GB"),
+    ("6GB", "6GB"),
+    ("8GB", "8GB"),
+    ("16GB", "16GB"),
+    ("32GB", "32GB"),
+    ("64GB", "64GB"),
+)
+SSD_CHOICES = (
+    ("120", "120"),
+    ("250", "250"),
+    ("256", "256"),
+    ("500", "500"),
+)
+PROCESSOR_CHOICES = (
+    ("i3", "i3"),
+    ("i5", "i5"),
+    ("i7", "i7"),
+    ("i9", "i9"),
+    ("i10", "i10"),
+)
+OS_CHOICES = (
+    ("UBUNTU", "ubuntu"),
+    ("MAC OS", "mac os"),
+    ("WINDOW", "window"),
+    ("HACKINTOSH", "hackintosh"),
+)
+STORAGE_CHOICES = (
+    ("16", "16"),
+    ("32", "32"),
+    ("64", "64"),
+    ("128", "128"),
+    ("256", "256"),
+    ("512", "512"),
+)
+SPEC_FIELDS = ("ram", "ssd", "processor", "operating_system", "storage")
+
+
+class SpecField(models.PositiveSmallIntegerField):
+    """
+    A hardware spec stored as a small integer code.
+
+    The column holds the 1-based position of the value in ``choices`` (0 when
+    blank), so spec columns are two bytes wide and index compactly. Python
+    code, forms, templates and querysets keep using the choice values
+    (``"16GB"``, ``"i7"``, ``""`` when blank); the raw codes only appear in
+    SQL and in results read with a plain cursor.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("blank", True)
+        kwargs.setdefault("default", "")
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def codes(self) -> dict:
+        codes = {value: code for code, (value, _) in enumerate(self.flatchoices, start=1)}
+        codes[""] = 0
+        return codes
+
+    @cached_property
+    def values(self) -> dict:
+        return {code: value for value, code in self.codes.items()}
+
+    @cached_property
+    def validators(self):
+        # The value is a choice, not a number, so the integer range validators do not apply.
+        return [*self.default_validators, *self._validators]
+
+    def encode(self, value) -> int:
+        if value is None:
+            return 0
+        try:
+            return self.codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {self.name} choice.") from None
+
+    def from_db_value(self, value, expression, connection):
+        return value if value is None else self.values.get(value, "")
+
+    def to_python(self, value):
+        if value is None or value in self.codes:
+            return value or ""
+        raise exceptions.ValidationError(
+            self.error_messages["invalid_choice"], code="invalid_choice", params={"value": value}
+        )
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        return self.encode(value)
+
+
 class AssetType(models.Model):
     asset_name = models.CharField(max_length=250, unique=True)
 
@@ -54,14 +152,110 @@ class User(AbstractUser):
 
 class BaseModel(models.Model):
     created_at = models.DateField(auto_now_add=True)
-    deleted_at = models.DateTimeField(auto_now=True)
+    deleted_at = models.DateTimeField(null=True, blank=True, default=None)
     modified_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
 
 
-class Asset(BaseModel):
+# Sent by ``SoftDeleteQuerySet`` with the ``ids`` of the rows it soft-deleted
+# (``deleted=True``) or restored (``deleted=False``). Both are queryset
+# updates, so ``post_save``/``post_delete`` are not sent.
+soft_delete_changed = Signal()
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    """
+    QuerySet whose ``delete()`` marks rows deleted instead of removing them.
+    """
+
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self):
+        return self.filter(deleted_at__isnull=False)
+
+    def _set_deleted_at(self, deleted_at):
+        changed = self.dead() if deleted_at is None else self.alive()
+        with atomic_write(using=self.db):
+            ids = list(changed.values_list("pk", flat=True))
+            if ids:
+                self.model._base_manager.using(self.db).filter(pk__in=ids).update(
+                    deleted_at=deleted_at
+                )
+                soft_delete_changed.send(
+                    sender=self.model, ids=ids, deleted=deleted_at is not None, using=self.db
+                )
+        return len(ids)
+
+    def delete(self):
+        count = self._set_deleted_at(timezone.now())
+        return count, {self.model._meta.label: count}
+
+    delete.queryset_only = True
+
+    def hard_delete(self):
+        """
+        Remove the rows from the database, with the usual cascades and signals.
+        """
+        return super().delete()
+
+    hard_delete.queryset_only = True
+
+    def restore(self):
+        return self._set_deleted_at(None)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    Manager hiding soft-deleted rows.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().alive()
+
+
+class SoftDeleteModel(BaseModel):
+    """
+    Model whose rows are kept, marked with ``deleted_at``, when deleted.
+
+    ``objects`` (the default manager, also used by reverse relations, forms and
+    the admin) only returns live rows; ``all_objects`` returns every row.
+    ``hard_delete()`` removes a row for good, as ``purge_deleted`` does for
+    rows deleted long enough ago.
+    """
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    @property
+    def is_deleted(self):
+        return self.deleted_at is not None
+
+    def _filter_self(self, using):
+        return type(self).all_objects.db_manager(using or self._state.db).filter(pk=self.pk)
+
+    def delete(self, using=None, keep_parents=False):
+        deleted_at = timezone.now()
+        count = self._filter_self(using)._set_deleted_at(deleted_at)
+        if count:
+            self.deleted_at = deleted_at
+        return count, {self._meta.label: count}
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+    def restore(self, using=None):
+        restored = self._filter_self(using).restore()
+        self.deleted_at = None
+        return restored
+
+
+class Asset(SoftDeleteModel):
     DUE = "due"
     DONE = "done"
     YES = "yes"
@@ -74,41 +268,6 @@ class Asset(BaseModel):
         (YES, "yes"),
         (NO, "no"),
     ]
-    RAM = [
-        ("4GB", "4GB"),
-        ("6GB", "6GB"),
-        ("8GB", "8GB"),
-        ("16GB", "16GB"),
-        ("32GB", "32GB"),
-        ("64GB", "64GB"),
-    ]
-    SSD = [
-        ("120", "120"),
-        ("250", "250"),
-        ("256", "256"),
-        ("500", "500"),
-    ]
-    PROCESSOR = [
-        ("i3", "i3"),
-        ("i5", "i5"),
-        ("i7", "i7"),
-        ("i9", "i9"),
-        ("i10", "i10"),
-    ]
-    OS = [
-        ("UBUNTU", "ubuntu"),
-        ("MAC OS", "mac os"),
-        ("WINDOW", "window"),
-        ("HACKINTOSH", "hackintosh"),
-    ]
-    STORAGE = [
-        ("16", "16"),
-        ("32", "32"),
-        ("64", "64"),
-        ("128", "128"),
-        ("256", "256"),
-        ("512", "512"),
-    ]
 
     asset_type = models.ForeignKey(
         AssetType, on_delete=models.SET_NULL, null=True, related_name="assettype"
@@ -128,13 +287,41 @@ class Asset(BaseModel):
     is_active = models.BooleanField(default=True)
     serial_number = models.CharField(max_length=50, null=True, blank=True)
     invoice_number = models.CharField(max_length=30, null=True, blank=True)
-    ram = models.CharField(max_length=30, null=True, blank=True, choices=RAM, default="")
-    ssd = models.CharField(max_length=30, null=True, blank=True, choices=SSD, default="")
-    processor = models.CharField(max_length=30, null=True, blank=True, choices=PROCESSOR, default="")
-    operating_system = models.CharField(max_length=30, null=True, blank=True, choices=OS, default="")
-    storage = models.CharField(max_length=30, null=True, blank=True, choices=STORAGE, default="")
+    ram = SpecField(choices=RAM_CHOICES)
+    ssd = SpecField(choices=SSD_CHOICES)
+    processor = SpecField(choices=PROCESSOR_CHOICES)
+    operating_system = SpecField(choices=OS_CHOICES)
+    storage = SpecField(choices=STORAGE_CHOICES)
     is_assign = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["asset_type", "asset_brand"], name="asset_type_brand_idx"),
+            models.Index(fields=["asset_brand"], name="asset_brand_idx"),
+            models.Index(fields=["vendor", "is_assign"], name="asset_vendor_assign_idx"),
+            models.Index(fields=["payment_status"], name="asset_payment_status_idx"),
+            models.Index(
+                fields=["asset_type", "asset_brand"],
+                condition=models.Q(is_assign=False, deleted_at__isnull=True),
+                name="asset_remaining_idx",
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="asset_deleted_idx",
+            ),
+            # Covers the faceted search (facets.py), which groups by these columns in
+            # this order: the grouping is read from the index alone, already sorted.
+            models.Index(
+                fields=[
+                    "is_assign", "asset_type", "ram", "processor", "operating_system", "ssd",
+                    "storage", "asset_brand",
+                ],
+                condition=models.Q(deleted_at__isnull=True),
+                name="asset_spec_idx",
+            ),
+        ]
+
     def payment(self):
         if self.payment_status == 'done':
             payment_comp = str(datetime.datetime.now())
@@ -151,25 +338,47 @@ class Asset(BaseModel):
         return f"{self.asset_type}  {self.asset_brand}({self.ram} {self.ssd} {self.processor} {self.operating_system} {self.storage} {self.serial_number})"
 
 
-class Vendor(BaseModel):
+class Vendor(SoftDeleteModel):
     first_name = models.CharField(max_length=30, null=True, blank=True)
     last_name = models.CharField(max_length=30, null=True, blank=True)
-    email = models.EmailField(max_length=30, null=True, blank=True, unique=True)
+    email = models.EmailField(max_length=30, null=True, blank=True)
     mobile_number = models.IntegerField()
     address = models.TextField(null=True, blank=True)
     is_vendor = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="vendor_active_created_idx",
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="vendor_deleted_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="unique_live_vendor_email",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
 
-class Employee(BaseModel):
+class Employee(SoftDeleteModel):
 
     first_name = models.CharField(max_length=30, null=True, blank=True)
     last_name = models.CharField(max_length=30, null=True, blank=True)
-    email = models.EmailField(max_length=30, null=True, blank=True, unique=True)
-    employee_id = models.CharField(max_length=30, null=True, blank=True, unique=True)
+    # Also indexed in full: lookups through assignments do not filter on deleted_at.
+    email = models.EmailField(max_length=30, null=True, blank=True, db_index=True)
+    employee_id = models.CharField(max_length=30, null=True, blank=True)
     date_of_joining = models.DateField(null=True, blank=True)
     mobile_number = models.IntegerField()
     technology_name = models.CharField(
@@ -177,9 +386,50 @@ class Employee(BaseModel):
         choices=TECHNOLOGY_CHOICES,
         null=True, blank=True
     )
+    # Holdings counters, maintained by holdings.py.
     is_have_asset = models.BooleanField(default=False)
+    assets_held = models.PositiveIntegerField(default=0)
+    held_value = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    client_assets_held = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="employee_active_idx",
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="employee_deleted_idx",
+            ),
+            models.Index(
+                fields=["assets_held"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="employee_assets_held_idx",
+            ),
+            models.Index(
+                fields=["held_value"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="employee_held_value_idx",
+            ),
+        ]
+        # Unique among live employees only, so a deleted employee's email and id can be reused.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="unique_live_employee_email",
+            ),
+            models.UniqueConstraint(
+                fields=["employee_id"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="unique_live_employee_id",
+            ),
+        ]
+
     def __str__(self):
         return f" {self.first_name} {self.last_name} {self.technology_name}"
 
@@ -201,47 +451,16 @@ class AssignAsset(BaseModel):
     # serial_number = models.CharField(max_length=80)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="assignasset_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.asset}"
 
 
-class ClientAsset(BaseModel):
-    RAM = [
-        ("4GB", "4GB"),
-        ("6GB", "6GB"),
-        ("8GB", "8GB"),
-        ("16GB", "16GB"),
-        ("32GB", "32GB"),
-        ("64GB", "64GB"),
-    ]
-    SSD = [
-        ("120", "120"),
-        ("250", "250"),
-        ("256", "256"),
-        ("500", "500"),
-    ]
-    PROCESSOR = [
-        ("i3", "i3"),
-        ("i5", "i5"),
-        ("i7", "i7"),
-        ("i9", "i9"),
-        ("i10", "i10"),
-    ]
-    OS = [
-        ("UBUNTU", "ubuntu"),
-        ("MAC OS", "mac os"),
-        ("WINDOW", "window"),
-        ("HACKINTOSH", "hackintosh"),
-    ]
-    STORAGE = [
-        ("16", "16"),
-        ("32", "32"),
-        ("64", "64"),
-        ("128", "128"),
-        ("256", "256"),
-        ("512", "512"),
-    ]
-
+class ClientAsset(SoftDeleteModel):
     client_name = models.CharField(max_length=50)
     project = models.CharField(max_length=50)
     configuration = models.CharField(max_length=250)
@@ -265,11 +484,196 @@ class ClientAsset(BaseModel):
     description = models.TextField(null=True, blank=True)
 
     serial_number = models.CharField(max_length=50, default="")
-    ram = models.CharField(max_length=30, null=True, blank=True, choices=RAM, default="")
-    ssd = models.CharField(max_length=30, null=True, blank=True, choices=SSD, default="")
-    processor = models.CharField(max_length=30, null=True, blank=True, choices=PROCESSOR, default="")
-    operating_system = models.CharField(max_length=30, null=True, blank=True, choices=OS, default="")
-    storage = models.CharField(max_length=30, null=True, blank=True, choices=STORAGE, default="")
+    ram = SpecField(choices=RAM_CHOICES)
+    ssd = SpecField(choices=SSD_CHOICES)
+    processor = SpecField(choices=PROCESSOR_CHOICES)
+    operating_system = SpecField(choices=OS_CHOICES)
+    storage = SpecField(choices=STORAGE_CHOICES)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["employee"],
+                condition=models.Q(is_dispatch=False, deleted_at__isnull=True),
+                name="clientasset_held_idx",
+            ),
+            models.Index(
+                fields=["date_of_dispatch"],
+                condition=models.Q(is_dispatch=True, deleted_at__isnull=True),
+                name="clientasset_dispatched_idx",
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="clientasset_deleted_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.asset_brand} {self.asset_type} "
+
+
+class InventorySummary(models.Model):
+    asset_type = models.ForeignKey(
+        AssetType, on_delete=models.CASCADE, null=True, related_name="inventory_summary"
+    )
+    asset_brand = models.CharField(max_length=50)
+    vendor = models.ForeignKey(
+        Vendor, on_delete=models.CASCADE, null=True, related_name="inventory_summary"
+    )
+    count = models.IntegerField(default=0)
+    assigned_count = models.IntegerField(default=0)
+    price_sum = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    assigned_price_sum = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    modified_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["asset_type", "asset_brand", "vendor"],
+                name="unique_inventory_summary_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_type} {self.asset_brand} {self.vendor} ({self.count})"
+
+
+class AssignmentEvent(models.Model):
+    """
+    One change of who holds an asset or a client asset, appended by ``ledger.py``.
+
+    Rows are never updated or deleted. The foreign keys are not database
+    constraints, so events outlive purged assets and employees, and are indexed
+    through the composite indexes below rather than on their own.
+    """
+
+    ASSIGN = "assign"
+    REASSIGN = "reassign"
+    RELEASE = "release"
+    DISPATCH = "dispatch"
+    KIND_CHOICES = [
+        (ASSIGN, "Assign"),
+        (REASSIGN, "Reassign"),
+        (RELEASE, "Release"),
+        (DISPATCH, "Dispatch"),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    asset = models.ForeignKey(
+        Asset, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="assignment_events",
+    )
+    client_asset = models.ForeignKey(
+        ClientAsset, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="assignment_events",
+    )
+    # The holder after the event (None once released or dispatched) and before it.
+    employee = models.ForeignKey(
+        Employee, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="+",
+    )
+    previous_employee = models.ForeignKey(
+        Employee, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="+",
+    )
+    # The asset's or client asset's type when the event was recorded.
+    asset_type = models.ForeignKey(
+        AssetType, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="+",
+    )
+    # When the event was recorded, and the assignment or dispatch date entered with it.
+    recorded_at = models.DateTimeField(default=timezone.now)
+    effective_on = models.DateField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["recorded_at"], name="assignmentevent_recorded_idx"),
+            models.Index(
+                fields=["asset", "id"],
+                condition=models.Q(asset__isnull=False),
+                name="assignmentevent_asset_idx",
+            ),
+            models.Index(
+                fields=["client_asset", "id"],
+                condition=models.Q(client_asset__isnull=False),
+                name="assignmentevent_client_idx",
+            ),
+            models.Index(fields=["employee", "id"], name="assignmentevent_employee_idx"),
+            models.Index(
+                fields=["previous_employee", "id"], name="assignmentevent_previous_idx",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(asset__isnull=False, client_asset__isnull=True)
+                | models.Q(asset__isnull=True, client_asset__isnull=False),
+                name="assignmentevent_one_subject",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.asset_id or self.client_asset_id} -> {self.employee_id}"
+
+
+class AssignmentCheckpoint(models.Model):
+    """
+    The holdings after every event up to ``last_event``, stored as ``AssignmentCheckpointHolding`` rows.
+    """
+
+    last_event = models.PositiveBigIntegerField(unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    holdings = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"checkpoint at event {self.last_event} ({self.holdings} holdings)"
+
+
+class AssignmentCheckpointHolding(models.Model):
+    checkpoint = models.ForeignKey(
+        AssignmentCheckpoint, on_delete=models.CASCADE, db_index=False, related_name="holding_rows"
+    )
+    asset = models.ForeignKey(
+        Asset, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="+",
+    )
+    client_asset = models.ForeignKey(
+        ClientAsset, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, null=True,
+        related_name="+",
+    )
+    employee = models.ForeignKey(
+        Employee, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False,
+        related_name="+",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["checkpoint", "employee"], name="checkpoint_employee_idx"),
+            models.Index(fields=["checkpoint", "asset"], name="checkpoint_asset_idx"),
+            models.Index(fields=["checkpoint", "client_asset"], name="checkpoint_client_idx"),
+        ]
+
+
+class DailyActivity(models.Model):
+    """
+    What happened on one day to the assets of one type, maintained by ``rollups.py``.
+    """
+
+    day = models.DateField()
+    asset_type = models.ForeignKey(
+        AssetType, on_delete=models.CASCADE, null=True, related_name="daily_activity"
+    )
+    assignments = models.PositiveIntegerField(default=0)
+    releases = models.PositiveIntegerField(default=0)
+    dispatches = models.PositiveIntegerField(default=0)
+    purchases = models.PositiveIntegerField(default=0)
+    spend = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            # Also the index behind the day range queries of the trend charts.
+            models.UniqueConstraint(fields=["day", "asset_type"], name="unique_daily_activity_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.asset_type}"
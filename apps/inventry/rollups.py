@@ -0,0 +1,231 @@
+"""
+Daily activity rollups.
+
+``DailyActivity`` holds one row per (day, asset type) with the assignments,
+releases and dispatches recorded in the assignment ledger that day (see
+``ledger.py``) and the purchases and spend of live assets by purchase date.
+The trend charts read 30, 90 or 365 days of it with one range query on the
+(day, asset type) unique index instead of grouping the raw tables.
+
+Rows are adjusted incrementally: the ledger adds every event it appends, and
+the ``Asset`` receivers in ``signals.py`` move an asset's purchase between
+rows when its type, purchase date, price or deletion changes. Writes that
+bypass signals call ``refresh_purchases`` with the affected (day, type) keys.
+``rebuild_daily_activity`` recomputes the table from the ledger and the live
+assets and ``check_daily_activity`` reports any drift.
+"""
+
+# Python Imports
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+# Django Imports
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Project Imports
+from .models import Asset, AssetType, AssignmentEvent, DailyActivity
+from .sqlite import atomic_write
+
+
+ACTIVITY_FIELDS = ("assignments", "releases", "dispatches", "purchases", "spend")
+PURCHASE_FIELDS = ("purchases", "spend")
+EVENT_FIELDS = {
+    AssignmentEvent.ASSIGN: "assignments",
+    AssignmentEvent.REASSIGN: "assignments",
+    AssignmentEvent.RELEASE: "releases",
+    AssignmentEvent.DISPATCH: "dispatches",
+}
+TREND_DAYS = (30, 90, 365)
+
+
+def _key_filter(key) -> dict:
+    day, asset_type_id = key
+    return {"day": day, "asset_type_id": asset_type_id}
+
+
+def _keys_filter(keys, day="day"):
+    query = Q()
+    for day_value, asset_type_id in keys:
+        query |= Q(**{day: day_value, "asset_type_id": asset_type_id})
+    return query
+
+
+def add_activity(deltas):
+    """
+    Add ``deltas``, a mapping of (day, asset type id) keys to ``{field: amount}``, to the rows.
+    """
+    with atomic_write():
+        for key, values in deltas.items():
+            delta = {field: F(field) + amount for field, amount in values.items() if amount}
+            if not delta:
+                continue
+            updated = DailyActivity.objects.filter(**_key_filter(key)).update(**delta)
+            if not updated:
+                activity, _ = DailyActivity.objects.get_or_create(**_key_filter(key))
+                DailyActivity.objects.filter(pk=activity.pk).update(**delta)
+
+
+def record_events(events):
+    """
+    Count newly appended ledger ``events`` in the rows of the day they were recorded.
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    for event in events:
+        key = (timezone.localdate(event.recorded_at), event.asset_type_id)
+        deltas[key][EVENT_FIELDS[event.kind]] += 1
+    add_activity(deltas)
+
+
+def _purchase(asset):
+    if asset is None or asset.deleted_at is not None or asset.purchase_date is None:
+        return None, {}
+    return (asset.purchase_date, asset.asset_type_id), {
+        "purchases": 1, "spend": Decimal(asset.price or 0),
+    }
+
+
+def move_purchase(previous, asset):
+    """
+    Move an asset's purchase from its previous state to its current one.
+
+    ``previous`` is the asset as stored before the write, or ``None`` on create.
+    """
+    old_key, old_values = _purchase(previous)
+    new_key, new_values = _purchase(asset)
+    if (old_key, old_values) == (new_key, new_values):
+        return
+    deltas = defaultdict(lambda: defaultdict(Decimal))
+    if old_key is not None:
+        for field, amount in old_values.items():
+            deltas[old_key][field] -= amount
+    if new_key is not None:
+        for field, amount in new_values.items():
+            deltas[new_key][field] += amount
+    add_activity(deltas)
+
+
+def remove_purchase(asset):
+    move_purchase(asset, None)
+
+
+def _live_purchases(queryset):
+    rows = (
+        queryset.exclude(purchase_date=None).order_by()
+        .values("purchase_date", "asset_type_id")
+        .annotate(purchases=Count("id"), spend=Sum("price"))
+    )
+    return {
+        (row["purchase_date"], row["asset_type_id"]): {
+            "purchases": row["purchases"], "spend": row["spend"] or 0,
+        }
+        for row in rows
+    }
+
+
+def refresh_purchases(keys):
+    """
+    Recompute the purchases and spend of the (day, asset type id) ``keys`` from live assets.
+
+    Used after queryset writes that do not send model signals.
+    """
+    keys = {key for key in keys if key[0] is not None}
+    if not keys:
+        return
+    live = _live_purchases(Asset.objects.filter(_keys_filter(keys, day="purchase_date")))
+    empty = dict.fromkeys(PURCHASE_FIELDS, 0)
+    with atomic_write():
+        for key in keys:
+            values = live.get(key, empty)
+            updated = DailyActivity.objects.filter(**_key_filter(key)).update(**values)
+            if not updated and values["purchases"]:
+                DailyActivity.objects.create(**_key_filter(key), **values)
+
+
+def _live_activity():
+    activity = defaultdict(lambda: dict.fromkeys(ACTIVITY_FIELDS, 0))
+    for key, values in _live_purchases(Asset.objects.all()).items():
+        activity[key].update(values)
+    events = (
+        AssignmentEvent.objects.annotate(day=TruncDate("recorded_at")).order_by()
+        .values("day", "asset_type_id", "kind").annotate(count=Count("id"))
+    )
+    # Events keep the id of a type deleted since; its rows moved to "no type".
+    asset_types = set(AssetType.objects.values_list("id", flat=True))
+    for row in events:
+        asset_type_id = row["asset_type_id"] if row["asset_type_id"] in asset_types else None
+        activity[(row["day"], asset_type_id)][EVENT_FIELDS[row["kind"]]] += row["count"]
+    return activity
+
+
+def rebuild_daily_activity() -> int:
+    """
+    Replace the whole rollup table with rows computed from the ledger and live assets.
+
+    Returns:
+        int: The number of rows written.
+    """
+    live = _live_activity()
+    with atomic_write():
+        DailyActivity.objects.all().delete()
+        DailyActivity.objects.bulk_create(
+            (DailyActivity(**_key_filter(key), **values) for key, values in live.items()),
+            batch_size=2000,
+        )
+    return len(live)
+
+
+def check_daily_activity() -> list:
+    """
+    Compare the rollup table with the ledger and live assets.
+
+    Returns:
+        list: ``(key, stored, live)`` tuples for every row that has drifted.
+    """
+    live = _live_activity()
+    stored = {
+        (row["day"], row["asset_type_id"]): {field: row[field] for field in ACTIVITY_FIELDS}
+        for row in DailyActivity.objects.values("day", "asset_type_id", *ACTIVITY_FIELDS)
+    }
+    empty = dict.fromkeys(ACTIVITY_FIELDS, 0)
+    return [
+        (key, stored.get(key, empty), live.get(key, empty))
+        for key in set(live) | set(stored)
+        if stored.get(key, empty) != live.get(key, empty)
+    ]
+
+
+def get_activity_trend(days, asset_type=None, today=None) -> dict:
+    """
+    Return the daily totals of the last ``days`` days, up to and including ``today``.
+
+    Args:
+        days (int): The length of the period, one of ``TREND_DAYS``.
+        asset_type: Optional ``AssetType`` (or id) to restrict the totals to.
+        today (date): The last day, today by default.
+
+    Returns:
+        dict: ``days`` (ISO dates) and one list per field in ``ACTIVITY_FIELDS``
+        with a value for every day, zero on days without activity.
+    """
+    if days not in TREND_DAYS:
+        raise ValueError(f"days must be one of {TREND_DAYS}.")
+    today = today or timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    rows = DailyActivity.objects.filter(day__gte=start, day__lte=today)
+    if asset_type is not None:
+        rows = rows.filter(asset_type=asset_type)
+    totals = {
+        row["day"]: row
+        for row in rows.order_by().values("day").annotate(
+            **{f"total_{field}": Sum(field) for field in ACTIVITY_FIELDS}
+        )
+    }
+    calendar = [start + timedelta(days=offset) for offset in range(days)]
+    trend = {"days": [day.isoformat() for day in calendar]}
+    for field in ACTIVITY_FIELDS:
+        values = [totals[day][f"total_{field}"] if day in totals else 0 for day in calendar]
+        trend[field] = [str(value) if field == "spend" else value for value in values]
+    return trend
@@ -0,0 +1,253 @@
+"""
+Global full-text search backed by an SQLite FTS5 table.
+
+Assets, employees, vendors and client assets are indexed as one document each
+in ``inventry_search`` (created in migration 0044). A document has a short
+``title`` (what a hit is displayed as) and a ``body`` with the other
+searchable text. The rowid encodes the primary key and the entity
+(``id * 4 + code``), so documents are replaced, removed, filtered by entity and
+mapped back to objects without reading their content. Only live (not
+soft-deleted) rows are indexed. Documents are kept in sync by the receivers in
+``signals.py``; bulk writers call ``index_queryset`` or ``rebuild_search_index``
+themselves.
+
+Queries are split into words and every word is matched as a prefix, so
+``dell 16`` finds "Dell" laptops with "16GB" in their configuration. Hits are
+ranked with bm25, title matches weighing five times more than body matches.
+Scoring every hit costs time proportional to the number of hits, so queries
+matching more than ``RANK_LIMIT`` documents (a bare "laptop" on a large
+inventory) are listed newest first instead, which FTS5 answers straight from
+its doclists.
+"""
+
+# Python Imports
+import re
+
+# Django Imports
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+
+# Project Imports
+from .models import Asset, ClientAsset, Employee, Vendor
+
+
+SEARCH_TABLE = "inventry_search"
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+CHUNK_SIZE = 2000
+RANK_LIMIT = 5000
+
+# entity -> (model, rowid code, title lookups, body lookups, detail URL name)
+ENTITIES = {
+    "asset": (
+        Asset, 0,
+        ["asset_type__asset_name", "asset_brand"],
+        ["serial_number", "invoice_number", "system_configuration", "vendor__first_name",
+         "vendor__last_name"],
+        "asset_details",
+    ),
+    "employee": (
+        Employee, 1,
+        ["first_name", "last_name"],
+        ["employee_id", "email", "technology_name"],
+        "employee_details",
+    ),
+    "vendor": (
+        Vendor, 2,
+        ["first_name", "last_name"],
+        ["email", "address"],
+        "vendor_details",
+    ),
+    "client_asset": (
+        ClientAsset, 3,
+        ["client_name", "project"],
+        ["project_owner", "asset_brand", "asset_type__asset_name", "serial_number"],
+        "client-update",
+    ),
+}
+ENTITY_BY_MODEL = {model: entity for entity, (model, *_) in ENTITIES.items()}
+
+
+def is_enabled():
+    return connection.vendor == "sqlite"
+
+
+CODES = {code: entity for entity, (_, code, *_) in ENTITIES.items()}
+
+
+def _rowid(entity, object_id):
+    return object_id * len(ENTITIES) + ENTITIES[entity][1]
+
+
+def _join(row, lookups):
+    return " ".join(str(row[lookup]) for lookup in lookups if row[lookup] not in (None, ""))
+
+
+def _documents(entity, queryset):
+    _, _, title_fields, body_fields, _ = ENTITIES[entity]
+    rows = queryset.order_by().values("id", *title_fields, *body_fields).iterator(chunk_size=CHUNK_SIZE)
+    for row in rows:
+        yield (
+            _rowid(entity, row["id"]), entity,
+            _join(row, title_fields), _join(row, body_fields),
+        )
+
+
+def _write(cursor, documents):
+    documents = list(documents)
+    cursor.executemany(
+        f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [(document[0],) for document in documents]
+    )
+    cursor.executemany(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, entity, title, body) VALUES (%s, %s, %s, %s)",
+        documents,
+    )
+
+
+def index_queryset(queryset):
+    """
+    (Re)index every object in ``queryset``.
+    """
+    if not is_enabled():
+        return
+    entity = ENTITY_BY_MODEL[queryset.model]
+    documents = _documents(entity, queryset)
+    with connection.cursor() as cursor:
+        while True:
+            chunk = [document for _, document in zip(range(CHUNK_SIZE), documents)]
+            if not chunk:
+                break
+            _write(cursor, chunk)
+
+
+def index_object(instance):
+    index_queryset(type(instance).objects.filter(pk=instance.pk))
+
+
+def remove_ids(model, ids):
+    if not is_enabled():
+        return
+    entity = ENTITY_BY_MODEL[model]
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [(_rowid(entity, pk),) for pk in ids]
+        )
+
+
+def remove_object(instance):
+    remove_ids(type(instance), [instance.pk])
+
+
+def clear_search_index(entity=None):
+    if not is_enabled():
+        return
+    with connection.cursor() as cursor:
+        if entity is None:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        else:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE entity = %s", [entity])
+
+
+def rebuild_search_index(entities=None) -> dict:
+    """
+    Rebuild the documents of ``entities`` (all by default) from the database.
+
+    Returns:
+        dict: The number of indexed documents per entity.
+    """
+    counts = {}
+    if entities is None:
+        clear_search_index()
+    for entity in entities or ENTITIES:
+        model = ENTITIES[entity][0]
+        if entities is not None:
+            clear_search_index(entity)
+        index_queryset(model.objects.all())
+        counts[entity] = model.objects.count()
+    if is_enabled():
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+    return counts
+
+
+def to_match_query(text):
+    """
+    Turn free text into an FTS5 query matching every word as a prefix.
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text or ""))
+
+
+def matching_ids(entity, text):
+    """
+    Return a ``RawSQL`` subquery of the ids of ``entity`` matching ``text``, for ``id__in``.
+    """
+    return RawSQL(
+        f"SELECT rowid / {len(ENTITIES)} FROM {SEARCH_TABLE} "
+        f"WHERE {SEARCH_TABLE} MATCH %s AND rowid %% {len(ENTITIES)} = %s",
+        [to_match_query(text), ENTITIES[entity][1]],
+    )
+
+
+def search(text, page=1, page_size=DEFAULT_PAGE_SIZE, entities=None) -> dict:
+    """
+    Return one page of hits for ``text``.
+
+    Args:
+        text (str): Free-text query.
+        page (int): 1-based page number.
+        page_size (int): Hits per page, capped at ``MAX_PAGE_SIZE``.
+        entities (list): Restrict the hits to these entity names.
+
+    Returns:
+        dict: The number of matching documents of ``entities`` (``total``),
+        whether the page is ``ranked`` and the page of ``hits`` (entity, id,
+        title, body and url), best match first.
+    """
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    page = max(1, page)
+    match = to_match_query(text)
+    result = {"query": text, "page": page, "page_size": page_size, "total": 0, "ranked": False, "hits": []}
+    if not match or not is_enabled():
+        return result
+
+    where, params = f"{SEARCH_TABLE} MATCH %s", [match]
+    codes = [ENTITIES[entity][1] for entity in entities or [] if entity in ENTITIES]
+    if codes:
+        where += f" AND rowid %% {len(ENTITIES)} IN ({', '.join(['%s'] * len(codes))})"
+        params += codes
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {where}", params)
+        result["total"] = cursor.fetchone()[0]
+        if not result["total"]:
+            return result
+        result["ranked"] = result["total"] <= RANK_LIMIT
+
+        order = "rank" if result["ranked"] else "rowid DESC"
+        cursor.execute(
+            f"SELECT rowid FROM {SEARCH_TABLE} WHERE {where} ORDER BY {order} LIMIT %s OFFSET %s",
+            params + [page_size, (page - 1) * page_size],
+        )
+        rowids = [rowid for rowid, in cursor.fetchall()]
+        if not rowids:
+            return result
+        # Only the page's documents are read, by rowid.
+        cursor.execute(
+            f"SELECT rowid, title, body FROM {SEARCH_TABLE} "
+            f"WHERE rowid IN ({', '.join(['%s'] * len(rowids))})",
+            rowids,
+        )
+        documents = {rowid: (title, body) for rowid, title, body in cursor.fetchall()}
+
+    for rowid in rowids:
+        entity, object_id = CODES[rowid % len(ENTITIES)], rowid // len(ENTITIES)
+        title, body = documents[rowid]
+        result["hits"].append({
+            "entity": entity,
+            "id": object_id,
+            "title": title,
+            "body": body,
+            "url": reverse(ENTITIES[entity][4], args=[object_id]),
+        })
+    return result
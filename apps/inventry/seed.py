@@ -0,0 +1,308 @@
+"""
+Deterministic synthetic inventory generator.
+
+``seed_inventory`` fills the database with asset types, vendors, employees,
+assets, assignments and client assets whose shape follows a real office
+inventory: a few asset types (laptops, monitors) make up most of the stock, a
+handful of vendors supply most assets, most assets are assigned and a small
+group of employees hold many of them. The same ``seed`` always produces the
+same rows, so benchmark runs on different commits compare like with like.
+
+Rows are written with ``bulk_create`` and bypass model signals, so the
+inventory summary, employee holdings, assignment ledger, daily activity and
+search index are brought up to date and the cache invalidated once at the end.
+"""
+
+# Python Imports
+import random
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import accumulate
+
+# Django Imports
+from django.core.management.color import no_style
+from django.db import connection
+
+# Project Imports
+from .cache import invalidate_asset_snapshot, invalidate_inventory_cache
+from .models import (
+    TECHNOLOGY_CHOICES, Asset, AssetType, AssignAsset, AssignmentCheckpoint,
+    AssignmentCheckpointHolding, AssignmentEvent, ClientAsset, DailyActivity, Employee,
+    InventorySummary, Vendor,
+)
+from .holdings import rebuild_employee_holdings
+from .ledger import sync_assignment_ledger
+from .rollups import rebuild_daily_activity
+from .search import clear_search_index, rebuild_search_index
+from .sqlite import atomic_write
+from .summary import rebuild_inventory_summary
+
+
+BASE_DATE = date(2023, 1, 1)
+DELETED_AT = datetime(2023, 1, 1, tzinfo=timezone.utc)
+BATCH_SIZE = 2000
+
+# (name, share of the stock, brands, (min price, max price))
+ASSET_TYPES = [
+    ("Laptop", 40, ("Dell", "HP", "Lenovo", "Apple", "Asus"), (35000, 180000)),
+    ("Monitor", 20, ("Dell", "LG", "Samsung", "BenQ"), (8000, 45000)),
+    ("Keyboard", 10, ("Logitech", "Dell", "HP"), (500, 6000)),
+    ("Mouse", 10, ("Logitech", "Dell", "HP"), (300, 4000)),
+    ("Headset", 6, ("Jabra", "Logitech", "Sony"), (1500, 15000)),
+    ("Mobile", 6, ("Apple", "Samsung", "OnePlus", "Google"), (15000, 120000)),
+    ("Tablet", 4, ("Apple", "Samsung", "Lenovo"), (20000, 90000)),
+    ("Printer", 2, ("HP", "Canon", "Epson"), (10000, 60000)),
+    ("Router", 1, ("Cisco", "TP-Link", "Netgear"), (3000, 40000)),
+    ("Projector", 1, ("Epson", "BenQ", "Sony"), (25000, 100000)),
+]
+
+SPEC_TYPES = {"Laptop"}
+ASSIGNED_SHARE = 0.65
+PAID_SHARE = 0.7
+ACTIVE_EMPLOYEE_SHARE = 0.9
+DISPATCHED_SHARE = 0.3
+
+FIRST_NAMES = (
+    "Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Isha", "Rohan", "Kabir",
+    "Meera", "Priya", "Arjun", "Sara", "Neha", "Karan", "Riya", "Dev",
+)
+LAST_NAMES = (
+    "Sharma", "Patel", "Mehta", "Shah", "Gupta", "Iyer", "Reddy", "Nair",
+    "Joshi", "Desai", "Kapoor", "Singh",
+)
+CLIENTS = ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka")
+
+
+def default_counts(assets):
+    """
+    Return the entity counts used for an inventory of ``assets`` assets.
+    """
+    return {
+        "asset_types": len(ASSET_TYPES),
+        "vendors": max(3, assets // 500),
+        "employees": max(1, assets // 3),
+        "assets": assets,
+        "client_assets": assets // 10,
+    }
+
+
+def _skewed_weights(count, exponent=1.0):
+    """
+    Cumulative Zipf-like weights: the first items are picked far more often.
+    """
+    return list(accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def _choices(field):
+    return [key for key, _ in field.choices if key]
+
+
+def _read_back(model, after_id):
+    # SQLite does not return primary keys from bulk_create, so read the ids back.
+    return list(
+        model._base_manager.filter(id__gt=after_id).order_by("id").values_list("id", flat=True)
+    )
+
+
+def _last_id(model):
+    return model._base_manager.order_by("-id").values_list("id", flat=True).first() or 0
+
+
+def _soft_delete_inactive(model, after_id):
+    # Inactive vendors and employees are the ones that were deleted.
+    model.all_objects.filter(id__gt=after_id, is_active=False).update(deleted_at=DELETED_AT)
+
+
+def flush_inventory():
+    """
+    Delete every inventory row (users are kept) without per-row signals.
+    """
+    models = [
+        AssignmentCheckpointHolding, AssignmentCheckpoint, AssignmentEvent, DailyActivity,
+        AssignAsset, ClientAsset, Asset, InventorySummary, Employee, Vendor, AssetType,
+    ]
+    tables = [model._meta.db_table for model in models]
+    connection.ops.execute_sql_flush(
+        connection.ops.sql_flush(no_style(), tables, reset_sequences=True)
+    )
+    clear_search_index()
+    invalidate_asset_snapshot()
+    invalidate_inventory_cache()
+
+
+def seed_inventory(assets, seed=0, **counts) -> dict:
+    """
+    Generate a synthetic inventory.
+
+    Args:
+        assets (int): Number of assets to create.
+        seed (int): Random seed; the same seed and counts give the same data.
+        counts: Optional overrides for ``asset_types``, ``vendors``,
+            ``employees`` and ``client_assets`` (see ``default_counts``).
+
+    Returns:
+        dict: The number of rows created per entity.
+    """
+    counts = {**default_counts(assets), **counts}
+    rng = random.Random(seed)
+
+    with atomic_write():
+        created = {
+            "asset_types": _seed_asset_types(counts["asset_types"]),
+            "vendors": _seed_vendors(rng, counts["vendors"]),
+            "employees": _seed_employees(rng, counts["employees"]),
+        }
+        created["assets"], created["assignments"] = _seed_assets(
+            rng, assets, created["asset_types"], created["vendors"], created["employees"]
+        )
+        created["client_assets"] = _seed_client_assets(
+            rng, counts["client_assets"], created["asset_types"], created["employees"]
+        )
+        rebuild_inventory_summary()
+        rebuild_employee_holdings()
+        sync_assignment_ledger()
+        rebuild_daily_activity()
+        rebuild_search_index()
+    invalidate_asset_snapshot()
+    invalidate_inventory_cache()
+    return {name: len(rows) for name, rows in created.items()}
+
+
+def _seed_asset_types(count):
+    specs = {name: spec for name, *spec in ASSET_TYPES[:count]}
+    existing = set(AssetType.objects.filter(asset_name__in=specs).values_list("asset_name", flat=True))
+    AssetType.objects.bulk_create(
+        AssetType(asset_name=name) for name in specs if name not in existing
+    )
+    return [
+        (asset_type_id, name, *specs[name])
+        for asset_type_id, name in AssetType.objects.filter(asset_name__in=specs)
+        .order_by("id").values_list("id", "asset_name")
+    ]
+
+
+def _seed_vendors(rng, count):
+    after = _last_id(Vendor)
+    Vendor.objects.bulk_create(
+        (
+            Vendor(
+                first_name=f"{rng.choice(LAST_NAMES)} Traders",
+                last_name=f"#{i}",
+                email=f"vendor{after + i}@example.com",
+                mobile_number=rng.randrange(700000000, 999999999),
+                address=f"{rng.randrange(1, 500)} Industrial Estate",
+                is_active=rng.random() < 0.95,
+            )
+            for i in range(count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    _soft_delete_inactive(Vendor, after)
+    return _read_back(Vendor, after)
+
+
+def _seed_employees(rng, count):
+    after = _last_id(Employee)
+    technologies = [key for key, _ in TECHNOLOGY_CHOICES]
+    Employee.objects.bulk_create(
+        (
+            Employee(
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=rng.choice(LAST_NAMES),
+                email=f"employee{after + i}@example.com",
+                employee_id=f"EMP{after + i:06d}",
+                date_of_joining=BASE_DATE - timedelta(days=rng.randrange(3650)),
+                mobile_number=rng.randrange(700000000, 999999999),
+                technology_name=rng.choice(technologies),
+                is_active=rng.random() < ACTIVE_EMPLOYEE_SHARE,
+            )
+            for i in range(count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    _soft_delete_inactive(Employee, after)
+    return _read_back(Employee, after)
+
+
+def _seed_assets(rng, count, asset_types, vendors, employees):
+    asset_after, assign_after = _last_id(Asset), _last_id(AssignAsset)
+    type_weights = list(accumulate(share for _, _, share, _, _ in asset_types))
+    vendor_weights = _skewed_weights(len(vendors))
+    employee_weights = _skewed_weights(len(employees), exponent=0.5)
+    specs = {
+        field: _choices(Asset._meta.get_field(field))
+        for field in ("ram", "ssd", "processor", "operating_system", "storage")
+    }
+
+    rows, holders = [], []
+    for i in range(count):
+        _, _, _, brands, (low, high) = asset_type = rng.choices(asset_types, cum_weights=type_weights)[0]
+        assigned = bool(employees) and rng.random() < ASSIGNED_SHARE
+        paid = rng.random() < PAID_SHARE
+        purchase_date = BASE_DATE - timedelta(days=rng.randrange(1095))
+        asset = Asset(
+            asset_type_id=asset_type[0],
+            asset_brand=rng.choice(brands),
+            price=Decimal(rng.randrange(low * 100, high * 100)) / 100,
+            vendor_id=rng.choices(vendors, cum_weights=vendor_weights)[0] if vendors else None,
+            payment_status=Asset.DONE if paid else Asset.DUE,
+            in_voice=Asset.YES if paid else rng.choice((Asset.YES, Asset.NO)),
+            payment_date=str(purchase_date) if paid else "---",
+            purchase_date=purchase_date,
+            serial_number=f"SN{asset_after + i:09d}",
+            invoice_number=f"INV{rng.randrange(10 ** 7):07d}",
+            is_assign=assigned,
+        )
+        if asset_type[1] in SPEC_TYPES:
+            for field, choices in specs.items():
+                setattr(asset, field, rng.choice(choices))
+            asset.system_configuration = f"{asset.processor} / {asset.ram} / {asset.ssd}GB"
+        rows.append(asset)
+        if assigned:
+            holders.append((i, rng.choices(employees, cum_weights=employee_weights)[0]))
+
+    Asset.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    asset_ids = _read_back(Asset, asset_after)
+    AssignAsset.objects.bulk_create(
+        (
+            AssignAsset(
+                asset_id=asset_ids[i],
+                employee_id=employee_id,
+                date_of_assign=BASE_DATE - timedelta(days=rng.randrange(730)),
+            )
+            for i, employee_id in holders
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    return asset_ids, _read_back(AssignAsset, assign_after)
+
+
+def _seed_client_assets(rng, count, asset_types, employees):
+    after = _last_id(ClientAsset)
+    laptops = [asset_type for asset_type in asset_types if asset_type[1] in SPEC_TYPES] or asset_types
+    specs = {
+        field: _choices(ClientAsset._meta.get_field(field))
+        for field in ("ram", "ssd", "processor", "operating_system", "storage")
+    }
+    rows = []
+    for i in range(count):
+        asset_type = rng.choice(laptops)
+        dispatched = rng.random() < DISPATCHED_SHARE
+        client = ClientAsset(
+            client_name=rng.choice(CLIENTS),
+            project=f"Project {rng.randrange(1, 40)}",
+            configuration="",
+            asset_brand=rng.choice(asset_type[3]),
+            asset_type_id=asset_type[0],
+            employee_id=rng.choice(employees) if employees else None,
+            project_owner=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            is_dispatch=dispatched,
+            date_of_dispatch=BASE_DATE - timedelta(days=rng.randrange(365)) if dispatched else None,
+            serial_number=f"CL{after + i:09d}",
+        )
+        for field, choices in specs.items():
+            setattr(client, field, rng.choice(choices))
+        client.configuration = f"{client.processor} / {client.ram} / {client.ssd}GB"
+        rows.append(client)
+    ClientAsset.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return _read_back(ClientAsset, after)
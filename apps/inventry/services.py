@@ -0,0 +1,172 @@
+"""
+Set-based write services for asset assignment, employee offboarding and
+purging soft-deleted rows.
+
+The functions here replace per-row ``exists()``/``create()``/``save()`` loops
+with a constant number of queries regardless of how many assets are involved.
+They bypass model signals, so they refresh ``InventorySummary``, the employee
+holdings counters and the assignment ledger and invalidate the inventory cache
+themselves.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.db import transaction
+
+# Project Imports
+from .cache import invalidate_asset_snapshot, invalidate_inventory_cache
+from .holdings import refresh_employee_holdings
+from .ledger import record_asset_holders, record_client_asset_holders
+from .models import Asset, AssignAsset, ClientAsset, Employee, Vendor
+from .search import rebuild_search_index
+from .sqlite import atomic_write
+from .summary import rebuild_inventory_summary, refresh_inventory_summary
+
+
+ASSIGNED = "assigned"
+ALREADY_ASSIGNED = "already_assigned"
+UNAVAILABLE = "unavailable"
+NOT_FOUND = "not_found"
+
+# Soft-deleted models, in the order purge_deleted removes them.
+SOFT_DELETE_MODELS = (ClientAsset, Asset, Employee, Vendor)
+
+
+def assign_assets(asset_ids, employee, date_of_assign=None) -> dict:
+    """
+    Assign every available asset in ``asset_ids`` to ``employee`` in one transaction.
+
+    Args:
+        asset_ids (iterable): Asset primary keys (or ``Asset`` instances) to assign.
+        employee (Employee): The employee receiving the assets.
+        date_of_assign (date): Optional assignment date stored on every new row.
+
+    Returns:
+        dict: Maps each requested asset id to one of ``ASSIGNED``,
+        ``ALREADY_ASSIGNED`` (already held by this employee), ``UNAVAILABLE``
+        (held by someone else) or ``NOT_FOUND``.
+    """
+    asset_ids = list(dict.fromkeys(getattr(asset, "pk", asset) for asset in asset_ids))
+    results = {}
+    with atomic_write():
+        assets = {
+            row["id"]: row
+            for row in Asset.objects.filter(id__in=asset_ids).values(
+                "id", "is_assign", "asset_type_id", "asset_brand", "vendor_id"
+            )
+        }
+        holders = dict(
+            AssignAsset.objects.filter(asset_id__in=asset_ids).values_list("asset_id", "employee_id")
+        )
+
+        to_assign = []
+        for asset_id in asset_ids:
+            asset = assets.get(asset_id)
+            if asset is None:
+                results[asset_id] = NOT_FOUND
+            elif asset_id in holders:
+                holder = holders[asset_id]
+                results[asset_id] = ALREADY_ASSIGNED if holder == employee.pk else UNAVAILABLE
+            elif asset["is_assign"]:
+                results[asset_id] = UNAVAILABLE
+            else:
+                results[asset_id] = ASSIGNED
+                to_assign.append(asset_id)
+
+        if to_assign:
+            AssignAsset.objects.bulk_create(
+                AssignAsset(asset_id=asset_id, employee=employee, date_of_assign=date_of_assign)
+                for asset_id in to_assign
+            )
+            Asset.objects.filter(id__in=to_assign).update(is_assign=True)
+            refresh_inventory_summary(
+                (assets[asset_id]["asset_type_id"], assets[asset_id]["asset_brand"],
+                 assets[asset_id]["vendor_id"])
+                for asset_id in to_assign
+            )
+            refresh_employee_holdings([employee.pk])
+            record_asset_holders(to_assign)
+            transaction.on_commit(invalidate_asset_snapshot)
+            transaction.on_commit(invalidate_inventory_cache)
+    return results
+
+
+def offboard_employees(employees) -> dict:
+    """
+    Release everything ``employees`` hold and delete them, in one transaction.
+
+    Their assets are marked unassigned and their assignment rows deleted, client
+    assets they still hold (not dispatched) are unlinked, and the employees are
+    soft-deleted. The number of queries does not depend on how many assets they held.
+
+    Args:
+        employees (iterable): ``Employee`` instances or primary keys.
+
+    Returns:
+        dict: The number of ``employees`` deleted, ``assets`` released and
+        ``client_assets`` unlinked.
+    """
+    employee_ids = list({getattr(employee, "pk", employee) for employee in employees})
+    with atomic_write():
+        held = Asset.objects.filter(assign_asset__employee_id__in=employee_ids)
+        keys = set(held.values_list("asset_type_id", "asset_brand", "vendor_id").distinct())
+        held_ids = list(
+            AssignAsset.objects.filter(employee_id__in=employee_ids).values_list("asset_id", flat=True)
+        )
+        released = held.update(is_assign=False)
+        # One DELETE instead of the collector's select and batched deletes; the
+        # post_delete receivers' work is done once below.
+        assignments = AssignAsset.objects.filter(employee_id__in=employee_ids)
+        assignments._raw_delete(assignments.db)
+        client_assets = ClientAsset.objects.filter(employee_id__in=employee_ids, is_dispatch=False)
+        client_asset_ids = list(client_assets.values_list("id", flat=True))
+        unlinked = client_assets.update(employee=None)
+        _, deleted = Employee.objects.filter(id__in=employee_ids).delete()
+        refresh_inventory_summary(keys)
+        refresh_employee_holdings(employee_ids)
+        record_asset_holders(held_ids)
+        record_client_asset_holders(client_asset_ids)
+        transaction.on_commit(invalidate_asset_snapshot)
+        transaction.on_commit(invalidate_inventory_cache)
+    return {
+        "employees": deleted.get(Employee._meta.label, 0),
+        "assets": released,
+        "client_assets": unlinked,
+    }
+
+
+def purge_deleted(before) -> dict:
+    """
+    Hard-delete the rows soft-deleted before ``before``, in one transaction.
+
+    Purged vendors leave their assets without a vendor, so the summary and the
+    asset search documents are rebuilt once afterwards rather than per vendor
+    by the ``post_delete`` receivers. Purged employees leave what they still
+    held without an employee, which is recorded in the assignment ledger.
+
+    Args:
+        before (datetime): Rows with an older ``deleted_at`` are purged.
+
+    Returns:
+        dict: The number of rows purged per model label.
+    """
+    purged = {}
+    with atomic_write():
+        employees = Employee.all_objects.dead().filter(deleted_at__lt=before).values("id")
+        held_ids = list(
+            AssignAsset.objects.filter(employee__in=employees).values_list("asset_id", flat=True)
+        )
+        client_asset_ids = list(
+            ClientAsset.objects.filter(employee__in=employees).values_list("id", flat=True)
+        )
+        for model in SOFT_DELETE_MODELS:
+            _, deleted = model.all_objects.dead().filter(deleted_at__lt=before).hard_delete()
+            purged[model._meta.label] = deleted.get(model._meta.label, 0)
+        record_asset_holders(held_ids)
+        record_client_asset_holders(client_asset_ids)
+        if purged[Vendor._meta.label]:
+            rebuild_inventory_summary()
+            rebuild_search_index(["asset"])
+            transaction.on_commit(invalidate_inventory_cache)
+    return purged
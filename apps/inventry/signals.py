@@ -0,0 +1,277 @@
+# Python Imports
+
+# Django Imports
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import pre_delete, pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+# Project Imports
+from .cache import invalidate_asset_snapshot, invalidate_inventory_cache
+from .holdings import refresh_asset_holders, refresh_employee_holdings
+from .ledger import record_asset_holders, record_client_asset_holders
+from .rollups import move_purchase, rebuild_daily_activity, refresh_purchases, remove_purchase
+from .models import (
+    Asset, AssetType, AssignAsset, ClientAsset, Employee, Vendor, soft_delete_changed,
+)
+from .search import index_object, index_queryset, rebuild_search_index, remove_ids, remove_object
+from .sqlite import configure_connection
+from .summary import move_asset, remove_asset, rebuild_inventory_summary, refresh_inventory_summary
+
+
+@receiver(pre_save, sender=Asset)
+def remember_previous_asset(sender, instance, raw=False, **kwargs):
+    instance._summary_previous = None
+    if raw or instance.pk is None:
+        return
+    instance._summary_previous = (
+        Asset.all_objects.filter(pk=instance.pk)
+        .only(
+            "asset_type", "asset_brand", "vendor", "price", "is_assign", "purchase_date",
+            "deleted_at",
+        )
+        .first()
+    )
+
+
+@receiver(post_save, sender=Asset)
+def update_summary_on_asset_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    move_asset(getattr(instance, "_summary_previous", None), instance)
+
+
+@receiver(post_delete, sender=Asset)
+def update_summary_on_asset_delete(sender, instance, **kwargs):
+    remove_asset(instance)
+
+
+@receiver(post_save, sender=Asset)
+def move_purchase_on_asset_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    move_purchase(getattr(instance, "_summary_previous", None), instance)
+
+
+@receiver(post_delete, sender=Asset)
+def remove_purchase_on_asset_delete(sender, instance, **kwargs):
+    remove_purchase(instance)
+
+
+@receiver(soft_delete_changed, sender=Asset)
+def refresh_purchases_on_soft_delete(sender, ids, using, **kwargs):
+    refresh_purchases(
+        Asset.all_objects.using(using).filter(pk__in=ids)
+        .values_list("purchase_date", "asset_type_id").distinct()
+    )
+
+
+@receiver(post_delete, sender=AssetType)
+def rebuild_activity_on_type_delete(sender, instance, **kwargs):
+    # The type's rows are deleted with it and its assets lose their type through SET_NULL.
+    rebuild_daily_activity()
+
+
+@receiver(post_delete, sender=AssetType)
+@receiver(post_delete, sender=Vendor)
+def rebuild_summary_on_key_delete(sender, instance, **kwargs):
+    # Deleting a type or vendor re-keys its assets through SET_NULL without signals.
+    # purge_deleted rebuilds once after hard-deleting soft-deleted vendors.
+    if getattr(instance, "deleted_at", None) is None:
+        rebuild_inventory_summary()
+
+
+@receiver(soft_delete_changed, sender=Asset)
+def refresh_summary_on_soft_delete(sender, ids, using, **kwargs):
+    keys = (
+        Asset.all_objects.using(using).filter(pk__in=ids)
+        .values_list("asset_type_id", "asset_brand", "vendor_id").distinct()
+    )
+    refresh_inventory_summary(keys)
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Vendor)
+@receiver(post_save, sender=ClientAsset)
+def index_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_object(instance)
+
+
+@receiver(post_delete, sender=Asset)
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Vendor)
+@receiver(post_delete, sender=ClientAsset)
+def remove_from_index_on_delete(sender, instance, **kwargs):
+    remove_object(instance)
+
+
+@receiver(post_save, sender=AssetType)
+def reindex_on_type_save(sender, instance, created=False, raw=False, **kwargs):
+    # Asset and client asset documents carry the type name.
+    if raw or created:
+        return
+    index_queryset(Asset.objects.filter(asset_type=instance))
+    index_queryset(ClientAsset.objects.filter(asset_type=instance))
+
+
+@receiver(post_save, sender=Vendor)
+def reindex_assets_on_vendor_save(sender, instance, created=False, raw=False, **kwargs):
+    # Asset documents carry the vendor name.
+    if raw or created:
+        return
+    index_queryset(Asset.objects.filter(vendor=instance))
+
+
+@receiver(post_delete, sender=AssetType)
+@receiver(post_delete, sender=Vendor)
+def reindex_on_key_delete(sender, instance, **kwargs):
+    # As with the summary, SET_NULL leaves no trace of which assets were affected.
+    if getattr(instance, "deleted_at", None) is None:
+        rebuild_search_index(["asset", "client_asset"] if sender is AssetType else ["asset"])
+
+
+@receiver(soft_delete_changed, sender=Asset)
+@receiver(soft_delete_changed, sender=Employee)
+@receiver(soft_delete_changed, sender=Vendor)
+@receiver(soft_delete_changed, sender=ClientAsset)
+def reindex_on_soft_delete(sender, ids, deleted, using, **kwargs):
+    if deleted:
+        remove_ids(sender, ids)
+    else:
+        index_queryset(sender.objects.using(using).filter(pk__in=ids))
+
+
+@receiver(pre_save, sender=AssignAsset)
+@receiver(pre_save, sender=ClientAsset)
+def remember_previous_holder(sender, instance, raw=False, **kwargs):
+    instance._holdings_previous = None
+    instance._ledger_previous_asset = None
+    if raw or instance.pk is None:
+        return
+    fields = ["employee_id", "asset_id"] if sender is AssignAsset else ["employee_id"]
+    previous = sender._base_manager.filter(pk=instance.pk).values(*fields).first() or {}
+    instance._holdings_previous = previous.get("employee_id")
+    instance._ledger_previous_asset = previous.get("asset_id")
+
+
+@receiver(post_save, sender=AssignAsset)
+@receiver(post_save, sender=ClientAsset)
+def refresh_holdings_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_employee_holdings({getattr(instance, "_holdings_previous", None), instance.employee_id})
+
+
+@receiver(post_delete, sender=AssignAsset)
+@receiver(post_delete, sender=ClientAsset)
+def refresh_holdings_on_delete(sender, instance, **kwargs):
+    refresh_employee_holdings({instance.employee_id})
+
+
+@receiver(soft_delete_changed, sender=ClientAsset)
+def refresh_holdings_on_client_soft_delete(sender, ids, using, **kwargs):
+    refresh_employee_holdings(
+        ClientAsset.all_objects.using(using).filter(pk__in=ids).values_list("employee_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=Asset)
+def refresh_holdings_on_asset_save(sender, instance, raw=False, **kwargs):
+    previous = getattr(instance, "_summary_previous", None)
+    if raw or previous is None:
+        return
+    if (previous.price, previous.deleted_at) != (instance.price, instance.deleted_at):
+        refresh_asset_holders([instance.pk])
+
+
+@receiver(soft_delete_changed, sender=Asset)
+def refresh_holdings_on_asset_soft_delete(sender, ids, **kwargs):
+    refresh_asset_holders(ids)
+
+
+@receiver(pre_delete, sender=Asset)
+def remember_asset_holders(sender, instance, **kwargs):
+    # Deleting the asset sets the assignments' asset to NULL before post_delete.
+    instance._holders = list(
+        AssignAsset.objects.filter(asset=instance).values_list("employee_id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Asset)
+def refresh_holdings_on_asset_delete(sender, instance, **kwargs):
+    refresh_employee_holdings(getattr(instance, "_holders", []))
+
+
+@receiver(post_save, sender=AssignAsset)
+def record_assignment_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    record_asset_holders({getattr(instance, "_ledger_previous_asset", None), instance.asset_id})
+
+
+@receiver(post_delete, sender=AssignAsset)
+@receiver(post_delete, sender=Asset)
+def record_assignment_delete(sender, instance, **kwargs):
+    record_asset_holders([instance.asset_id if sender is AssignAsset else instance.pk])
+
+
+@receiver(post_save, sender=ClientAsset)
+def record_client_asset_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    record_client_asset_holders([instance.pk])
+
+
+@receiver(post_delete, sender=ClientAsset)
+def record_client_asset_delete(sender, instance, **kwargs):
+    record_client_asset_holders([instance.pk])
+
+
+@receiver(soft_delete_changed, sender=Asset)
+def record_asset_soft_delete(sender, ids, **kwargs):
+    record_asset_holders(ids)
+
+
+@receiver(soft_delete_changed, sender=ClientAsset)
+def record_client_asset_soft_delete(sender, ids, **kwargs):
+    record_client_asset_holders(ids)
+
+
+# Connected before the cache receiver below, so the snapshot version is bumped
+# first and a page recached after the cache bump is built from the new snapshot.
+@receiver(post_save, sender=Asset)
+@receiver(post_delete, sender=Asset)
+@receiver(soft_delete_changed, sender=Asset)
+@receiver(post_save, sender=AssetType)
+@receiver(post_delete, sender=AssetType)
+@receiver(post_delete, sender=Vendor)
+def invalidate_snapshot_on_write(sender, using=None, **kwargs):
+    transaction.on_commit(invalidate_asset_snapshot, using=using)
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_delete, sender=Asset)
+@receiver(post_save, sender=AssignAsset)
+@receiver(post_delete, sender=AssignAsset)
+@receiver(post_save, sender=ClientAsset)
+@receiver(post_delete, sender=ClientAsset)
+@receiver(post_save, sender=Vendor)
+@receiver(post_delete, sender=Vendor)
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+@receiver(post_save, sender=AssetType)
+@receiver(post_delete, sender=AssetType)
+@receiver(soft_delete_changed)
+def invalidate_cache_on_write(sender, using=None, **kwargs):
+    # Bumped once the write is committed: a page rebuilt between the bump and
+    # the commit would otherwise cache the old rows under the new version.
+    transaction.on_commit(invalidate_inventory_cache, using=using)
+
+
+@receiver(connection_created)
+def tune_sqlite_connection(sender, connection, **kwargs):
+    if connection.vendor == "sqlite":
+        configure_connection(connection)
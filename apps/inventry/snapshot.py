@@ -0,0 +1,215 @@
+"""
+Columnar in-memory snapshot of the asset table.
+
+With NumPy installed and ``INVENTORY_SNAPSHOT_ENABLED`` set, every worker
+process keeps the live ``Asset`` rows as a handful of compact arrays (about 41
+bytes per asset): price in cents, type, brand and spec codes, vendor id,
+assignment flag and purchase date. The grouped counts and price sums behind
+the per-type summaries (``get_type_summary`` in ``aggregations.py``, used by
+the vendor details page and the total/remaining asset pages) and the
+dashboard are then computed with ``numpy.bincount`` over those arrays instead
+of an SQL ``GROUP BY``.
+
+The snapshot is tagged with the snapshot version (see ``cache.py``), which
+asset and asset type writes bump once they commit, and is rebuilt on first
+use after such a write. The version is read before the rows, so a write that
+commits during a rebuild is picked up on the next call. Without NumPy (or with the setting off)
+``get_snapshot`` returns ``None`` and callers fall back to their queries.
+"""
+
+# Python Imports
+import threading
+from decimal import Decimal
+
+# Django Imports
+from django.conf import settings
+from django.db import connections
+from django.db.models import F, Func, IntegerField
+from django.db.models.functions import Cast, Coalesce, Round
+
+# Project Imports
+from .cache import get_snapshot_version
+from .models import SPEC_FIELDS, Asset, AssetType
+
+# Third Party Imports
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+
+SNAPSHOT_COLUMNS = (
+    "id", "asset_type_id", "asset_brand", "cents", "vendor_code", "assigned", "day", *SPEC_FIELDS,
+)
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+NO_DATE = -(2 ** 31)
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+def is_enabled() -> bool:
+    return np is not None and getattr(settings, "INVENTORY_SNAPSHOT_ENABLED", False)
+
+
+def _codes(values, dtype):
+    """
+    Encode ``values`` as integer codes into a sorted list of the distinct values.
+    """
+    labels = sorted(set(values) - {None})
+    index = {label: code for code, label in enumerate(labels)}
+    index[None] = -1
+    codes = np.fromiter(map(index.__getitem__, values), dtype=dtype, count=len(values))
+    return codes, labels
+
+
+class AssetSnapshot:
+    """
+    The live assets as parallel arrays, one element per asset, ordered by vendor.
+
+    Attributes:
+        version: The snapshot version the snapshot was built at.
+        price_cents (float64, whole cents), type_code (int16), brand_code
+        (int32), vendor_id (int32, -1 without vendor, ascending), is_assign
+        (bool), purchase_day (int32 days since 1970-01-01, ``NO_DATE`` if
+        unknown), specs (dict of the int16 ``SpecField`` codes per field in
+        ``SPEC_FIELDS``) and group_key (int32 (type, brand, is_assign) group
+        of each asset).
+    """
+
+    def __init__(self, version, columns, type_names):
+        self.version = version
+        ids, type_ids, brands, cents, vendors, assigned, days, *specs = columns
+        # Rows arrive in primary key order; a stable sort groups them by vendor.
+        order = np.argsort(np.array(vendors, dtype=np.int32), kind="stable")
+        self.ids = np.array(ids, dtype=np.int32)[order]
+        # Whole cents are exact in a float64 and bincount sums float64 weights without a copy.
+        self.price_cents = np.array(cents, dtype=np.float64)[order]
+        type_code, type_labels = _codes(type_ids, np.int16)
+        self.type_code = type_code[order]
+        self.type_names = [type_names.get(type_id) for type_id in type_labels]
+        brand_code, self.brands = _codes(brands, np.int32)
+        self.brand_code = brand_code[order]
+        self.vendor_id = np.array(vendors, dtype=np.int32)[order]
+        self.is_assign = np.array(assigned, dtype=bool)[order]
+        self.purchase_day = np.array(days, dtype=np.int32)[order]
+        # Spec columns already hold small codes (see ``SpecField``), 0 when blank.
+        self.specs = {
+            field: np.array(values, dtype=np.int16)[order] for field, values in zip(SPEC_FIELDS, specs)
+        }
+        self.spec_labels = {field: Asset._meta.get_field(field).values for field in SPEC_FIELDS}
+
+        # Type code -1 (no type) takes slot 0, like the NULLs the query sorts first.
+        self.brand_count = max(len(self.brands), 1)
+        self.group_count = (len(self.type_names) + 1) * self.brand_count
+        self.group_key = (
+            ((self.type_code.astype(np.int32) + 1) * self.brand_count + self.brand_code) * 2
+            + self.is_assign
+        ).astype(np.int32)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [
+            self.ids, self.price_cents, self.type_code, self.brand_code, self.vendor_id,
+            self.is_assign, self.purchase_day, self.group_key, *self.specs.values(),
+        ]
+        return sum(array.nbytes for array in arrays)
+
+    def vendor_slice(self, vendor):
+        vendor_id = int(getattr(vendor, "pk", vendor))
+        start, stop = np.searchsorted(self.vendor_id, [vendor_id, vendor_id + 1])
+        return slice(start, stop)
+
+    def asset_groups(self, vendor=None, is_assign=None) -> list:
+        """
+        Return the rows of ``aggregations.get_asset_groups`` for the selected assets.
+        """
+        rows = slice(None) if vendor is None else self.vendor_slice(vendor)
+        keys = self.group_key[rows]
+        # Column 0 holds the unassigned assets of a group, column 1 the assigned ones.
+        counts = np.bincount(keys, minlength=self.group_count * 2).reshape(-1, 2)
+        prices = np.bincount(
+            keys, weights=self.price_cents[rows], minlength=self.group_count * 2
+        ).reshape(-1, 2)
+        if is_assign is not None:
+            selected = int(bool(is_assign))
+            counts[:, 1 - selected] = 0
+            prices[:, 1 - selected] = 0
+
+        names = [None] + self.type_names
+        groups = []
+        for group in np.flatnonzero(counts.sum(axis=1)):
+            slot, brand = divmod(int(group), self.brand_count)
+            remaining = int(counts[group, 0])
+            groups.append({
+                "asset_type__asset_name": names[slot],
+                "asset_brand": self.brands[brand],
+                "count": int(counts[group].sum()),
+                "remaining": remaining,
+                "asset_price": _to_money(prices[group].sum()),
+                "remaining_price": _to_money(prices[group, 0]) if remaining else None,
+            })
+        groups.sort(key=lambda group: (
+            group["asset_type__asset_name"] is not None,
+            group["asset_type__asset_name"] or "",
+            group["asset_brand"],
+        ))
+        return groups
+
+
+def _to_money(cents):
+    return Decimal(int(round(cents))).scaleb(-2)
+
+
+def build_snapshot(version=None) -> AssetSnapshot:
+    """
+    Read the live assets into a new ``AssetSnapshot``.
+    """
+    if version is None:
+        version = get_snapshot_version()
+    # SQLite turns prices, dates and flags into integers and the rows are read
+    # with a plain cursor, skipping Django's per-value converters, which made up
+    # most of the build time.
+    queryset = Asset.objects.order_by("id").annotate(
+        cents=Cast(Round(F("price") * 100), IntegerField()),
+        vendor_code=Coalesce("vendor_id", -1),
+        assigned=Cast("is_assign", IntegerField()),
+        day=Coalesce(Cast(
+            Func("purchase_date", function="julianday") - UNIX_EPOCH_JULIAN_DAY,
+            IntegerField(),
+        ), NO_DATE),
+    ).values_list(*SNAPSHOT_COLUMNS)
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        rows = cursor.fetchall()
+    # Django selects the annotations after the fields, whatever order values_list() names them in.
+    columns = dict(zip(names, zip(*rows))) if rows else dict.fromkeys(names, ())
+    type_names = dict(AssetType.objects.values_list("id", "asset_name"))
+    return AssetSnapshot(version, [columns[name] for name in SNAPSHOT_COLUMNS], type_names)
+
+
+def get_snapshot():
+    """
+    Return this process's snapshot, rebuilt if the assets changed, or ``None`` when disabled.
+    """
+    global _snapshot
+    if not is_enabled():
+        return None
+    version = get_snapshot_version()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    with _lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = build_snapshot(version)
+        return _snapshot
+
+
+def clear_snapshot():
+    global _snapshot
+    _snapshot = None
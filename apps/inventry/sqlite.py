@@ -0,0 +1,100 @@
+"""
+SQLite connection tuning.
+
+``configure_connection`` runs on every new SQLite connection (see the
+``connection_created`` receiver in ``signals.py``) and applies the pragmas in
+``settings.SQLITE_PRAGMAS``. The defaults switch the database to WAL so
+readers no longer block on a writer, relax ``synchronous`` to ``NORMAL``
+(still safe in WAL mode), enlarge the page cache and memory map and make
+writers wait ``busy_timeout`` milliseconds for the lock instead of failing
+with "database is locked".
+
+Statistics are refreshed with ``ANALYZE``/``PRAGMA optimize`` at most once
+per ``SQLITE_OPTIMIZE_INTERVAL`` seconds across all workers (the shared cache
+decides which connection does it), or on demand with the
+``optimize_database`` command.
+
+Code that writes opens its transaction with ``atomic_write`` instead of
+``transaction.atomic``. SQLite's default deferred ``BEGIN`` only asks for the
+write lock at the first write, and when another connection committed in the
+meantime it fails at once with "database is locked" instead of waiting for
+``busy_timeout``. ``atomic_write`` starts the transaction with ``BEGIN
+IMMEDIATE`` (see ``backends/sqlite3``), so writers queue on the lock, while
+read-only transactions keep the deferred ``BEGIN`` and never wait for one.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+# Project Imports
+
+
+OPTIMIZE_KEY = "inventory:sqlite:optimized"
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+}
+
+
+def get_pragmas() -> dict:
+    return getattr(settings, "SQLITE_PRAGMAS", DEFAULT_PRAGMAS)
+
+
+def configure_connection(connection):
+    """
+    Apply ``SQLITE_PRAGMAS`` to a new connection and run the periodic optimize when due.
+    """
+    # Use the DB-API connection so the pragmas are not counted as request queries.
+    for name, value in get_pragmas().items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
+    interval = getattr(settings, "SQLITE_OPTIMIZE_INTERVAL", None)
+    if interval and cache.add(OPTIMIZE_KEY, True, timeout=interval):
+        optimize_database(connection)
+
+
+def optimize_database(connection, analysis_limit=1000):
+    """
+    Refresh the query planner statistics.
+
+    Args:
+        connection: The SQLite database connection.
+        analysis_limit (int): Rows sampled per index by ``ANALYZE``; 0 scans everything.
+    """
+    db = connection.connection
+    db.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+    db.execute("ANALYZE")
+    db.execute("PRAGMA optimize")
+
+
+class AtomicWrite(transaction.Atomic):
+    """
+    ``transaction.Atomic`` that takes the write lock when it opens the transaction.
+    """
+
+    def __enter__(self):
+        connection = transaction.get_connection(self.using)
+        # Only read when the outermost block starts the transaction; nested
+        # blocks run inside whatever transaction is already open.
+        connection.begin_immediate = True
+        try:
+            super().__enter__()
+        finally:
+            connection.begin_immediate = False
+
+
+def atomic_write(using=None, savepoint=True, durable=False):
+    """
+    ``transaction.atomic`` for blocks that write; usable as a decorator too.
+    """
+    if callable(using):
+        return AtomicWrite(DEFAULT_DB_ALIAS, savepoint, durable)(using)
+    return AtomicWrite(using, savepoint, durable)
@@ -0,0 +1,145 @@
+"""
+Per-page static bundles.
+
+``settings.STATIC_BUNDLES`` names groups of static files that pages load
+together (``core`` on every page, ``datatables`` on the table pages, ...).
+``BundleFinder`` concatenates each group into ``bundles/<name>.css`` and
+``bundles/<name>.js``, so a page downloads one stylesheet and one script per
+group instead of a file per library. The bundles are ordinary static files:
+``runserver`` serves them through the finder and ``collectstatic`` copies
+them to ``STATIC_ROOT``, where the manifest storage hashes their names and
+WhiteNoise serves them with gzip/brotli variants and far-future cache
+headers. Relative ``url()`` references in the bundled stylesheets are
+rewritten to point at the original files, which are collected (and hashed)
+as usual.
+
+Templates include the bundles with the ``{% bundle_css %}`` and
+``{% bundle_js %}`` tags from ``templatetags/bundles.py``.
+"""
+
+# Python Imports
+import hashlib
+import json
+import os
+import posixpath
+import re
+import tempfile
+
+# Django Imports
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+
+# Project Imports
+
+
+BUNDLE_DIR = "bundles"
+EXTENSIONS = ("css", "js")
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+SOURCE_MAP_RE = re.compile(r"^\s*(?://|/\*)# sourceMappingURL=.*$", re.MULTILINE)
+
+
+def get_bundles() -> dict:
+    return getattr(settings, "STATIC_BUNDLES", {})
+
+
+def bundle_path(name, extension):
+    """
+    Return the static path of bundle ``name``'s ``extension`` file.
+    """
+    if extension not in get_bundles().get(name, {}):
+        raise ImproperlyConfigured(f"STATIC_BUNDLES has no {extension} files for {name!r}.")
+    return f"{BUNDLE_DIR}/{name}.{extension}"
+
+
+def rewrite_css_urls(css, source):
+    """
+    Make the relative ``url()`` references of ``source`` relative to the bundle directory.
+    """
+    source_dir = posixpath.dirname(source)
+
+    def rewrite(match):
+        quote, url = match.groups()
+        if url.startswith(("/", "#", "data:")) or "://" in url:
+            return match.group(0)
+        path, _, query = url.partition("?")
+        target = posixpath.relpath(posixpath.normpath(posixpath.join(source_dir, path)), BUNDLE_DIR)
+        return f"url({quote}{target}{'?' + query if query else ''}{quote})"
+
+    return CSS_URL_RE.sub(rewrite, css)
+
+
+def build_bundle(sources, extension) -> str:
+    """
+    Concatenate the static files ``sources`` into one stylesheet or script.
+    """
+    parts = []
+    for source in sources:
+        path = finders.find(source)
+        if not path:
+            raise ImproperlyConfigured(f"Static file {source!r} of STATIC_BUNDLES was not found.")
+        with open(path, encoding="utf-8") as source_file:
+            content = SOURCE_MAP_RE.sub("", source_file.read()).strip()
+        if extension == "css":
+            content = rewrite_css_urls(content, source)
+        parts.append(f"/* {source} */\n{content}")
+    # A script that does not end with a semicolon must not run into the next one.
+    return (";\n" if extension == "js" else "\n").join(parts) + "\n"
+
+
+class BundleFinder(BaseFinder):
+    """
+    Staticfiles finder building the ``STATIC_BUNDLES`` on demand.
+
+    Bundles are written below ``STATIC_BUNDLE_ROOT`` (a temporary directory by
+    default), in a directory named after the bundle configuration, and rebuilt
+    when one of their sources is newer.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        config = json.dumps(get_bundles(), sort_keys=True).encode()
+        root = getattr(
+            settings, "STATIC_BUNDLE_ROOT", os.path.join(tempfile.gettempdir(), "inventry-bundles")
+        )
+        self.storage = FileSystemStorage(
+            location=os.path.join(root, hashlib.sha1(config).hexdigest()[:12])
+        )
+
+    def check(self, **kwargs):
+        return []
+
+    def build(self, name, extension):
+        sources = get_bundles()[name][extension]
+        path = bundle_path(name, extension)
+        target = self.storage.path(path)
+        source_paths = [finders.find(source) or source for source in sources]
+        if os.path.exists(target) and all(
+            os.path.exists(source) and os.path.getmtime(source) <= os.path.getmtime(target)
+            for source in source_paths
+        ):
+            return target
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Write next to the target and rename, so concurrent workers never read a partial bundle.
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(target))
+        with os.fdopen(fd, "w", encoding="utf-8") as bundle_file:
+            bundle_file.write(build_bundle(sources, extension))
+        os.replace(temporary, target)
+        return target
+
+    def find(self, path, all=False):
+        directory, _, filename = path.partition("/")
+        name, _, extension = filename.rpartition(".")
+        if directory != BUNDLE_DIR or extension not in get_bundles().get(name, {}):
+            return [] if all else None
+        target = self.build(name, extension)
+        return [target] if all else target
+
+    def list(self, ignore_patterns):
+        for name, files in get_bundles().items():
+            for extension in EXTENSIONS:
+                if extension in files:
+                    self.build(name, extension)
+                    yield bundle_path(name, extension), self.storage
@@ -0,0 +1,177 @@
+"""
+Materialized inventory summary.
+
+``InventorySummary`` holds one row per (asset type, brand, vendor) with the
+count, assigned count and price sums of the live (not soft-deleted) assets. Rows are adjusted incrementally
+from the ``Asset`` signals in ``signals.py``; writes that bypass signals
+(queryset ``update()``/``delete()``) must call ``refresh_inventory_summary``
+with the affected assets. ``rebuild_inventory_summary`` recomputes the whole
+table from live data and ``check_inventory_summary`` reports any drift.
+"""
+
+# Python Imports
+from decimal import Decimal
+
+# Django Imports
+from django.db.models import Count, F, Q, Sum
+
+# Project Imports
+from .models import Asset, InventorySummary
+from .sqlite import atomic_write
+
+
+SUMMARY_FIELDS = ("count", "assigned_count", "price_sum", "assigned_price_sum")
+
+
+def summary_key(asset) -> tuple:
+    """
+    Return the (asset type id, brand, vendor id) key an asset is counted under.
+    """
+    return (asset.asset_type_id, asset.asset_brand, asset.vendor_id)
+
+
+def summary_values(asset) -> dict:
+    """
+    Return the contribution of a single asset to its summary row.
+    """
+    price = Decimal(asset.price or 0)
+    assigned = bool(asset.is_assign)
+    return {
+        "count": 1,
+        "assigned_count": int(assigned),
+        "price_sum": price,
+        "assigned_price_sum": price if assigned else Decimal(0),
+    }
+
+
+def _key_filter(key) -> dict:
+    asset_type_id, asset_brand, vendor_id = key
+    return {"asset_type_id": asset_type_id, "asset_brand": asset_brand, "vendor_id": vendor_id}
+
+
+def apply_summary_delta(key, values, sign=1):
+    """
+    Add (``sign=1``) or remove (``sign=-1``) an asset contribution to the row for ``key``.
+    """
+    delta = {field: F(field) + sign * values[field] for field in SUMMARY_FIELDS}
+    with atomic_write():
+        updated = InventorySummary.objects.filter(**_key_filter(key)).update(**delta)
+        if not updated:
+            summary, _ = InventorySummary.objects.get_or_create(**_key_filter(key))
+            InventorySummary.objects.filter(pk=summary.pk).update(**delta)
+
+
+def move_asset(previous, asset):
+    """
+    Move an asset's contribution from its previous state to its current one.
+
+    ``previous`` is the asset as stored before the write, or ``None`` on create.
+    Soft-deleted assets do not contribute.
+    """
+    if previous is not None and previous.deleted_at is not None:
+        previous = None
+    if asset.deleted_at is not None:
+        if previous is not None:
+            remove_asset(previous)
+        return
+    if previous is not None:
+        old_key, old_values = summary_key(previous), summary_values(previous)
+        new_key, new_values = summary_key(asset), summary_values(asset)
+        if old_key == new_key and old_values == new_values:
+            return
+        apply_summary_delta(old_key, old_values, sign=-1)
+    apply_summary_delta(summary_key(asset), summary_values(asset))
+
+
+def remove_asset(asset):
+    """
+    Remove a deleted asset's contribution from the summary.
+
+    A soft-deleted asset's contribution was removed when it was soft-deleted,
+    so purging it changes nothing.
+    """
+    if asset.deleted_at is not None:
+        return
+    apply_summary_delta(summary_key(asset), summary_values(asset), sign=-1)
+
+
+def _live_groups(queryset):
+    assigned = Q(is_assign=True)
+    rows = (
+        queryset.order_by()
+        .values("asset_type_id", "asset_brand", "vendor_id")
+        .annotate(
+            count=Count("id"),
+            assigned_count=Count("id", filter=assigned),
+            price_sum=Sum("price"),
+            assigned_price_sum=Sum("price", filter=assigned),
+        )
+    )
+    groups = {}
+    for row in rows:
+        key = (row["asset_type_id"], row["asset_brand"], row["vendor_id"])
+        groups[key] = {field: row[field] or 0 for field in SUMMARY_FIELDS}
+    return groups
+
+
+def _stored_groups(queryset):
+    groups = {}
+    for row in queryset.values("asset_type_id", "asset_brand", "vendor_id", *SUMMARY_FIELDS):
+        key = (row["asset_type_id"], row["asset_brand"], row["vendor_id"])
+        groups[key] = {field: row[field] for field in SUMMARY_FIELDS}
+    return groups
+
+
+def refresh_inventory_summary(keys):
+    """
+    Recompute the summary rows for ``keys`` from live data.
+
+    Used after queryset writes that do not send model signals.
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    key_filter = Q()
+    for key in keys:
+        key_filter |= Q(**_key_filter(key))
+    live = _live_groups(Asset.objects.filter(key_filter))
+    with atomic_write():
+        InventorySummary.objects.filter(key_filter).delete()
+        InventorySummary.objects.bulk_create(
+            InventorySummary(**_key_filter(key), **values) for key, values in live.items()
+        )
+
+
+def rebuild_inventory_summary() -> int:
+    """
+    Replace the whole summary table with groups computed from live ``Asset`` rows.
+
+    Returns:
+        int: The number of summary rows written.
+    """
+    live = _live_groups(Asset.objects.all())
+    with atomic_write():
+        InventorySummary.objects.all().delete()
+        InventorySummary.objects.bulk_create(
+            InventorySummary(**_key_filter(key), **values) for key, values in live.items()
+        )
+    return len(live)
+
+
+def check_inventory_summary() -> list:
+    """
+    Compare the summary table with live ``Asset`` data.
+
+    Returns:
+        list: ``(key, stored, live)`` tuples for every row that has drifted.
+    """
+    live = _live_groups(Asset.objects.all())
+    stored = _stored_groups(InventorySummary.objects.all())
+    empty = {field: 0 for field in SUMMARY_FIELDS}
+    drift = []
+    for key in set(live) | set(stored):
+        stored_values = stored.get(key, empty)
+        live_values = live.get(key, empty)
+        if stored_values != live_values:
+            drift.append((key, stored_values, live_values))
+    return drift
@@ -0,0 +1,42 @@
+"""
+Template tags including the ``STATIC_BUNDLES`` built by ``staticfiles.BundleFinder``.
+
+    {% load bundles %}
+    {% bundle_css "datatables" %}
+    {% bundle_js "datatables" lazy="pdfmake" %}
+"""
+
+# Python Imports
+
+# Django Imports
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+# Project Imports
+from ..staticfiles import bundle_path
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle_css(name):
+    return format_html('<link href="{}" rel="stylesheet">', static(bundle_path(name, "css")))
+
+
+@register.simple_tag
+def bundle_js(name, defer=True, lazy=""):
+    """
+    Include a script bundle, deferred unless inline scripts need it while the page is parsed.
+
+    ``lazy`` names bundles the script loads itself when needed; their URLs are
+    passed in ``data-<bundle>`` attributes.
+    """
+    attributes = format_html_join(
+        "", ' data-{}="{}"', ((other, static(bundle_path(other, "js"))) for other in lazy.split(",") if other)
+    )
+    return format_html(
+        '<script src="{}"{}{}></script>',
+        static(bundle_path(name, "js")), " defer" if defer else "", attributes,
+    )
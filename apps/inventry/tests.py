@@ -1,3 +1,1390 @@
-from django.test import TestCase
+# Python Imports
+import csv
+import io
+import json
+import re
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
 
-# Create your tests here.
+# Django Imports
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.template.backends.django import Template as DjangoTemplate
+from django.utils import timezone
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Project Imports
+from .middleware import RequestProfile
+from .models import (
+    Asset, AssetType, AssignAsset, AssignmentCheckpoint, AssignmentEvent, ClientAsset,
+    DailyActivity, Employee, InventorySummary, SPEC_FIELDS, User, Vendor,
+)
+from .search import rebuild_search_index, search
+from .seed import flush_inventory, seed_inventory
+from .admin import AssetResource, ClientAssetResource
+from .aggregations import get_asset_groups
+from .cache import cached, get_cache_version, get_snapshot_version
+from .datatables import DataTableView
+from .exports import XLSX_CONTENT_TYPE
+from .facets import faceted_search
+from .forms import AssetForm, EmployeeForm
+from .holdings import check_employee_holdings
+from .importers import import_assets
+from .ledger import check_assignment_ledger, create_checkpoint, holdings_at
+from .rollups import check_daily_activity
+from .services import assign_assets, offboard_employees, purge_deleted
+from .snapshot import clear_snapshot, get_snapshot, np
+from .sqlite import atomic_write
+from .staticfiles import BundleFinder
+from .summary import check_inventory_summary
+
+# Third Party Imports
+from openpyxl import load_workbook
+from prometheus_client import REGISTRY
+
+
+FULL_SCAN = re.compile(r"\bSCAN (?:TABLE )?(inventry_\w+)(?: AS \w+)?\s*$")
+
+
+class HotQueryPlanTests(TestCase):
+    """
+    Check that the hot filters in views.py are answered from an index
+    rather than a full table scan.
+    """
+
+    def assertUsesIndex(self, queryset):
+        plan = queryset.explain()
+        scans = [line for line in plan.splitlines() if FULL_SCAN.search(line)]
+        self.assertEqual(scans, [], f"full table scan in query plan:\n{plan}")
+
+    def test_asset_queries(self):
+        self.assertUsesIndex(Asset.objects.filter(is_assign=False))
+        self.assertUsesIndex(Asset.objects.filter(asset_brand="Dell"))
+        self.assertUsesIndex(Asset.objects.filter(asset_brand="Dell", is_assign=False))
+        self.assertUsesIndex(Asset.objects.filter(is_assign=False).values("asset_type"))
+        self.assertUsesIndex(Asset.objects.filter(payment_status="due"))
+        self.assertUsesIndex(Asset.objects.filter(vendor=1, is_assign=True))
+        self.assertUsesIndex(Asset.objects.filter(asset_type__asset_name="Laptop"))
+        self.assertUsesIndex(
+            Asset.objects.filter(asset_type__asset_name="Laptop", is_assign=False)
+        )
+        self.assertUsesIndex(
+            Asset.objects.filter(asset_type__asset_name="Laptop", vendor__id=1)
+        )
+
+    def test_assign_asset_queries(self):
+        today = date.today()
+        self.assertUsesIndex(AssignAsset.objects.filter(created_at=today))
+        self.assertUsesIndex(AssignAsset.objects.filter(created_at=today - timedelta(1)))
+        self.assertUsesIndex(AssignAsset.objects.filter(employee__email="a@b.com"))
+        self.assertUsesIndex(AssignAsset.objects.filter(employee__id=1, asset__id=1))
+
+    def test_client_employee_and_vendor_queries(self):
+        self.assertUsesIndex(ClientAsset.objects.filter(is_dispatch=True))
+        self.assertUsesIndex(ClientAsset.objects.filter(is_dispatch=False))
+        self.assertUsesIndex(ClientAsset.objects.filter(employee=1, is_dispatch=False))
+        self.assertUsesIndex(Employee.objects.all())
+        self.assertUsesIndex(Employee.objects.filter(employee_id="42"))
+        self.assertUsesIndex(Vendor.objects.order_by("created_at"))
+        self.assertUsesIndex(Asset.all_objects.dead().filter(deleted_at__lt=timezone.now()))
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+class ViewQueryCountTests(TestCase):
+    """
+    Render every list and detail view against a small and a large inventory and
+    check that the number of SQL queries does not grow with the number of rows.
+    """
+
+    SIZES = (10, 1000)
+    BRANDS = ("Dell", "HP", "Apple")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.vendor = Vendor.objects.create(
+            first_name="Vendor", last_name="One", email="vendor@example.com",
+            mobile_number=1234567890,
+        )
+        cls.employee = Employee.objects.create(
+            first_name="First", last_name="Employee", email="first@example.com",
+            employee_id="1", mobile_number=1234567890,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.seeded = 0
+
+    def seed(self, size):
+        """
+        Grow the inventory to ``size`` employees, assets, assignments and client assets.
+        """
+        start, self.seeded = self.seeded, size
+        Employee.objects.bulk_create(
+            Employee(
+                first_name=f"Employee{i}", last_name="Test", email=f"employee{i}@example.com",
+                employee_id=f"E{i}", mobile_number=1234567890,
+            )
+            for i in range(start, size)
+        )
+        Asset.objects.bulk_create(
+            Asset(
+                asset_type=self.asset_type, asset_brand=self.BRANDS[i % len(self.BRANDS)],
+                price=1000 + i, vendor=self.vendor, serial_number=f"SN{i}",
+                is_assign=i % 2 == 0,
+            )
+            for i in range(start, size)
+        )
+        # SQLite does not return primary keys from bulk_create, so read the rows back.
+        employees = Employee.objects.filter(employee_id__startswith="E").order_by("id")[start:]
+        assets = Asset.objects.order_by("id")[start:]
+        AssignAsset.objects.bulk_create(
+            AssignAsset(asset=asset, employee=self.employee if i % 4 == 0 else employee)
+            for i, (asset, employee) in enumerate(zip(assets, employees), start)
+            if asset.is_assign
+        )
+        ClientAsset.objects.bulk_create(
+            ClientAsset(
+                client_name=f"Client{i}", project="Project", configuration="16GB",
+                asset_brand=self.BRANDS[i % len(self.BRANDS)], asset_type=self.asset_type,
+                employee=self.employee if i % 4 == 0 else employee, project_owner="Owner",
+            )
+            for i, employee in enumerate(employees, start)
+        )
+
+    def view_urls(self):
+        assign = AssignAsset.objects.filter(employee=self.employee).first()
+        return [
+            reverse("dashboard"),
+            reverse("asset-list"),
+            reverse("employee-list"),
+            reverse("vendor-list"),
+            reverse("client-list"),
+            reverse("assign-assets-list"),
+            reverse("remaining-assets-list"),
+            reverse("asset-type-list"),
+            reverse("total_asset_detail"),
+            reverse("total_remaining_asset_detail"),
+            reverse("asset_detail", args=["Laptop"]),
+            reverse("asset_remaining_detail", args=["Laptop"]),
+            reverse("vendor_asset_detail", args=["Laptop", self.vendor.id]),
+            reverse("assets_record_list", args=["Laptop"]),
+            reverse("vendor_details", args=[self.vendor.id]),
+            reverse("employee_details", args=[self.employee.id]),
+            reverse("asset_details", args=[assign.asset_id]),
+            reverse("assign-asset-detail", args=[self.employee.id, assign.id]),
+            reverse("assign-asset-count", args=[self.employee.email]),
+            reverse("assign-asset-create"),
+            reverse("assign-asset-edit", args=[assign.id]),
+            reverse("client-create"),
+            reverse("client-update", args=[ClientAsset.objects.first().id]),
+            reverse("unassigned-asset-autocomplete"),
+            reverse("employee-autocomplete"),
+        ]
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return len(queries)
+
+    def test_query_count_is_constant(self):
+        counts = {}
+        for size in self.SIZES:
+            self.seed(size)
+            for url in self.view_urls():
+                counts.setdefault(url, []).append(self.count_queries(url))
+        for url, per_size in counts.items():
+            with self.subTest(url=url):
+                self.assertEqual(len(set(per_size)), 1, f"{url}: {dict(zip(self.SIZES, per_size))}")
+
+
+class SeedInventoryTests(TestCase):
+    """
+    The synthetic data generator must be deterministic so benchmark reports from
+    different commits measure the same data.
+    """
+
+    def snapshot(self):
+        return list(
+            Asset.objects.order_by("id").values_list(
+                "asset_type__asset_name", "asset_brand", "price", "vendor__email",
+                "is_assign", "assign_asset__employee__email",
+            )
+        )
+
+    def test_same_seed_gives_same_inventory(self):
+        counts = seed_inventory(300, seed=7)
+        self.assertEqual(counts["assets"], 300)
+        self.assertEqual(counts["assignments"], Asset.objects.filter(is_assign=True).count())
+        self.assertEqual(check_inventory_summary(), [])
+        first = self.snapshot()
+
+        flush_inventory()
+        seed_inventory(300, seed=7)
+        self.assertEqual(self.snapshot(), first)
+
+
+@override_settings(
+    PROFILING_ENABLED=True,
+    PROFILING_SAMPLE_RATE=1.0,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+)
+class ProfilingMiddlewareTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        seed_inventory(50)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_profiled_request_reports_timings_and_repeated_queries(self):
+        with self.assertLogs("apps.inventry.profiling", "INFO") as logs:
+            response = self.client.get(reverse("assign-asset-create"))
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=')
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["view"], "apps.inventry.views.CreateAssignAssetView")
+        self.assertGreater(record["template_ms"], 0)
+        self.assertLessEqual(len(record["slowest"]), 5)
+        self.assertEqual(record["similar"], [])
+
+        profile = RequestProfile()
+        with connection.execute_wrapper(profile):
+            for asset in Asset.objects.all()[:3]:
+                asset.asset_type
+        self.assertEqual(profile.repeated()["similar"][0]["count"], 3)
+
+    def test_template_rendering_is_not_patched(self):
+        self.assertIs(DjangoTemplate.render, DjangoTemplate.__dict__["render"])
+        self.assertEqual(DjangoTemplate.render.__module__, "django.template.backends.django")
+        with override_settings(PROFILING_ENABLED=False):
+            response = self.client.get(reverse("assign-asset-create"))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.0)
+    def test_unsampled_request_is_not_profiled(self):
+        response = self.client.get(reverse("dashboard"))
+        self.assertFalse(response.has_header("Server-Timing"))
+
+
+@override_settings(METRICS_TOKEN="scrape-token", METRICS_ALLOWED_IPS=[])
+class MetricsEndpointTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+
+    def test_metrics_expose_latency_by_url_name(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse("dashboard"))
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape-token"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(
+            response.content.decode(),
+            r'inventory_request_latency_seconds_count\{method="GET",url_name="dashboard"\} [1-9]',
+        )
+        self.assertIn('inventory_cache_lookups_total{result="miss"}', response.content.decode())
+
+    def test_metrics_are_internal(self):
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url, REMOTE_ADDR="203.0.113.5").status_code, 403)
+        # Behind a proxy every request comes from the loopback address.
+        self.assertEqual(self.client.get(url, REMOTE_ADDR="127.0.0.1").status_code, 403)
+        response = self.client.get(url, HTTP_AUTHORIZATION="Bearer wrong-token")
+        self.assertEqual(response.status_code, 403)
+
+        with override_settings(METRICS_ALLOWED_IPS=["10.0.0.5"]):
+            self.assertEqual(self.client.get(url, REMOTE_ADDR="10.0.0.5").status_code, 200)
+        with override_settings(METRICS_TOKEN=""):
+            response = self.client.get(url, HTTP_AUTHORIZATION="Bearer ")
+            self.assertEqual(response.status_code, 403)
+
+
+class SearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.vendor = Vendor.objects.create(
+            first_name="Northwind", last_name="Traders", email="vendor@example.com",
+            mobile_number=1234567890,
+        )
+        cls.asset = Asset.objects.create(
+            asset_type=cls.asset_type, asset_brand="Lenovo", vendor=cls.vendor, price=100,
+            serial_number="PF3XK92", system_configuration="i7 / 32GB / 1TB",
+        )
+        cls.employee = Employee.objects.create(
+            first_name="Zoë", last_name="Fernandes", email="zoe@example.com",
+            employee_id="EMP42", mobile_number=1234567890,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_signals_keep_the_index_in_sync(self):
+        response = self.client.get(reverse("global-search"), {"q": "pf3x"})
+        self.assertEqual(
+            [(hit["entity"], hit["id"]) for hit in response.json()["hits"]],
+            [("asset", self.asset.id)],
+        )
+        self.assertEqual(response.json()["hits"][0]["url"], reverse("asset_details", args=[self.asset.id]))
+
+        self.employee.last_name = "Pereira"
+        self.employee.save()
+        self.assertEqual(search("zoe fern")["total"], 0)
+        self.assertEqual(search("zoe per")["hits"][0]["id"], self.employee.id)
+
+        self.vendor.first_name = "Contoso"
+        self.vendor.save()
+        self.assertEqual(search("contoso 32gb", entities=["asset"])["total"], 1)
+
+        self.asset.delete()
+        self.assertEqual(search("pf3xk92")["total"], 0)
+
+    def test_type_filter_pages_and_counts(self):
+        for i in range(5):
+            Employee.objects.create(
+                first_name=f"Lenovo{i}", employee_id=f"L{i}", mobile_number=1234567890
+            )
+        url = reverse("global-search")
+        self.assertEqual(self.client.get(url, {"q": "lenovo"}).json()["total"], 6)
+
+        pages = [
+            self.client.get(
+                url, {"q": "lenovo", "type": "employee", "page": page, "page_size": 2}
+            ).json()
+            for page in (1, 2, 3, 4)
+        ]
+        self.assertEqual([page["total"] for page in pages], [5] * 4)
+        self.assertTrue(all(page["ranked"] for page in pages))
+        hits = [hit for page in pages for hit in page["hits"]]
+        self.assertEqual([len(page["hits"]) for page in pages], [2, 2, 1, 0])
+        self.assertEqual({hit["entity"] for hit in hits}, {"employee"})
+        self.assertEqual(len({hit["id"] for hit in hits}), 5)
+
+        response = self.client.get(url, {"q": "lenovo", "type": ["asset", "vendor"]})
+        self.assertEqual(response.json()["total"], 1)
+        self.assertEqual(search("lenovo", entities=["vendor"])["total"], 0)
+
+    def test_pickers_page_through_matching_objects(self):
+        def results(url_name, q):
+            response = self.client.get(reverse(url_name), {"q": q})
+            return [result["id"] for result in response.json()["results"]]
+
+        self.assertEqual(results("asset-autocomplete", "lenovo 32"), [str(self.asset.id)])
+        self.assertEqual(results("employee-email-autocomplete", "zoë"), ["zoe@example.com"])
+        with patch("apps.inventry.autocomplete.search_enabled", return_value=False):
+            self.assertEqual(results("asset-autocomplete", "pf3 "), [str(self.asset.id)])
+            self.assertEqual(results("employee-autocomplete", "fern"), [str(self.employee.id)])
+            self.assertEqual(results("employee-autocomplete", "andes"), [])
+
+        assign_assets([self.asset.id], self.employee)
+        self.assertEqual(results("asset-autocomplete", ""), [str(self.asset.id)])
+        self.assertEqual(results("unassigned-asset-autocomplete", ""), [])
+
+    def test_rebuild_matches_signal_maintained_index(self):
+        before = search("northwind", page_size=100)["hits"]
+        rebuild_search_index()
+        self.assertEqual(search("northwind", page_size=100)["hits"], before)
+        self.assertEqual(len(before), 2)
+
+
+class DataTableTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.vendor = Vendor.objects.create(first_name="Acme", mobile_number=1234567890)
+        laptop = AssetType.objects.create(asset_name="Laptop")
+        Asset.objects.bulk_create(
+            Asset(
+                asset_type=laptop, asset_brand="Dell" if i % 2 else "HP", price=100 + i,
+                vendor=cls.vendor, serial_number=f"SN{i:02}",
+            )
+            for i in range(25)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def page(self, url_name, **params):
+        response = self.client.get(reverse(url_name), {"draw": 3, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_pages_are_rendered_from_the_data_endpoints(self):
+        html = self.client.get(reverse("asset-list")).content.decode()
+        self.assertIn(f'data-url="{reverse("asset-list-data")}"', html)
+        self.assertNotIn("SN00", html)
+
+    def test_paging_and_counts(self):
+        page = self.page("asset-list-data", start=20, length=10)
+        self.assertEqual(page["draw"], 3)
+        self.assertEqual((page["recordsTotal"], page["recordsFiltered"]), (25, 25))
+        self.assertEqual(len(page["data"]), 5)
+        self.assertEqual(len(self.page("asset-list-data", length=100000)["data"]), 25)
+
+    def test_ordering_is_limited_to_the_whitelisted_columns(self):
+        page = self.page(
+            "remaining-assets-list-data", length=1,
+            **{"order[0][column]": 2, "order[0][dir]": "desc"},
+        )
+        self.assertEqual(page["data"][0]["price"], "124.00")
+        # Unknown columns fall back to the default order instead of sorting by them.
+        page = self.page("asset-list-data", length=1, **{"order[0][column]": 99})
+        self.assertEqual(page["data"][0]["serial_number"], "SN00")
+
+    def test_search_narrows_records_filtered(self):
+        rebuild_search_index()
+        page = self.page("asset-list-data", **{"search[value]": "dell"})
+        self.assertEqual((page["recordsTotal"], page["recordsFiltered"]), (25, 12))
+        page = self.page("remaining-assets-list-data", **{"search[value]": "SN1"})
+        self.assertEqual(page["recordsFiltered"], 10)
+
+    def test_missing_name_parts_are_left_out(self):
+        page = self.page("vendor-list-data")
+        self.assertEqual(page["data"][0]["name"], "Acme")
+        self.assertEqual(self.page("asset-list-data")["data"][0]["vendor"], "Acme")
+
+    def test_rows_come_from_the_model_or_queryset(self):
+        self.assertEqual(self.page("remaining-assets-list-data")["recordsTotal"], 25)
+        # The class-level queryset is evaluated afresh for every request.
+        Asset.objects.filter(serial_number="SN00").update(is_assign=True)
+        self.assertEqual(self.page("remaining-assets-list-data")["recordsTotal"], 24)
+        self.assertEqual(self.page("asset-list-data")["recordsTotal"], 25)
+        with self.assertRaisesMessage(ImproperlyConfigured, "DataTableView is missing a queryset"):
+            DataTableView().get_queryset()
+
+
+class AssetImportTests(TestCase):
+
+    HEADER = "asset_type,brand,price,vendor,serial_number,purchase_date,ram\n"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.vendor = Vendor.objects.create(first_name="Acme", mobile_number=1234567890)
+        cls.employee = Employee.objects.create(first_name="Holder", mobile_number=1234567890)
+        cls.held = Asset.objects.create(
+            asset_type=cls.asset_type, asset_brand="Dell", price=100, serial_number="SN1",
+        )
+        assign_assets([cls.held.id], cls.employee)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def csv(self, *rows):
+        return io.StringIO(self.HEADER + "".join(f"{row}\n" for row in rows))
+
+    def assertConsistent(self):
+        self.assertEqual(check_inventory_summary(), [])
+        self.assertEqual(check_employee_holdings(), [])
+        self.assertEqual(check_daily_activity(), [])
+
+    def test_creates_and_updates_by_serial_number(self):
+        report = import_assets(self.csv(
+            "Laptop,HP,250,Acme,SN2,05-03-2024,16GB",
+            "Laptop,Dell,300,,SN3,2024-03-06,",
+            "Laptop,Dell,175.5,,SN1,,",
+        ), "assets.csv")
+        self.assertEqual((report.created, report.updated, report.errors), (2, 1, []))
+
+        created = Asset.objects.get(serial_number="SN2")
+        self.assertEqual(created.purchase_date, date(2024, 3, 5))
+        self.assertEqual((created.vendor, created.ram), (self.vendor, "16GB"))
+        self.assertEqual(Asset.objects.get(serial_number="SN3").purchase_date, date(2024, 3, 6))
+        self.held.refresh_from_db()
+        self.assertEqual(self.held.price, Decimal("175.50"))
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.held_value, Decimal("175.50"))
+        self.assertConsistent()
+
+    def test_rejected_rows_are_reported_and_not_written(self):
+        report = import_assets(self.csv(
+            "Laptop,HP,250,,SN2,31-02-2024,",
+            "Desktop,HP,250,,SN3,,",
+            "Laptop,HP,cheap,,SN4,,",
+            "Laptop,HP,250,Nobody,SN5,,",
+            "Laptop,HP,250,,SN6,,128GB",
+            "Laptop,HP,250,,SN7,,",
+        ), "assets.csv")
+        self.assertEqual([row for row, _ in report.errors], [2, 3, 4, 5, 6])
+        self.assertIn("invalid purchase_date '31-02-2024'", report.errors[0][1])
+        self.assertEqual(report.created, 1)
+        self.assertEqual(
+            set(Asset.objects.values_list("serial_number", flat=True)), {"SN1", "SN7"}
+        )
+        self.assertConsistent()
+
+    def test_dry_run_writes_nothing(self):
+        report = import_assets(
+            self.csv("Laptop,HP,250,,SN2,05-03-2024,", "Laptop,Dell,90,,SN1,,"),
+            "assets.csv", dry_run=True,
+        )
+        self.assertEqual((report.created, report.updated), (1, 1))
+        self.assertEqual(Asset.objects.count(), 1)
+        self.assertEqual(report.changes, [(3, "SN1", {"price": (Decimal("100.00"), Decimal("90.00"))})])
+
+    def test_admin_export_round_trips_spec_values(self):
+        self.held.refresh_from_db()
+        self.held.ram, self.held.processor, self.held.operating_system = "16GB", "i7", "MAC OS"
+        self.held.save()
+        client_asset = ClientAsset.objects.create(
+            client_name="Acme", project="Portal", asset_brand="Dell", employee=self.employee,
+            project_owner="Owner", ram="8GB", storage="128",
+        )
+        for resource, instance, changed in (
+            (AssetResource(), self.held, {"ram": "32GB"}),
+            (ClientAssetResource(), client_asset, {"ssd": "256"}),
+        ):
+            dataset = resource.export()
+            row = dataset.dict[0]
+            self.assertEqual(row["ram"], "16GB" if instance is self.held else "8GB")
+            row.update(changed)
+            dataset.dict = [row]
+            result = resource.import_data(dataset, dry_run=False, raise_errors=True)
+            self.assertFalse(result.has_errors() or result.has_validation_errors())
+            instance.refresh_from_db()
+            for field, value in row.items():
+                if field in SPEC_FIELDS:
+                    self.assertEqual(getattr(instance, field), value)
+        self.assertEqual((self.held.ram, self.held.operating_system), ("32GB", "MAC OS"))
+        self.assertEqual((client_asset.ssd, client_asset.storage), ("256", "128"))
+        self.assertConsistent()
+
+    def test_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as file:
+            file.write(self.csv("Laptop,HP,250,,SN2,05-03-2024,", "Laptop,HP,x,,SN3,,").getvalue())
+            file.flush()
+            stdout, stderr = io.StringIO(), io.StringIO()
+            call_command("import_assets", file.name, stdout=stdout, stderr=stderr)
+        self.assertIn("Import created 1, updated 0", stdout.getvalue())
+        self.assertIn("row 3: invalid price 'x'", stderr.getvalue())
+        self.assertEqual(
+            Asset.objects.get(serial_number="SN2").purchase_date, date(2024, 3, 5)
+        )
+        self.assertConsistent()
+
+    def test_view(self):
+        upload = SimpleUploadedFile(
+            "assets.csv", self.csv("Laptop,HP,250,,SN2,05-03-2024,").getvalue().encode()
+        )
+        response = self.client.post(
+            reverse("asset-import"), {"file": upload, "chunk_size": 100},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["report"].created, 1)
+        self.assertEqual(
+            Asset.objects.get(serial_number="SN2").purchase_date, date(2024, 3, 5)
+        )
+        self.assertConsistent()
+
+
+class ExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.assets = [
+            Asset.objects.create(
+                asset_type=asset_type, asset_brand="Dell", price=100 + i, serial_number=f"SN{i}",
+            )
+            for i in range(5)
+        ]
+        employee = Employee.objects.create(first_name="Holder", mobile_number=1234567890)
+        assign_assets([cls.assets[0].id, cls.assets[1].id], employee)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def export(self, resource, file_format):
+        return self.client.get(reverse("export", args=[resource, file_format]))
+
+    def test_csv_is_streamed(self):
+        response = self.export("assets", "csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="assets.csv"')
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0][:4], ["ID", "Asset Type", "Brand", "Price"])
+        self.assertEqual(len(rows), 1 + len(self.assets))
+        self.assertEqual(rows[1][6], "SN0")
+
+    def test_xlsx(self):
+        response = self.export("remaining-assets", "xlsx")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], XLSX_CONTENT_TYPE)
+        self.assertIn('filename="remaining-assets.xlsx"', response["Content-Disposition"])
+        workbook = load_workbook(io.BytesIO(b"".join(response.streaming_content)), read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(rows[0][:3], ("ID", "Asset Type", "Brand"))
+        self.assertEqual([row[4] for row in rows[1:]], ["SN2", "SN3", "SN4"])
+
+    def test_unknown_resource_or_format(self):
+        self.assertEqual(self.export("users", "csv").status_code, 404)
+        self.assertEqual(self.export("assets", "pdf").status_code, 404)
+
+    def test_pages_link_to_the_exports(self):
+        for page, resource in [
+            ("asset-list", "assets"),
+            ("remaining-assets-list", "remaining-assets"),
+            ("assign-assets-list", "assignments"),
+            ("employee-list", "employees"),
+        ]:
+            content = self.client.get(reverse(page)).content.decode()
+            for file_format in ("csv", "xlsx"):
+                self.assertIn(
+                    f'data-{file_format}="{reverse("export", args=[resource, file_format])}"',
+                    content,
+                )
+
+
+class BulkAssignTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.assets = [
+            Asset.objects.create(asset_type=asset_type, asset_brand="Dell", price=100)
+            for _ in range(4)
+        ]
+        cls.employee = Employee.objects.create(
+            first_name="Holder", employee_id="E1", mobile_number=1234567890
+        )
+        cls.other = Employee.objects.create(
+            first_name="Other", employee_id="E2", mobile_number=1234567890
+        )
+        assign_assets([cls.assets[0].id], cls.employee)
+        assign_assets([cls.assets[1].id], cls.other)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post(self, payload):
+        return self.client.post(
+            reverse("assign-asset-bulk"), json.dumps(payload), content_type="application/json"
+        )
+
+    def test_outcome_of_every_asset(self):
+        missing = self.assets[-1].id + 1
+        ids = [asset.id for asset in self.assets]
+        response = self.post({
+            "employee_id": "E1", "assets": [*ids, str(missing)], "date_of_assign": "2023-08-01",
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            "assigned": 2,
+            "results": [
+                {"asset": ids[0], "status": "already_assigned"},
+                {"asset": ids[1], "status": "unavailable"},
+                {"asset": ids[2], "status": "assigned"},
+                {"asset": ids[3], "status": "assigned"},
+                {"asset": missing, "status": "not_found"},
+            ],
+        })
+        self.assertEqual(
+            AssignAsset.objects.get(asset=self.assets[2]).date_of_assign, date(2023, 8, 1)
+        )
+        self.assertEqual(check_employee_holdings(), [])
+
+    def test_bad_payload(self):
+        for payload in [
+            {"employee_id": "E1", "assets": "123"},
+            {"employee_id": "E1", "assets": {"1": 1}},
+            {"employee_id": "E1", "assets": 1},
+            {"employee_id": "E1", "assets": [True]},
+            {"employee_id": "E1", "assets": ["one"]},
+            {"employee_id": "E1", "assets": [1], "date_of_assign": "01-08-2023"},
+            {"employee_id": "E1"},
+            [1, 2],
+        ]:
+            with self.subTest(payload=payload):
+                response = self.post(payload)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("Invalid request", response.json()["error"])
+        self.assertEqual(self.post({"employee_id": "E9", "assets": [1]}).status_code, 404)
+        self.assertFalse(AssignAsset.objects.filter(asset__in=self.assets[2:]).exists())
+
+
+class WriteTransactionTests(TransactionTestCase):
+
+    def begins(self, atomic):
+        with CaptureQueriesContext(connection) as queries:
+            with atomic():
+                Asset.objects.exists()
+        return [query["sql"] for query in queries if query["sql"].startswith("BEGIN")]
+
+    def test_only_write_transactions_take_the_write_lock(self):
+        self.assertEqual(self.begins(atomic_write), ["BEGIN IMMEDIATE"])
+        self.assertEqual(self.begins(transaction.atomic), ["BEGIN"])
+
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic():
+                # Inside an open transaction there is nothing left to begin.
+                with atomic_write():
+                    Asset.objects.exists()
+        self.assertEqual([query["sql"] for query in queries][0], "BEGIN")
+        self.assertFalse(connection.begin_immediate)
+
+
+class InventorySummaryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.laptop = AssetType.objects.create(asset_name="Laptop")
+        cls.monitor = AssetType.objects.create(asset_name="Monitor")
+        cls.vendors = [
+            Vendor.objects.create(first_name=name, mobile_number=1234567890)
+            for name in ("Acme", "Globex")
+        ]
+        cls.employees = [
+            Employee.objects.create(first_name=name, mobile_number=1234567890)
+            for name in ("Holder", "Other")
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def asset_data(self, **values):
+        return {
+            "asset_type": self.laptop.pk, "asset_brand": "Dell", "price": 100,
+            "vendor": self.vendors[0].pk, "purchase_date": "2024-01-02",
+            "system_configuration": "i5", "serial_number": "SN1", "invoice_number": "INV1",
+            "in_voice": "yes", "payment_status": "due", **values,
+        }
+
+    def test_edits_reassignments_and_deletes_keep_the_summary_in_step(self):
+        response = self.client.post(reverse("asset-create"), self.asset_data())
+        self.assertEqual(response.status_code, 302)
+        self.client.post(reverse("asset-create"), self.asset_data(serial_number="SN2", price=50))
+        first, second = Asset.objects.order_by("id")
+        self.assertEqual(check_inventory_summary(), [])
+
+        assign_assets([first.id, second.id], self.employees[0])
+        response = self.client.post(reverse("asset-edit", args=[first.id]), self.asset_data(
+            asset_type=self.monitor.pk, vendor=self.vendors[1].pk, asset_brand="HP", price=250,
+        ))
+        self.assertEqual(response.status_code, 302)
+        first.refresh_from_db()
+        self.assertEqual(
+            (first.asset_type, first.asset_brand, first.is_assign), (self.monitor, "HP", True)
+        )
+        self.assertEqual(check_inventory_summary(), [])
+
+        assignment = AssignAsset.objects.get(asset=second)
+        assignment.employee = self.employees[1]
+        assignment.save()
+        self.client.get(reverse("asset_delete", args=[first.id]))
+        second.refresh_from_db()
+        second.price = 75
+        second.save()
+        self.assertEqual(check_inventory_summary(), [])
+        self.assertEqual(
+            list(InventorySummary.objects.filter(count__gt=0).values_list(
+                "asset_type__asset_name", "asset_brand", "count", "assigned_count",
+            )),
+            [("Laptop", "Dell", 1, 1)],
+        )
+
+        second.delete()
+        self.assertEqual(check_inventory_summary(), [])
+        self.assertFalse(InventorySummary.objects.filter(count__gt=0).exists())
+
+
+class OffboardingTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+
+    def create_holder(self, employee_id, assets):
+        employee = Employee.objects.create(
+            first_name="Departing", employee_id=employee_id, mobile_number=1234567890
+        )
+        asset_ids = [
+            Asset.objects.create(asset_type=self.asset_type, asset_brand="Dell", price=100).id
+            for _ in range(assets)
+        ]
+        assign_assets(asset_ids, employee)
+        client_asset = ClientAsset.objects.create(
+            client_name="Acme", project="Portal", asset_brand="Dell", employee=employee,
+            project_owner="Owner",
+        )
+        return employee, asset_ids, client_asset
+
+    def test_offboarding_releases_everything_with_constant_queries(self):
+        queries = []
+        for employee_id, held in (("EMP1", 1), ("EMP2", 20)):
+            employee, asset_ids, client_asset = self.create_holder(employee_id, held)
+            with CaptureQueriesContext(connection) as captured:
+                result = offboard_employees([employee])
+            queries.append(len(captured))
+            self.assertEqual(result, {"employees": 1, "assets": held, "client_assets": 1})
+            self.assertFalse(Asset.objects.filter(id__in=asset_ids, is_assign=True).exists())
+            self.assertFalse(AssignAsset.objects.filter(asset_id__in=asset_ids).exists())
+            client_asset.refresh_from_db()
+            self.assertIsNone(client_asset.employee_id)
+        self.assertEqual(queries[0], queries[1])
+        self.assertEqual(check_inventory_summary(), [])
+
+    def test_delete_view_offboards_the_employee(self):
+        employee, asset_ids, _ = self.create_holder("EMP3", 2)
+        self.client.force_login(self.user)
+        self.client.get(reverse("employee_delete", args=["EMP3"]))
+        self.assertFalse(Employee.objects.filter(pk=employee.pk).exists())
+        self.assertEqual(Asset.objects.filter(id__in=asset_ids, is_assign=False).count(), 2)
+
+
+class EmployeeHoldingsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.employee = Employee.objects.create(first_name="Holder", mobile_number=1234567890)
+        cls.other = Employee.objects.create(first_name="Other", mobile_number=1234567890)
+        cls.assets = [
+            Asset.objects.create(asset_type=cls.asset_type, asset_brand="Dell", price=price)
+            for price in (100, 250)
+        ]
+
+    def holdings(self, employee):
+        employee.refresh_from_db()
+        return (employee.assets_held, employee.held_value, employee.client_assets_held)
+
+    def test_counters_follow_assignment_and_client_asset_writes(self):
+        assign_assets([asset.id for asset in self.assets], self.employee)
+        self.assertEqual(self.holdings(self.employee), (2, 350, 0))
+
+        self.assets[0].price = 150
+        self.assets[0].save()
+        self.assertEqual(self.holdings(self.employee), (2, 400, 0))
+
+        assignment = AssignAsset.objects.get(asset=self.assets[1])
+        assignment.employee = self.other
+        assignment.save()
+        self.assertEqual(self.holdings(self.employee), (1, 150, 0))
+        self.assertEqual(self.holdings(self.other), (1, 250, 0))
+
+        self.assets[0].delete()
+        self.assertEqual(self.holdings(self.employee), (0, 0, 0))
+        self.assertFalse(self.employee.is_have_asset)
+
+        client_asset = ClientAsset.objects.create(
+            client_name="Acme", project="Portal", asset_brand="Dell", employee=self.employee,
+            project_owner="Owner",
+        )
+        self.assertEqual(self.holdings(self.employee), (0, 0, 1))
+        client_asset.is_dispatch = True
+        client_asset.save()
+        self.assertEqual(self.holdings(self.employee), (0, 0, 0))
+        self.assertEqual(check_employee_holdings(), [])
+
+    def test_check_finds_drift(self):
+        assign_assets([self.assets[0].id], self.employee)
+        Employee.objects.filter(pk=self.employee.pk).update(assets_held=5)
+        drift = check_employee_holdings()
+        self.assertEqual([employee_id for employee_id, _, _ in drift], [self.employee.pk])
+        self.assertEqual(drift[0][2]["assets_held"], 1)
+
+
+class AssignmentLedgerTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.first = Employee.objects.create(
+            first_name="First", employee_id="E1", mobile_number=1234567890
+        )
+        cls.second = Employee.objects.create(
+            first_name="Second", employee_id="E2", mobile_number=1234567890
+        )
+        cls.asset = Asset.objects.create(
+            asset_type=cls.asset_type, asset_brand="Dell", price=100, serial_number="SN1"
+        )
+
+    def kinds(self):
+        return list(AssignmentEvent.objects.order_by("id").values_list("kind", flat=True))
+
+    def test_every_change_of_holder_is_recorded(self):
+        assign_assets([self.asset.id], self.first)
+        assignment = AssignAsset.objects.get(asset=self.asset)
+        assignment.employee = self.second
+        assignment.save()
+        assignment.delete()
+        client_asset = ClientAsset.objects.create(
+            client_name="Acme", project="Portal", asset_brand="Dell", employee=self.first,
+            project_owner="Owner",
+        )
+        client_asset.is_dispatch = True
+        client_asset.save()
+        self.assertEqual(self.kinds(), ["assign", "reassign", "release", "assign", "dispatch"])
+        self.assertEqual(check_assignment_ledger(), [])
+
+    def test_holdings_at_a_point_in_time(self):
+        assign_assets([self.asset.id], self.first)
+        held_by_first = timezone.now()
+        create_checkpoint()
+        assignment = AssignAsset.objects.get(asset=self.asset)
+        assignment.employee = self.second
+        assignment.save()
+        held_by_second = timezone.now()
+        create_checkpoint()
+        offboard_employees([self.second])
+
+        key = ("asset", self.asset.id)
+        self.assertEqual(AssignmentCheckpoint.objects.count(), 2)
+        self.assertEqual(holdings_at(held_by_first), {key: self.first.id})
+        self.assertEqual(holdings_at(held_by_second, employee=self.second), {key: self.second.id})
+        self.assertEqual(holdings_at(held_by_second, employee=self.first), {})
+        self.assertEqual(holdings_at(asset=self.asset), {})
+
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("assignment-holdings"),
+            {"serial": "SN1", "at": held_by_first.isoformat()},
+        )
+        self.assertEqual(response.json()["holdings"][0]["employee"], "E1")
+        self.assertEqual(
+            [event["kind"] for event in response.json()["history"]],
+            ["assign", "reassign", "release"],
+        )
+
+    def test_backdated_assignment_counts_from_its_date(self):
+        other = Asset.objects.create(asset_type=self.asset_type, asset_brand="HP", price=100)
+        assign_assets([other.id], self.second)
+        assign_assets([self.asset.id], self.first, timezone.localdate() - timedelta(days=10))
+        create_checkpoint()
+
+        key = ("asset", self.asset.id)
+        week_ago = timezone.now() - timedelta(days=7)
+        self.assertEqual(holdings_at(week_ago), {key: self.first.id})
+        self.assertEqual(holdings_at(week_ago, employee=self.first), {key: self.first.id})
+        self.assertEqual(holdings_at(week_ago, employee=self.second), {})
+        self.assertEqual(holdings_at(week_ago - timedelta(days=7)), {})
+        self.assertEqual(holdings_at(), {key: self.first.id, ("asset", other.id): self.second.id})
+
+    def test_date_only_point_in_time_means_end_of_day(self):
+        assign_assets([self.asset.id], self.first)
+        self.client.force_login(self.user)
+        today = timezone.localdate()
+        response = self.client.get(
+            reverse("assignment-holdings"), {"at": today.isoformat(), "employee": "E1"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["serial_number"] for row in response.json()["holdings"]], ["SN1"])
+        response = self.client.get(
+            reverse("assignment-holdings"),
+            {"at": (today - timedelta(days=1)).isoformat(), "employee": "E1"},
+        )
+        self.assertEqual(response.json()["holdings"], [])
+        response = self.client.get(reverse("assignment-holdings"), {"at": "31/03/2024"})
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(ASSIGNMENT_CHECKPOINT_INTERVAL=2)
+    def test_checkpoint_is_stored_every_interval(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_assets([self.asset.id], self.first)
+        self.assertFalse(AssignmentCheckpoint.objects.exists())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset.delete()
+        checkpoint = AssignmentCheckpoint.objects.get()
+        self.assertEqual(checkpoint.holdings, 0)
+        self.assertEqual(checkpoint.last_event, AssignmentEvent.objects.latest("id").id)
+
+
+class DailyActivityTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.employee = Employee.objects.create(
+            first_name="First", employee_id="E1", mobile_number=1234567890
+        )
+
+    def test_rollups_follow_writes_and_feed_the_trend(self):
+        today = timezone.localdate()
+        asset = Asset.objects.create(
+            asset_type=self.asset_type, asset_brand="Dell", price=100, serial_number="SN1",
+            purchase_date=today,
+        )
+        assign_assets([asset.id], self.employee)
+        offboard_employees([self.employee])
+        Asset.objects.create(
+            asset_type=self.asset_type, asset_brand="HP", price="50.50", serial_number="SN2",
+            purchase_date=today - timedelta(days=40),
+        )
+        asset.price = 120
+        asset.save()
+        self.assertEqual(check_daily_activity(), [])
+        row = DailyActivity.objects.get(day=today, asset_type=self.asset_type)
+        self.assertEqual((row.assignments, row.releases, row.purchases), (1, 1, 1))
+        self.assertEqual(row.spend, Decimal("120"))
+
+        self.client.force_login(self.user)
+        trend = self.client.get(reverse("activity-trend"), {"days": 30}).json()
+        self.assertEqual(len(trend["days"]), 30)
+        self.assertEqual(trend["days"][-1], today.isoformat())
+        self.assertEqual(trend["assignments"][-1], 1)
+        self.assertEqual(sum(trend["purchases"]), 1)
+        trend = self.client.get(reverse("activity-trend"), {"days": 90}).json()
+        self.assertEqual(sum(trend["purchases"]), 2)
+        response = self.client.get(reverse("activity-trend"), {"days": 7})
+        self.assertEqual(response.status_code, 400)
+
+
+class AssetFacetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.laptop = AssetType.objects.create(asset_name="Laptop")
+        specs = [
+            ("Dell", "16GB", "i7", "UBUNTU", False),
+            ("Dell", "16GB", "i7", "UBUNTU", True),
+            ("Dell", "32GB", "i7", "UBUNTU", False),
+            ("HP", "16GB", "i5", "WINDOW", False),
+        ]
+        for number, (brand, ram, processor, operating_system, is_assign) in enumerate(specs):
+            Asset.objects.create(
+                asset_type=cls.laptop, asset_brand=brand, price=100, serial_number=f"SN{number}",
+                ram=ram, processor=processor, operating_system=operating_system,
+                is_assign=is_assign,
+            )
+
+    def test_specs_are_stored_as_codes(self):
+        form = AssetForm(data={
+            "asset_type": self.laptop.pk, "asset_brand": "Lenovo", "price": 10,
+            "vendor": Vendor.objects.create(first_name="V", mobile_number=1234567890).pk,
+            "payment_status": "due", "in_voice": "no", "ram": "64GB", "storage": "512",
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        asset = form.save()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT ram, ssd, storage FROM inventry_asset WHERE id = %s", [asset.pk]
+            )
+            self.assertEqual(cursor.fetchone(), (6, 0, 6))
+        asset.refresh_from_db()
+        self.assertEqual((asset.ram, asset.ssd), ("64GB", ""))
+        self.assertEqual(Asset.objects.filter(ram__in=["64GB", "32GB"]).count(), 2)
+
+    def test_counts_of_each_facet_ignore_its_own_selection(self):
+        result = faceted_search(
+            {"ram": ["16GB"], "processor": ["i7"], "operating_system": ["UBUNTU"]},
+            is_assign=False,
+        )
+        self.assertEqual(result["total"], 1)
+        self.assertEqual([asset["serial_number"] for asset in result["assets"]], ["SN0"])
+        counts = {facet: {item["value"]: item["count"] for item in items}
+                  for facet, items in result["facets"].items()}
+        self.assertEqual(counts["ram"], {"16GB": 1, "32GB": 1})
+        self.assertEqual(counts["processor"], {"i7": 1})
+        self.assertEqual(counts["asset_brand"], {"Dell": 1})
+        self.assertEqual(counts["asset_type"], {self.laptop.pk: 1})
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("asset-facets"), {"ram": "16GB", "asset_brand": "HP"})
+        self.assertEqual(response.json()["total"], 1)
+        response = self.client.get(reverse("asset-facets"), {"ram": "12GB"})
+        self.assertEqual(response.status_code, 400)
+
+
+@skipUnless(np, "NumPy is not installed")
+@override_settings(INVENTORY_SNAPSHOT_ENABLED=True)
+class AssetSnapshotTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_inventory(300, seed=3)
+
+    def setUp(self):
+        clear_snapshot()
+        self.addCleanup(clear_snapshot)
+
+    def test_groups_match_the_grouped_query(self):
+        snapshot = get_snapshot()
+        self.assertEqual(len(snapshot), Asset.objects.count())
+        vendor = Asset.objects.exclude(vendor=None).first().vendor
+        cent = Decimal("0.01")
+
+        def rounded(groups):
+            # SQLite sums decimals as floating point.
+            return [
+                {key: value.quantize(cent) if isinstance(value, Decimal) else value
+                 for key, value in group.items()}
+                for group in groups
+            ]
+
+        for filters, queryset in [
+            ({}, Asset.objects.all()),
+            ({"vendor": vendor}, Asset.objects.filter(vendor=vendor)),
+            ({"is_assign": False}, Asset.objects.filter(is_assign=False)),
+        ]:
+            self.assertEqual(
+                rounded(snapshot.asset_groups(**filters)), rounded(get_asset_groups(queryset))
+            )
+
+    def test_rebuilt_after_a_write(self):
+        snapshot = get_snapshot()
+        self.assertIs(get_snapshot(), snapshot)
+        asset = Asset.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            asset.delete()
+            # Uncommitted writes are not read into the snapshot.
+            self.assertIs(get_snapshot(), snapshot)
+        rebuilt = get_snapshot()
+        self.assertIsNot(rebuilt, snapshot)
+        self.assertEqual(len(rebuilt), len(snapshot) - 1)
+        self.assertNotIn(asset.pk, rebuilt.ids)
+
+    def test_kept_across_writes_to_other_tables(self):
+        snapshot = get_snapshot()
+        employee = Employee.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            employee.first_name = "Renamed"
+            employee.save()
+            Vendor.objects.first().save()
+        self.assertIs(get_snapshot(), snapshot)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AssetType.objects.create(asset_name="Docking Station")
+        self.assertIsNot(get_snapshot(), snapshot)
+
+
+class SoftDeleteTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+        cls.vendor = Vendor.objects.create(
+            first_name="Northwind", email="vendor@example.com", mobile_number=1234567890
+        )
+        cls.asset = Asset.objects.create(
+            asset_type=cls.asset_type, asset_brand="Dell", vendor=cls.vendor, price=100,
+            serial_number="SD100",
+        )
+        cls.employee = Employee.objects.create(
+            first_name="Zoë", email="zoe@example.com", employee_id="7", mobile_number=1234567890
+        )
+
+    def test_delete_hides_and_restore_brings_back(self):
+        self.asset.delete()
+        self.assertIsNotNone(self.asset.deleted_at)
+        self.assertFalse(Asset.objects.filter(pk=self.asset.pk).exists())
+        self.assertFalse(self.vendor.vendor_asset.exists())
+        self.assertEqual(Asset.all_objects.dead().get().pk, self.asset.pk)
+        self.assertEqual(search("sd100")["total"], 0)
+        self.assertEqual(check_inventory_summary(), [])
+
+        Asset.all_objects.filter(pk=self.asset.pk).restore()
+        self.assertTrue(Asset.objects.filter(pk=self.asset.pk).exists())
+        self.assertEqual(search("sd100")["total"], 1)
+        self.assertEqual(check_inventory_summary(), [])
+
+    def test_deleted_assigned_asset_is_restored_unassigned(self):
+        user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        self.client.force_login(user)
+        assign_assets([self.asset.id], self.employee)
+        self.client.get(reverse("asset_delete", args=[self.asset.id]))
+        self.assertFalse(AssignAsset.objects.filter(asset_id=self.asset.id).exists())
+
+        Asset.all_objects.filter(pk=self.asset.pk).restore()
+        self.asset.refresh_from_db()
+        self.assertFalse(self.asset.is_assign)
+        self.assertTrue(Asset.objects.filter(pk=self.asset.pk, is_assign=False).exists())
+        self.assertEqual(check_inventory_summary(), [])
+        self.assertEqual(check_employee_holdings(), [])
+        self.assertEqual(check_assignment_ledger(), [])
+
+    def test_deleted_employee_frees_email_and_id(self):
+        data = {
+            "first_name": "Zoë", "last_name": "Pereira", "email": "zoe@example.com",
+            "employee_id": "7", "date_of_joining": "2024-01-01", "mobile_number": 1234567890,
+            "technology_name": "Python",
+        }
+        self.assertEqual(set(EmployeeForm(data).errors), {"email", "employee_id"})
+        self.employee.delete()
+        form = EmployeeForm(data)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(Employee.all_objects.filter(employee_id="7").count(), 2)
+
+    def test_purge_removes_only_expired_rows(self):
+        self.vendor.delete()
+        self.employee.delete()
+        self.assertEqual(
+            purge_deleted(timezone.now() - timedelta(days=1))["inventry.Vendor"], 0
+        )
+        purged = purge_deleted(timezone.now() + timedelta(seconds=1))
+        self.assertEqual((purged["inventry.Vendor"], purged["inventry.Employee"]), (1, 1))
+        self.assertFalse(Vendor.all_objects.exists())
+        self.asset.refresh_from_db()
+        self.assertIsNone(self.asset.vendor_id)
+        self.assertEqual(check_inventory_summary(), [])
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class ConditionalGetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_unchanged_page_is_not_rendered_again(self):
+        url = reverse("dashboard")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("no-cache", response["Cache-Control"])
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.templates, [])
+        # Only the session and the user are loaded.
+        self.assertLessEqual(len(queries), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Asset.objects.create(asset_type=self.asset_type, asset_brand="Dell", price=100)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_cached_page_changes_after_a_committed_write(self):
+        url = reverse("total_remaining_asset_detail")
+        self.assertEqual(self.client.get(url).context["asset_details"], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Asset.objects.create(asset_type=self.asset_type, asset_brand="Dell", price=100)
+            # Until the write commits, the cached page is what other requests see.
+            version = get_cache_version()
+            self.assertEqual(self.client.get(url).context["asset_details"], [])
+        self.assertNotEqual(get_cache_version(), version)
+        details = self.client.get(url).context["asset_details"]
+        self.assertEqual(len(details), 1)
+
+
+
+class InventoryCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.asset_type = AssetType.objects.create(asset_name="Laptop")
+
+    def lookups(self, result):
+        return REGISTRY.get_sample_value("inventory_cache_lookups_total", {"result": result}) or 0
+
+    def test_hits_and_misses_are_counted(self):
+        calls = []
+        hits, misses = self.lookups("hit"), self.lookups("miss")
+        for _ in range(3):
+            self.assertEqual(cached("cache-test", lambda n: calls.append(n) or n * 2, 21), 42)
+        self.assertEqual(calls, [21])
+        self.assertEqual((self.lookups("hit") - hits, self.lookups("miss") - misses), (2, 1))
+
+    def test_committed_writes_replace_the_versions_they_affect(self):
+        version, snapshot_version = get_cache_version(), get_snapshot_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Vendor.objects.create(first_name="Acme", mobile_number=1234567890)
+            self.assertEqual(get_cache_version(), version)
+        self.assertNotEqual(get_cache_version(), version)
+        self.assertEqual(get_snapshot_version(), snapshot_version)
+
+        version = get_cache_version()
+        builds = []
+
+        def build(n):
+            builds.append(n)
+            return n
+
+        self.assertEqual([cached("cache-test-write", build, 1) for _ in range(2)], [1, 1])
+        self.assertEqual(builds, [1])
+        with self.captureOnCommitCallbacks(execute=True):
+            Asset.objects.create(asset_type=self.asset_type, asset_brand="Dell", price=100)
+        self.assertNotEqual(get_cache_version(), version)
+        self.assertNotEqual(get_snapshot_version(), snapshot_version)
+        cached("cache-test-write", build, 1)
+        self.assertEqual(builds, [1, 1])
+
+class StaticBundleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="admin", email="admin@example.com", password="password"
+        )
+
+    def test_bundle_points_css_urls_at_the_original_files(self):
+        with tempfile.TemporaryDirectory() as root, override_settings(STATIC_BUNDLE_ROOT=root):
+            with open(BundleFinder().find("bundles/core.css")) as bundle:
+                css = bundle.read()
+        self.assertIn('url("../vendor/bootstrap-icons/fonts/bootstrap-icons.woff2?', css)
+        self.assertNotIn("sourceMappingURL", css)
+        self.assertIsNone(BundleFinder().find("bundles/missing.js"))
+
+    def test_pages_load_only_self_hosted_scripts(self):
+        self.client.force_login(self.user)
+        html = self.client.get(reverse("asset-list")).content.decode()
+        scripts = re.findall(r'<script src="([^"]+)"', html)
+        self.assertIn("/static/bundles/datatables.js", scripts)
+        self.assertTrue(all(script.startswith("/static/") for script in scripts), scripts)
+        self.assertIn('data-pdfmake="/static/bundles/pdfmake.js"', html)
+        self.assertNotIn("/static/bundles/datatables.js", self.client.get(reverse("dashboard")).content.decode())
@@ -4,7 +4,7 @@
 from django.urls import path
 
 # Project Imports
-from apps.inventry import views
+from apps.inventry import views, autocomplete, datatables, exports
 
 
 # URLs for dashboard-related views
@@ -14,6 +14,8 @@ dashboard_urls = [
     path("profile/", views.ProfileView.as_view(), name="profile"),
     path("change/password/", views.ChangePasswordView.as_view(), name="change-password"),
     path("remainig_asset/", views.RemainingAssetView.as_view(), name="remainig_asset"),
+    path("search/", views.SearchView.as_view(), name="global-search"),
+    path("asset/facets/", views.AssetFacetView.as_view(), name="asset-facets"),
 ]
 
 
@@ -46,6 +48,7 @@ assets_urls = [
 
     path("asset/create/", views.AssetCreateView.as_view(), name="asset-create"),
     path("asset/list", views.AssetListView.as_view(), name="asset-list"),
+    path("asset/import/", views.AssetImportView.as_view(), name="asset-import"),
     path("asset/edit/<int:asset_id>", views.AssetUpdateView.as_view(), name="asset-edit"),
     path("asset/delete/<int:asset_id>", views.AssetDeleteView.as_view(), name="asset_delete"),
     path("asset/details/<int:asset_id>", views.AssetDetailsView.as_view(), name="asset_details"),
@@ -60,6 +63,9 @@ assets_urls = [
 assign_assets_urls = [
 
     path("assign/asset/create/", views.CreateAssignAssetView.as_view(), name="assign-asset-create"),
+    path("assign/asset/bulk/", views.BulkAssignAssetView.as_view(), name="assign-asset-bulk"),
+    path("assign/holdings/", views.AssignmentHoldingsView.as_view(), name="assignment-holdings"),
+    path("activity/trend/", views.ActivityTrendView.as_view(), name="activity-trend"),
     path("assign/asset/detail/<str:employee>/<int:asset>", views.AssignAssignDetailView.as_view(), name="assign-asset-detail"),
     path("assign/assets/list/", views.AssignAssetListView.as_view(), name="assign-assets-list"),
     path("assignassets/delete/<int:asset_id>/<str:employee_id>/", views.AssignAssetDeleteView.as_view(), name="assign-asset-delete"),
@@ -87,6 +93,35 @@ client_urls = [
 ]    
 
 
-urlpatterns = client_urls + asset_type_urls + dashboard_urls + employee_urls + vendor_urls + assign_assets_urls + assets_urls
+# URLs for DataTables server-side processing endpoints
+datatable_urls = [
+
+    path("asset/list/data/", datatables.AssetDataTableView.as_view(), name="asset-list-data"),
+    path("remaining/assets/list/data/", datatables.RemainingAssetDataTableView.as_view(), name="remaining-assets-list-data"),
+    path("employee/list/data/", datatables.EmployeeDataTableView.as_view(), name="employee-list-data"),
+    path("assign/assets/list/data/", datatables.AssignAssetDataTableView.as_view(), name="assign-assets-list-data"),
+    path("client/list/data/", datatables.ClientDataTableView.as_view(), name="client-list-data"),
+    path("vendor/list/data/", datatables.VendorDataTableView.as_view(), name="vendor-list-data"),
+]
+
+
+# URLs for the asset and employee picker autocompletes
+autocomplete_urls = [
+
+    path("autocomplete/assets/", autocomplete.AssetAutocomplete.as_view(), name="asset-autocomplete"),
+    path("autocomplete/assets/unassigned/", autocomplete.AssetAutocomplete.as_view(unassigned_only=True), name="unassigned-asset-autocomplete"),
+    path("autocomplete/employees/", autocomplete.EmployeeAutocomplete.as_view(), name="employee-autocomplete"),
+    path("autocomplete/employees/email/", autocomplete.EmployeeAutocomplete.as_view(value_field="email"), name="employee-email-autocomplete"),
+]
+
+
+# URLs for streaming CSV/XLSX exports
+export_urls = [
+
+    path("export/<str:resource>.<str:file_format>", exports.ExportView.as_view(), name="export"),
+]
+
+
+urlpatterns = datatable_urls + autocomplete_urls + export_urls + client_urls + asset_type_urls + dashboard_urls + employee_urls + vendor_urls + assign_assets_urls + assets_urls
     
   
\ No newline at end of file
@@ -1,6 +1,9 @@
 # Python Imports
-from datetime import timedelta, date
-from datetime import datetime
+import json
+from datetime import date
+# Imported as a module alias: ``from .models import *`` re-exports models.py's
+# ``import datetime`` and would shadow ``from datetime import datetime``.
+import datetime as dt
 
 # Django Imports
 from django.views import View
@@ -11,9 +14,9 @@ from django.contrib.auth import logout
 from django.contrib.auth.hashers import check_password
 from django.views.generic.list import ListView
 from django.urls import reverse
-from django.db.models import Sum
 from django.forms.models import model_to_dict
 from django.utils.timezone import make_aware
+from django.utils.dateparse import parse_date, parse_datetime
 from django.http import JsonResponse
 from django.contrib.auth.mixins import LoginRequiredMixin
 
@@ -24,25 +27,26 @@ from .forms import(
     VendorForm,
     AssignedAssetForm,
     AssetTypeForm,ClientForm,
-    AssignedAssetsForm
+    AssignedAssetsForm,
+    AssetImportForm,
 )
 from .models import *
-from .utils import (
-    get_total_number_of_employees,
-    get_asset_item_list,
-    get_today_assigned_asset,
-    get_yesterday_assigned_asset,
-    get_total_asset_quantity,
-    get_total_client_asset_quantity,
-    group_and_sum_asset_counts,
-    dashboard_data,
-    vendor_details_info,
-)
+from .utils import vendor_details_info
+from .aggregations import get_dashboard_context, get_type_summary
+from .cache import cached
+from .conditional import ConditionalGetMixin
+from .facets import FACETS, faceted_search
+from .services import ASSIGNED, assign_assets, offboard_employees
+from .importers import import_assets
+from .ledger import holdings_at
+from .rollups import get_activity_trend
+from .search import DEFAULT_PAGE_SIZE, search
+from .sqlite import atomic_write
 
 # Third Party Imports
 
 
-class DashboardView(LoginRequiredMixin,View):
+class DashboardView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     A view that renders the dashboard page, which displays various statistics and data related to assets and employees.
 
@@ -70,23 +74,7 @@ class DashboardView(LoginRequiredMixin,View):
     template_name = "dashboard/dashboard.html"
 
     def get(self, request):
-        today_date = date.today()
-        yesterday_date = today_date - timedelta(1)
-    
-        context = {
-                "today": get_today_assigned_asset(today_date),
-                "yesterday": get_yesterday_assigned_asset(yesterday_date),
-                "total_asset_quantity": get_total_asset_quantity(),
-                "all_assets": get_asset_item_list(),
-                "total_employee": get_total_number_of_employees(),
-                "total_asset_type": len(Asset.objects.all()),
-                "asset_type_query": dashboard_data(),
-                "total_remaining_asset": Asset.objects.filter(is_assign=False).count(),
-                'total_client_asset': get_total_client_asset_quantity(),
-                'remaining_assets': group_and_sum_asset_counts(),
-                'total_price' : Asset.objects.aggregate(Sum('price'))['price__sum'],
-                'total_remaining_price' : Asset.objects.filter(is_assign=False).aggregate(Sum('price'))['price__sum']
-            }
+        context = get_dashboard_context(date.today())
         return render(request, self.template_name, context)
 
 
@@ -223,7 +211,8 @@ class AssetCreateView(LoginRequiredMixin, View):
         """
         form = self.form_class(request.POST)
         if form.is_valid():
-            form.save()
+            with atomic_write():
+                form.save()
             messages.success(request, "Asset successfully created.")
             return redirect(reverse("asset-list"))
         else:
@@ -280,7 +269,7 @@ class AssetTypeCreationView(LoginRequiredMixin,View):
             return render(request, self.template_name, {"form": form})
 
 
-class AssetListView(LoginRequiredMixin,View):
+class AssetListView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     A view to display a list of all assets or filter them by asset type name.
     
@@ -291,30 +280,61 @@ class AssetListView(LoginRequiredMixin,View):
         """
         Handles GET requests to display the list of all assets.
 
+        The rows are loaded page by page from ``asset-list-data``.
+
         Returns:
-            A rendered HttpResponse instance containing the list of assets.
+            A rendered HttpResponse instance containing the assets table.
         """
-
-        asset_list = Asset.objects.all()
-        context = {"asset_list": asset_list}
-        return render(request, self.template_name, context)
+        return render(request, self.template_name)
     
     def post(self, request):
         """
-        Handles POST requests to filter the list of assets by asset type name.
+        Handles POST requests to open the list of assets filtered by a search term.
 
         Args:
             request: A HttpRequest instance.
 
         Returns:
-            A rendered HttpResponse instance containing the filtered list of assets.
+            A rendered HttpResponse instance whose table starts with the term as its search.
         """
-        name = request.POST.get("name")
-        asset = Asset.objects.filter(asset_type__asset_name__contains=name)
-        context = {"asset_list": asset}
+        context = {"search": request.POST.get("name", "").strip()}
         return render(request, self.template_name, context)
 
 
+class AssetImportView(LoginRequiredMixin, View):
+    """
+    A view for bulk importing assets from an uploaded CSV or XLSX file.
+    """
+    template_name = "inventory/asset_import.html"
+    form_class = AssetImportForm
+
+    def get(self, request):
+        """
+        Render the asset import form.
+        """
+        return render(request, self.template_name, {"form": self.form_class()})
+
+    def post(self, request):
+        """
+        Validate the uploaded file and import it, or only report the changes on a dry run.
+
+        Returns:
+            The import form together with the import report.
+        """
+        form = self.form_class(request.POST, request.FILES)
+        if not form.is_valid():
+            return render(request, self.template_name, {"form": form})
+
+        upload = form.cleaned_data["file"]
+        report = import_assets(
+            upload.file, upload.name,
+            chunk_size=form.cleaned_data["chunk_size"],
+            dry_run=form.cleaned_data["dry_run"],
+            create_asset_types=form.cleaned_data["create_asset_types"],
+        )
+        return render(request, self.template_name, {"form": form, "report": report})
+
+
 class AssetDeleteView(LoginRequiredMixin, View):
     """
     View for deleting an asset.
@@ -335,10 +355,14 @@ class AssetDeleteView(LoginRequiredMixin, View):
         """
         try:
             asset = Asset.objects.get(id=asset_id)
-            if AssignAsset.objects.filter(asset=asset.id).exists():
-                assign = AssignAsset.objects.get(asset=asset.id)
-                assign.delete()
-            asset.delete()
+            with atomic_write():
+                if AssignAsset.objects.filter(asset=asset.id).exists():
+                    assign = AssignAsset.objects.get(asset=asset.id)
+                    # Released first, so a restored asset is back in stock.
+                    asset.is_assign = False
+                    asset.save()
+                    assign.delete()
+                asset.delete()
             messages.success(request, "Asset deleted successfully.")
         except Asset.DoesNotExist:
             messages.error(request, "Asset not found.")
@@ -393,7 +417,10 @@ class AssetUpdateView(LoginRequiredMixin,View):
             asset = Asset.objects.get(id=asset_id)
             form = AssetForm(request.POST, instance=asset)
             if form.is_valid():
-                form.save()
+                # The summary reads the previous row in pre_save; the lock keeps
+                # concurrent edits of the same asset from applying the same delta.
+                with atomic_write():
+                    form.save()
                 messages.success(request, f"Asset with ID {asset_id} has been updated.")
                 return redirect("asset-list")
         except Asset.DoesNotExist:
@@ -404,7 +431,7 @@ class AssetUpdateView(LoginRequiredMixin,View):
         return render(request, self.template_name, {"form": form})
 
 
-class EmployeeListView(LoginRequiredMixin, View):
+class EmployeeListView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View to display the list of active employees.
     """
@@ -421,12 +448,10 @@ class EmployeeListView(LoginRequiredMixin, View):
             HttpResponse: The HTTP response containing the rendered employee table template and the list of active employees.
         """
 
-        employee_list = Employee.objects.filter(is_active=True)
-        context = {"employee_list": employee_list}
-        return render(request, self.template_name, context)
+        return render(request, self.template_name)
 
 
-class AssignAssetListView(LoginRequiredMixin,View):
+class AssignAssetListView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View to display the list of AssignAsset list
     """
@@ -441,9 +466,7 @@ class AssignAssetListView(LoginRequiredMixin,View):
          Retruns:
            HttpResponse: The HTTP response containing the rendered assign assets  templates and the list of assign assets  
         """
-        assing_assets_list = AssignAsset.objects.all()
-        context = {"assing_assets_list": assing_assets_list}
-        return render(request,self.template_name, context)
+        return render(request, self.template_name)
 
   
   
@@ -547,7 +570,7 @@ class VendorCreationView(LoginRequiredMixin,View):
             return render(request, self.template_name, {"form", form})
 
 
-class VendorListView(LoginRequiredMixin,View):
+class VendorListView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View for displaying a table of all active Vendor objects.
 
@@ -565,9 +588,7 @@ class VendorListView(LoginRequiredMixin,View):
             A rendered HTML template containing a table of all active Vendor objects.
         """
 
-        vendor_list = Vendor.objects.all().order_by("created_at").exclude(is_active=False)
-        context = {"vendor_list": vendor_list}
-        return render(request, self.template_name, context)
+        return render(request, self.template_name)
 
 
 class ChangePasswordView(LoginRequiredMixin, View):
@@ -603,7 +624,7 @@ class ChangePasswordView(LoginRequiredMixin, View):
         return redirect("/dashboard/profile")
 
 
-class Asset_ListDetail(LoginRequiredMixin, View):
+class Asset_ListDetail(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View for displaying a filter Assets data based on assets names.
 
@@ -613,12 +634,12 @@ class Asset_ListDetail(LoginRequiredMixin, View):
     def get(self, request, asset):
         context = {}
         asset_name = asset
-        assets = Asset.objects.filter(asset_type__asset_name=asset_name)
+        assets = Asset.objects.filter(asset_type__asset_name=asset_name).select_related("vendor")
         context = {"asset_data": assets}
         return render(request, "dashboard/assets_records_list.html", context)
 
 
-class AssignAssignDetailView(LoginRequiredMixin, View):
+class AssignAssignDetailView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View for displaying a single AssignAsset record.
 
@@ -639,11 +660,13 @@ class AssignAssignDetailView(LoginRequiredMixin, View):
         Returns:
             A rendered HTML template containing a single AssignAsset record for the specified employee and asset.
         """
-        emp_records = AssignAsset.objects.filter(employee_id=employee, id=asset)
+        emp_records = AssignAsset.objects.filter(
+            employee_id=employee, id=asset
+        ).select_related("asset__asset_type")
         return render(request, self.template_name, {'emp_records': emp_records})
 
 
-class AssetTypeListView(LoginRequiredMixin, View):
+class AssetTypeListView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View for displaying a list of all AssetType objects.
 
@@ -724,9 +747,10 @@ class AssignAssetDeleteView(LoginRequiredMixin, View):
         try:
             assign_asset = AssignAsset.objects.get(employee__id=employee_id,asset__id=asset_id)
             assest = assign_asset.asset
-            assest.is_assign=False
-            assest.save()
-            assign_asset.delete()
+            with atomic_write():
+                assest.is_assign=False
+                assest.save()
+                assign_asset.delete()
             messages.success(request, "Assigned asset deleted successfully.")
             return redirect('assign-assets-list')
         except AssignAsset.DoesNotExist:
@@ -780,8 +804,9 @@ class AssignAssetEditView(LoginRequiredMixin, View):
             if not alreay_assigned:
                 assign_asset.employee = employee_obj
                 assign_asset.asset = asset_obj
-                assign_asset.date_of_assign = make_aware(datetime.strptime(date, '%Y-%m-%d'))
-                assign_asset.save()
+                assign_asset.date_of_assign = make_aware(dt.datetime.strptime(date, '%Y-%m-%d'))
+                with atomic_write():
+                    assign_asset.save()
                 return redirect("/dashboard/assign/assets/list/")
             else:
                 messages.success(
@@ -795,7 +820,7 @@ class AssignAssetEditView(LoginRequiredMixin, View):
 class EmployeeDeleteView(LoginRequiredMixin, View):
     def get(self, request, employee_id):
         """
-        Handle GET requests to delete an Employee.
+        Handle GET requests to delete an Employee, releasing their assets.
 
         Args:
             request (HttpRequest): The HTTP request object.
@@ -805,18 +830,12 @@ class EmployeeDeleteView(LoginRequiredMixin, View):
             HttpResponseRedirect: Redirects to the 'employee-list' URL.
 
         """
-        try:
-            employee_obj = Employee.objects.get(employee_id=employee_id)
-            assets_assign = AssignAsset.objects.filter(employee=employee_obj.id)
-            if assets_assign:
-                Asset.objects.filter(id=assets_assign.asset.id).update(is_assign=False)
-                assets_assign.delete()
-            employee_obj.delete()
-            messages.success(request, "Employee deleted successfully.")
-        except Employee.DoesNotExist:
+        employee = Employee.objects.filter(employee_id=employee_id).first()
+        if employee is None:
             messages.error(request, "Employee does not exist.")
-        except Exception as e:
-            messages.error(request, str(e))
+        else:
+            offboard_employees([employee])
+            messages.success(request, "Employee deleted successfully.")
 
         return redirect("employee-list")
         
@@ -901,7 +920,7 @@ class VendorUpdateView(LoginRequiredMixin, View):
             return redirect("vendor-list")
 
 
-class EmployeeDetailsView(LoginRequiredMixin, View):
+class EmployeeDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View to show Details of Employee
     """
@@ -920,7 +939,9 @@ class EmployeeDetailsView(LoginRequiredMixin, View):
 
         try:
             employee = Employee.objects.get(id=employee_id)
-            employee_asset = AssignAsset.objects.filter(employee=employee)
+            employee_asset = AssignAsset.objects.filter(employee=employee).select_related(
+                "asset__asset_type"
+            )
             emp_clientasset = ClientAsset.objects.filter(employee=employee).select_related('asset_type')
 
             context = {
@@ -935,7 +956,7 @@ class EmployeeDetailsView(LoginRequiredMixin, View):
             return redirect("employee-list")
 
 
-class VendorDetailsView(LoginRequiredMixin, View):
+class VendorDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     View to display vendor details along with their assets and assigned assets.
 
@@ -958,21 +979,22 @@ class VendorDetailsView(LoginRequiredMixin, View):
         Returns:
             HttpResponse: The rendered view with context data.
         """
+        context = cached("vendor_details", self.get_vendor_context, id)
+        return render(request, self.template_name, context)
+
+    def get_vendor_context(self, id):
         vendor_details = Vendor.objects.get(id=id)
-        vendor_asset = Asset.objects.filter(vendor=id)
-        vendor_assign_asset=Asset.objects.filter(vendor=id,is_assign=True)
-        asset_id_list = []
-        for data in vendor_assign_asset:
-            asset_id_list.append(data.id)
-        assign_asset_details = AssignAsset.objects.filter(asset__in=asset_id_list)
+        vendor_asset = Asset.objects.filter(vendor=id).select_related("asset_type", "vendor")
+        assign_asset_details = AssignAsset.objects.filter(
+            asset__vendor=id, asset__is_assign=True
+        ).select_related("employee", "asset__asset_type")
         asset_result = vendor_details_info(id)
-        context = {
+        return {
             "vendor": vendor_details,
-            "vendor_asset": vendor_asset,
+            "vendor_asset": list(vendor_asset),
             "output":asset_result,
-            "assign_asset_details": assign_asset_details,
+            "assign_asset_details": list(assign_asset_details),
         }
-        return render(request, self.template_name, context)
 
 
 class VendorDeleteView(LoginRequiredMixin, View):
@@ -992,7 +1014,6 @@ class VendorDeleteView(LoginRequiredMixin, View):
     def get(self, request, id):
         try:
             vendor = Vendor.objects.get(id=id)
-            vendor.is_active = False
             vendor.delete()
             return redirect("vendor-list")
         except Exception as e:
@@ -1006,40 +1027,209 @@ class CreateAssignAssetView(LoginRequiredMixin, View):
         form = AssignedAssetForm()
         return render(request, self.template_name, {"form": form})
 
+    def post(self, request):
+        form = AssignedAssetForm(request.POST)
+        if not form.is_valid():
+            return render(request, self.template_name, {"form": form})
+
+        results = assign_assets(
+            form.cleaned_data.get("asset"),
+            form.cleaned_data.get("employee"),
+            form.cleaned_data.get("date_of_assign"),
+        )
+        assigned = [asset_id for asset_id, status in results.items() if status == ASSIGNED]
+        skipped = len(results) - len(assigned)
+        if skipped:
+            messages.warning(
+                request, f"{skipped} selected asset(s) are already assigned and were skipped."
+            )
+        if not assigned:
+            return redirect("assign-asset-create")
+        messages.success(request, f"{len(assigned)} asset(s) assigned successfully.")
+        return redirect("assign-assets-list")
+
+
+class BulkAssignAssetView(LoginRequiredMixin, View):
+    """
+    JSON API to assign a batch of assets to one employee in a single transaction.
+
+    Expects a JSON body of the form::
+
+        {"employee_id": "E123", "assets": [1, 2, 3], "date_of_assign": "2023-08-01"}
+
+    and responds with the outcome for every requested asset id.
+    """
+
     def post(self, request):
         try:
-            form = AssignedAssetForm(request.POST)
-            if form.is_valid():
-                assets = form.cleaned_data.get("asset")
-                employee = form.cleaned_data.get("employee")
-                date = form.cleaned_data.get("date_of_assign")
-                for asset in assets:
-                    alreay_assigned = AssignAsset.objects.filter(
-                        asset=asset, employee=employee
-                    ).exists()
-                    if not alreay_assigned:
-                        assigned = AssignAsset.objects.create(
-                            asset=asset, employee=employee,date_of_assign = date
-                        )
-                        asset.is_assign = True
-                        assigned.save()
-                        asset.save()
-                        return redirect("assign-assets-list")
-                    else:
-                        messages.success(
-                            request, "Employee already assigned this asset."
-                        )
-                        return redirect("/dashboard/assign/asset/create/")
+            payload = json.loads(request.body)
+            assets = payload["assets"]
+            # A string or an object would otherwise be iterated into ids.
+            if not isinstance(assets, list) or any(isinstance(a, bool) for a in assets):
+                raise TypeError("'assets' must be a list of asset ids")
+            asset_ids = [int(asset_id) for asset_id in assets]
+            employee = Employee.objects.get(employee_id=payload["employee_id"])
+            date_of_assign = payload.get("date_of_assign")
+            if date_of_assign:
+                date_of_assign = date.fromisoformat(date_of_assign)
+        except Employee.DoesNotExist:
+            return JsonResponse({"error": "Employee not found."}, status=404)
+        except (ValueError, KeyError, TypeError) as e:
+            return JsonResponse({"error": f"Invalid request: {e}"}, status=400)
 
-                messages.success(request, "Employee data saved")
-                return redirect("/dashboard/assign/assets/list/")
-            else:
-                return render(request, self.template_name, {"form": form})
-        except Exception as e:
-            return redirect("/dashboard/assign/asset/create/")
+        results = assign_assets(asset_ids, employee, date_of_assign)
+        return JsonResponse({
+            "assigned": sum(status == ASSIGNED for status in results.values()),
+            "results": [
+                {"asset": asset_id, "status": status} for asset_id, status in results.items()
+            ],
+        })
+
+
+class AssignmentHoldingsView(LoginRequiredMixin, View):
+    """
+    JSON API answering who held what at a point in time, from the assignment ledger.
+
+    Query parameters: ``at`` (an ISO date, meaning the end of that day, or
+    datetime; now when omitted) and optionally ``employee`` (an employee id)
+    or ``serial`` (an asset serial number). For a serial number the asset's
+    full event history is returned as well.
+    """
+
+    def get(self, request):
+        try:
+            when = self.parse_when(request.GET.get("at"))
+            filters = {}
+            if request.GET.get("employee"):
+                filters["employee"] = Employee.all_objects.filter(
+                    employee_id=request.GET["employee"]
+                ).latest("id")
+            if request.GET.get("serial"):
+                filters["asset"] = Asset.all_objects.filter(
+                    serial_number=request.GET["serial"]
+                ).latest("id")
+        except (Employee.DoesNotExist, Asset.DoesNotExist):
+            return JsonResponse({"error": "Employee or asset not found."}, status=404)
+        except ValueError as e:
+            return JsonResponse({"error": f"Invalid request: {e}"}, status=400)
+
+        holdings = holdings_at(when, **filters)
+        employees = {
+            employee.pk: employee
+            for employee in Employee.all_objects.filter(pk__in=set(holdings.values()))
+        }
+        serials = {
+            subject: dict(model.all_objects.filter(
+                pk__in=[subject_id for key, subject_id in holdings if key == subject]
+            ).values_list("id", "serial_number"))
+            for subject, model in (("asset", Asset), ("client_asset", ClientAsset))
+        }
+        response = {
+            "at": when.isoformat() if when else None,
+            "holdings": [
+                {
+                    "type": subject,
+                    "id": subject_id,
+                    "serial_number": serials[subject].get(subject_id),
+                    "employee": employees[employee_id].employee_id if employee_id in employees else None,
+                    "employee_pk": employee_id,
+                }
+                for (subject, subject_id), employee_id in sorted(holdings.items())
+            ],
+        }
+        if "asset" in filters:
+            response["history"] = [
+                {
+                    "kind": event.kind,
+                    "employee_pk": event.employee_id,
+                    "previous_employee_pk": event.previous_employee_id,
+                    "recorded_at": event.recorded_at.isoformat(),
+                    "effective_on": event.effective_on.isoformat() if event.effective_on else None,
+                }
+                for event in filters["asset"].assignment_events.order_by("id")
+            ]
+        return JsonResponse(response)
+
+    @staticmethod
+    def parse_when(value):
+        if not value:
+            return None
+        when = parse_datetime(value)
+        if when is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError(f"{value!r} is not a date or datetime.")
+            when = dt.datetime.combine(day, dt.time.max)
+        return make_aware(when) if when.tzinfo is None else when
+
+
+class ActivityTrendView(LoginRequiredMixin, ConditionalGetMixin, View):
+    """
+    JSON API feeding the dashboard's activity chart from the daily rollups.
+
+    Query parameters: ``days`` (30, 90 or 365; 30 when omitted) and optionally
+    ``asset_type`` (an asset type id). Returns one value per day for
+    assignments, releases, dispatches, purchases and spend.
+    """
+
+    def get(self, request):
+        try:
+            days = int(request.GET.get("days", 30))
+            asset_type = request.GET.get("asset_type") or None
+            if asset_type is not None:
+                asset_type = int(asset_type)
+            trend = get_activity_trend(days, asset_type=asset_type)
+        except ValueError as e:
+            return JsonResponse({"error": f"Invalid request: {e}"}, status=400)
+        return JsonResponse(trend)
 
 
-class ClientList(LoginRequiredMixin, ListView):
+class SearchView(LoginRequiredMixin, View):
+    """
+    JSON API for the global search over assets, employees, vendors and client assets.
+
+    Query parameters: ``q`` (the search text), ``page``, ``page_size`` and
+    ``type`` (repeatable, one of ``asset``, ``employee``, ``vendor``,
+    ``client_asset``). Hits are ranked best match first.
+    """
+
+    def get(self, request):
+        try:
+            page = int(request.GET.get("page", 1))
+            page_size = int(request.GET.get("page_size", DEFAULT_PAGE_SIZE))
+        except ValueError as e:
+            return JsonResponse({"error": f"Invalid request: {e}"}, status=400)
+        return JsonResponse(
+            search(request.GET.get("q", ""), page, page_size, request.GET.getlist("type"))
+        )
+
+
+class AssetFacetView(LoginRequiredMixin, ConditionalGetMixin, View):
+    """
+    JSON API for browsing live assets by configuration, with per-facet counts.
+
+    Query parameters: ``asset_type`` (an asset type id), ``asset_brand``,
+    ``ram``, ``ssd``, ``processor``, ``operating_system`` and ``storage``, each
+    repeatable; ``assigned`` (``true`` or ``false``), ``page`` and
+    ``page_size``, e.g. ``?assigned=false&ram=16GB&processor=i7&operating_system=UBUNTU``.
+    """
+
+    def get(self, request):
+        assigned = request.GET.get("assigned", "")
+        try:
+            if assigned not in ("", "true", "false"):
+                raise ValueError("assigned must be true or false.")
+            return JsonResponse(faceted_search(
+                {facet: request.GET.getlist(facet) for facet in FACETS},
+                is_assign={"true": True, "false": False}.get(assigned),
+                page=int(request.GET.get("page", 1)),
+                page_size=int(request.GET.get("page_size", DEFAULT_PAGE_SIZE)),
+            ))
+        except ValueError as e:
+            return JsonResponse({"error": f"Invalid request: {e}"}, status=400)
+
+
+class ClientList(LoginRequiredMixin, ConditionalGetMixin, ListView):
     """
         A view that displays a list of client assets on a web page. 
 
@@ -1055,9 +1245,7 @@ class ClientList(LoginRequiredMixin, ListView):
     template_name = "inventory/client.html"
 
     def get(self, request):
-        client_list = ClientAsset.objects.all()
-        context =  {'object_list':client_list}
-        return render(request,self.template_name, context)
+        return render(request, self.template_name)
 
 
 class ClientCreateView(LoginRequiredMixin, View):
@@ -1066,8 +1254,7 @@ class ClientCreateView(LoginRequiredMixin, View):
     def get(self, request):
         form = ClientForm()
         asset_type = AssetType.objects.all()
-        employee = Employee.objects.all()
-        context = {"form": form, 'asset_type':asset_type, 'employee':employee}
+        context = {"form": form, 'asset_type':asset_type}
         return render(request,self.template_name , context)
     
     def post(self, request):
@@ -1078,7 +1265,7 @@ class ClientCreateView(LoginRequiredMixin, View):
         Asset_type = request.POST['asset_type']
         Assetname = AssetType.objects.get(asset_name=Asset_type)
         emp = request.POST['employee']
-        employee = Employee.objects.get(email=emp)
+        employee = Employee.objects.get(id=emp)
         pro_owner = request.POST['project_owner']
         serial_number = request.POST['serial_number']
         ram = request.POST['ram']
@@ -1106,7 +1293,8 @@ class ClientCreateView(LoginRequiredMixin, View):
         
         if obj.is_dispatch == True:
             obj.is_active = False
-        obj.save()    
+        with atomic_write():
+            obj.save()
         return redirect("client-list")
 
 
@@ -1132,12 +1320,13 @@ class ClientUpdateView(LoginRequiredMixin, View):
             client = ClientAsset.objects.filter(id=id).first()
             form = ClientForm(request.POST, instance=client)
             if form.is_valid():
-                form.save()
-                if client.is_dispatch:
-                    client.is_active =False
-                else:
-                    client.is_active = True    
-                client.save()    
+                with atomic_write():
+                    form.save()
+                    if client.is_dispatch:
+                        client.is_active =False
+                    else:
+                        client.is_active = True
+                    client.save()
                 return redirect("client-list")
             return render(request, self.template_name, {"form": form})
         except Exception as e:
@@ -1161,7 +1350,7 @@ class ClientDeleteView(LoginRequiredMixin, View):
             messages.error(e)
             return redirect("client-list")
 
-class AssetDetailsView(LoginRequiredMixin, View):
+class AssetDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     template_name = "inventory/asset_details.html"
     def get(self, request, asset_id):
         """
@@ -1175,12 +1364,12 @@ class AssetDetailsView(LoginRequiredMixin, View):
         Returns:
             HttpResponse: The HTTP response with the asset details.
         """
-        asset_details = Asset.objects.all().filter(id=asset_id)
+        asset_details = Asset.objects.filter(id=asset_id).select_related("asset_type", "vendor")
         context =  {"asset_details": asset_details}
         return render(request, self.template_name, context)
 
 
-class RemainingAssetListView(LoginRequiredMixin, View):
+class RemainingAssetListView(LoginRequiredMixin, ConditionalGetMixin, View):
     template_name = "inventory/remaining_assest_list.html"
     def get(self,request):
         """
@@ -1193,12 +1382,10 @@ class RemainingAssetListView(LoginRequiredMixin, View):
         Returns:
             HttpResponse: The HTTP response with the asset details.
         """
-        remaining_assets = Asset.objects.filter(is_assign=False)
-        context = {"remaining_assets": remaining_assets}
-        return render(request, self.template_name, context)
+        return render(request, self.template_name)
 
 
-class TotalAssetDetailsView(LoginRequiredMixin, View):
+class TotalAssetDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     template_name = "inventory/total_asset_detail.html"
     def get(self, request, asset_name):
         """
@@ -1211,12 +1398,14 @@ class TotalAssetDetailsView(LoginRequiredMixin, View):
         Returns:
             HttpResponse: The HTTP response with the asset details.
         """
-        asset_details = Asset.objects.filter(asset_type__asset_name = asset_name)
+        asset_details = Asset.objects.filter(
+            asset_type__asset_name=asset_name
+        ).select_related("asset_type", "vendor")
         context = {"asset_details": asset_details}
         return render(request, self.template_name, context)
 
 
-class VendorTotalAssetDetailsView(LoginRequiredMixin, View):
+class VendorTotalAssetDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     template_name = "inventory/total_asset_detail.html"
 
     def get(self, request, asset_name, vendor_id):
@@ -1236,7 +1425,7 @@ class VendorTotalAssetDetailsView(LoginRequiredMixin, View):
         return render(request, self.template_name, context)
 
 
-class TotalDashboardAssetDetailsView(LoginRequiredMixin, View):
+class TotalDashboardAssetDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     A view for displaying the total assets by asset type and brand.
 
@@ -1252,47 +1441,13 @@ class TotalDashboardAssetDetailsView(LoginRequiredMixin, View):
     template_name = "inventory/dashboard_total_assets.html"
 
     def get(self, request):
-        asset_typ = Asset.objects.all().values_list('asset_brand', flat=True).distinct()
-        
-        asset_list = []
-        for brand_name in asset_typ:    
-            obj = Asset.objects.filter(asset_brand=brand_name)
-            for data in obj:
-                remaining = 0
-                d = {}
-                if data.asset_type.asset_name in d:
-                    d["asset_type"] = data.asset_type.asset_name
-                    d["asset_price"] += data.price
-                    d['count'] += 1
-                else:
-                    d["asset_type"] = data.asset_type.asset_name
-                    d["asset_price"] = data.price
-                    d['count'] = 1
-                if data.is_assign:
-                    remaining = 0
-                    d['remaining'] = remaining
-                else:
-                    remaining += 1 
-                    d['remaining'] = remaining      
-                asset_list.append(d)
-
-        result = []
-        for asset in asset_list:
-            found = False
-            for res in result:
-                if res['asset_type'] == asset['asset_type']:
-                    res['count'] += 1
-                    res['asset_price'] += asset['asset_price']
-                    res['remaining'] += asset['remaining']
-                    found = True
-                    break
-            if not found:
-                result.append(asset)
-        context = {"asset_details": result}        
+        context = {"asset_details": cached("total_asset_detail", self.get_asset_details)}
         return render(request, self.template_name, context)
 
+    def get_asset_details(self):
+        return get_type_summary()
 
-class TotalRemainingAssetDetailsView(LoginRequiredMixin, View):
+class TotalRemainingAssetDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
     """
     A view for displaying the total remaining assets by asset type and brand.
 
@@ -1308,45 +1463,13 @@ class TotalRemainingAssetDetailsView(LoginRequiredMixin, View):
     template_name = "inventory/total_remaining_assets.html"
 
     def get(self, request):
-        asset_typ = Asset.objects.all().values_list('asset_brand', flat=True).distinct()
-        asset_list = []
-        for brand_name in asset_typ:    
-            obj = Asset.objects.filter(asset_brand=brand_name,is_assign=False)
-            for data in obj:
-                remaining = 0
-                d = {}
-                if data.asset_type.asset_name in d:
-                    d["asset_type"] = data.asset_type.asset_name
-                    d["asset_price"] += data.price
-                    d['count'] += 1
-                else:
-                    d["asset_type"] = data.asset_type.asset_name
-                    d["asset_price"] = data.price
-                    d['count'] = 1
-                if data.is_assign:
-                    remaining = 0
-                    d['remaining'] = remaining
-                else:
-                    remaining += 1 
-                    d['remaining'] = remaining      
-                asset_list.append(d)
-        asset_details = []
-        for asset in asset_list:
-            found = False
-            for res in asset_details:
-                if res['asset_type'] == asset['asset_type']:
-                    res['count'] += 1
-                    res['asset_price'] += asset['asset_price']
-                    res['remaining'] += asset['remaining']
-                    found = True
-                    break
-            if not found:
-                asset_details.append(asset)
-        context = {"asset_details": asset_details}        
-        return render(request,self.template_name, context)
-
-
-class TotalReaminingAssetDetailsView(LoginRequiredMixin, View):
+        context = {"asset_details": cached("total_remaining_asset_detail", self.get_asset_details)}
+        return render(request, self.template_name, context)
+
+    def get_asset_details(self):
+        return get_type_summary(is_assign=False)
+
+class TotalReaminingAssetDetailsView(LoginRequiredMixin, ConditionalGetMixin, View):
 
     template_name = "inventory/total_asset_detail.html"
     def get(self, request, asset_name):
@@ -1359,7 +1482,9 @@ class TotalReaminingAssetDetailsView(LoginRequiredMixin, View):
         Returns:
             A rendered HTML template displaying a table of the remaining assets of the specified asset type.
         """
-        asset_details = Asset.objects.filter(asset_type__asset_name = asset_name,is_assign=False)
+        asset_details = Asset.objects.filter(
+            asset_type__asset_name=asset_name, is_assign=False
+        ).select_related("asset_type", "vendor")
         context = {"asset_details": asset_details}
         return render(request, self.template_name, context)
 
@@ -1373,9 +1498,17 @@ def assign_asset_count(request,employee):
         employee: Email address of the employee to get asset details for.
 
     Returns:
-        JsonResponse containing a list of dictionaries with asset details.
+        JsonResponse containing a list of dictionaries with asset details and
+        the employee's holdings counters.
     """
-    assets = AssignAsset.objects.filter(employee__email=employee)
+    holder = Employee.objects.filter(email=employee).values(
+        "id", "assets_held", "held_value", "client_assets_held"
+    ).first() or {"id": None, "assets_held": 0, "held_value": 0, "client_assets_held": 0}
+    assets = AssignAsset.objects.none()
+    if holder["assets_held"]:
+        assets = AssignAsset.objects.filter(
+            employee_id=holder["id"], asset__isnull=False, asset__deleted_at__isnull=True
+        ).select_related("asset__asset_type")
     list_asset = []
     for details in assets:
         assets_dict = {}
@@ -1386,4 +1519,9 @@ def assign_asset_count(request,employee):
         assets_dict['operating_system'] = details.asset.operating_system
         assets_dict['system_configuration'] = details.asset.system_configuration
         list_asset.append(assets_dict)
-    return JsonResponse({'assets_dict': list_asset})
+    return JsonResponse({
+        'assets_dict': list_asset,
+        'assets_held': holder["assets_held"],
+        'held_value': holder["held_value"],
+        'client_assets_held': holder["client_assets_held"],
+    })
@@ -0,0 +1,19 @@
+# Python Imports
+import os
+import shutil
+
+# Third Party Imports
+from prometheus_client import multiprocess
+
+
+def on_starting(server):
+    # Samples from a previous run would be added to the new counters.
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
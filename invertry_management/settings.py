@@ -11,8 +11,8 @@ https://docs.djangoproject.com/en/2.2/ref/settings/
 """
 
 import os
+import tempfile
 from django.contrib.messages import constants as messages
-import os
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,7 +28,7 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SECRET_KEY = 'dfgnddlijfsdfjms534589idsflddsvdnj'   #default set
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.getenv("DEBUG", "true").lower() in ("1", "true", "yes")
 
 # ALLOWED_HOSTS = list(os.getenv('ALLOWED_HOSTS'))
 ALLOWED_HOSTS = ['*']
@@ -58,6 +58,8 @@ USER_APPS = [
 
 THIRDPARTY_APP = [
     "import_export",
+    "dal",
+    "dal_select2",
 ]
 
 INSTALLED_APPS = BASE_APPS + USER_APPS + THIRDPARTY_APP
@@ -65,13 +67,16 @@ INSTALLED_APPS = BASE_APPS + USER_APPS + THIRDPARTY_APP
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Serves static files before the metrics, profiling and session work runs.
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "apps.inventry.middleware.MetricsMiddleware",
+    "apps.inventry.middleware.ProfilingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
 ]
 
 ROOT_URLCONF = "invertry_management.urls"
@@ -80,7 +85,8 @@ TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # Django's backend, with render times reported to the request profiler.
+        "BACKEND": "apps.inventry.backends.templates.DjangoTemplates",
         "DIRS": [TEMPLATE_DIR],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -104,11 +110,95 @@ CSRF_TRUSTED_ORIGINS = ["https://*.ngrok.io"]
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "apps.inventry.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", 60)),
+        "OPTIONS": {"timeout": 20},
+    }
+}
+
+# Applied to every new SQLite connection by apps.inventry.sqlite.configure_connection.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", 20000)),
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KIB", 64000)),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 268435456)),
+    "temp_store": "MEMORY",
+}
+SQLITE_OPTIMIZE_INTERVAL = int(os.getenv("SQLITE_OPTIMIZE_INTERVAL", 3600))
+
+# Cache
+# The backend must be shared between worker processes so that write-driven
+# invalidation reaches every worker. Point CACHE_BACKEND/CACHE_LOCATION at a
+# Redis or memcached server to replace the file-based default.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"
+        ),
+        "LOCATION": os.getenv(
+            "CACHE_LOCATION", os.path.join(tempfile.gettempdir(), "inventory_cache")
+        ),
     }
 }
 
+INVENTORY_CACHE_TIMEOUT = int(os.getenv("INVENTORY_CACHE_TIMEOUT", 300))
+
+# Columnar asset snapshot
+# Needs NumPy; each worker rebuilds its snapshot after writes, detected through the cache above.
+
+INVENTORY_SNAPSHOT_ENABLED = os.getenv("INVENTORY_SNAPSHOT_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Soft delete
+# Deleted assets, client assets, employees and vendors are kept this many days
+# before the purge_deleted command removes them.
+
+SOFT_DELETE_RETENTION_DAYS = int(os.getenv("SOFT_DELETE_RETENTION_DAYS", 90))
+
+# Assignment ledger
+# A checkpoint of all holdings is stored every this many events, bounding point-in-time replays.
+
+ASSIGNMENT_CHECKPOINT_INTERVAL = int(os.getenv("ASSIGNMENT_CHECKPOINT_INTERVAL", 10000))
+
+# Request profiling
+# Profiled requests get a Server-Timing header and one JSON line in PROFILING_LOG_FILE.
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 1.0))
+PROFILING_SLOW_QUERY_COUNT = int(os.getenv("PROFILING_SLOW_QUERY_COUNT", 5))
+PROFILING_LOG_FILE = os.getenv("PROFILING_LOG_FILE", os.path.join(BASE_DIR, "profiling.log"))
+
+# Prometheus metrics
+# /metrics only answers requests with "Authorization: Bearer <METRICS_TOKEN>" or from
+# METRICS_ALLOWED_IPS. Behind a proxy every client has the proxy's address, so use the
+# token there. Set PROMETHEUS_MULTIPROC_DIR under gunicorn.
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_ALLOWED_IPS = [ip for ip in os.getenv("METRICS_ALLOWED_IPS", "").split(",") if ip]
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "profiling": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": PROFILING_LOG_FILE,
+            "maxBytes": 10 * 1024 * 1024,
+            "backupCount": 5,
+            "delay": True,
+        },
+    },
+    "loggers": {
+        "apps.inventry.profiling": {
+            "handlers": ["profiling"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
 LOGIN_URL = "/"
 LOGIN_REDIRECT_URL = "/profile/"
 
@@ -154,14 +244,78 @@ AUTH_USER_MODEL = "inventry.User"
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/2.2/howto/static-files/
 
-STATIC_URL = os.path.join(BASE_DIR, "static/")
+STATIC_URL = "/static/"
 
 STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
 
+# `python manage.py collectstatic` writes the hashed and compressed files here.
+STATIC_ROOT = os.getenv("STATIC_ROOT", os.path.join(BASE_DIR, "staticfiles"))
+
+STATICFILES_FINDERS = [
+    "django.contrib.staticfiles.finders.FileSystemFinder",
+    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
+    "apps.inventry.staticfiles.BundleFinder",
+]
+
+# Outside DEBUG, file names carry a content hash and gzip/brotli variants are
+# written next to them; WhiteNoise serves those with far-future cache headers.
+STATICFILES_STORAGE = os.getenv(
+    "STATICFILES_STORAGE",
+    "django.contrib.staticfiles.storage.StaticFilesStorage"
+    if DEBUG
+    else "whitenoise.storage.CompressedManifestStaticFilesStorage",
+)
+
+# Static files concatenated by BundleFinder into bundles/<name>.css and
+# bundles/<name>.js; see apps/inventry/staticfiles.py.
+STATIC_BUNDLES = {
+    "jquery": {
+        "js": ["vendor/jquery/jquery.min.js"],
+    },
+    "core": {
+        "css": [
+            "vendor/bootstrap/css/bootstrap.min.css",
+            "vendor/bootstrap-icons/bootstrap-icons.css",
+            "css/style.css",
+        ],
+        "js": [
+            "vendor/bootstrap/js/bootstrap.bundle.min.js",
+            "js/main.js",
+        ],
+    },
+    "select2": {
+        "css": ["vendor/select2/css/select2.min.css"],
+        "js": ["vendor/select2/js/select2.full.min.js"],
+    },
+    "datatables": {
+        "css": [
+            "vendor/datatables/css/dataTables.bootstrap4.min.css",
+            "vendor/datatables/css/buttons.bootstrap4.min.css",
+        ],
+        "js": [
+            "vendor/datatables/js/jquery.dataTables.min.js",
+            "vendor/datatables/js/dataTables.bootstrap4.min.js",
+            "vendor/datatables/js/dataTables.buttons.min.js",
+            "vendor/datatables/js/buttons.bootstrap4.min.js",
+            "vendor/jszip/jszip.min.js",
+            "vendor/datatables/js/buttons.html5.min.js",
+            "vendor/datatables/js/buttons.print.min.js",
+            "js/datatables.js",
+        ],
+    },
+    "charts": {
+        "js": ["vendor/apexcharts/apexcharts.min.js", "js/activity_chart.js"],
+    },
+    # Loaded by the DataTables PDF button on first use, see static/js/datatables.js.
+    "pdfmake": {
+        "js": ["vendor/pdfmake/pdfmake.min.js", "vendor/pdfmake/vfs_fonts.js"],
+    },
+}
+
 DATE_FORMAT = "d-m-Y"
 DATE_INPUT_FORMATS = (("%d-%m-%Y"),)
 DATETIME_FORMAT = "d-m-Y H:i"
-DATETIME_INPUT_FORMATS = (("%d-%m-%Y %H:%i"),)
+DATETIME_INPUT_FORMATS = (("%d-%m-%Y %H:%M"),)
 
 MESSAGE_TAGS = {
     messages.DEBUG: "alert-secondary",
@@ -21,6 +21,7 @@ from django.contrib import admin
 from django.urls import path,include
 
 # Project Imports
+from apps.inventry.metrics import metrics_view
 from apps.inventry.views import LoginView, SignoutView
 
 
@@ -33,4 +34,5 @@ urlpatterns = [
     path('dashboard/', include('apps.inventry.urls')),
     path('', LoginView.as_view(), name="login"),
     path("signout/", SignoutView.as_view(), name="signout"),
+    path("metrics", metrics_view, name="metrics"),
 ]
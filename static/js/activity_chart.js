@@ -0,0 +1,68 @@
+/**
+* Dashboard activity chart.
+*
+* Draws the daily assignments, releases, dispatches, purchases and spend of the
+* last 30, 90 or 365 days from the JSON at the data-url of #activity-chart
+* (the daily activity rollups), and redraws when a period button is clicked.
+*/
+(function() {
+  "use strict";
+
+  const container = document.getElementById("activity-chart");
+  if (!container || typeof ApexCharts === "undefined") {
+    return;
+  }
+
+  const counts = [
+    ["assignments", "Assignments"],
+    ["releases", "Releases"],
+    ["dispatches", "Dispatches"],
+    ["purchases", "Purchases"]
+  ];
+  const buttons = document.querySelectorAll("[data-days]");
+
+  const chart = new ApexCharts(container, {
+    chart: {
+      type: "line",
+      height: 320,
+      toolbar: { show: false },
+      zoom: { enabled: false }
+    },
+    series: [],
+    stroke: { width: 2, curve: "smooth" },
+    dataLabels: { enabled: false },
+    xaxis: { type: "datetime" },
+    yaxis: [
+      { seriesName: "Assignments", title: { text: "Count" }, min: 0, forceNiceScale: true },
+      { seriesName: "Assignments", show: false },
+      { seriesName: "Assignments", show: false },
+      { seriesName: "Assignments", show: false },
+      { opposite: true, title: { text: "Spend" }, min: 0 }
+    ],
+    noData: { text: "Loading..." }
+  });
+  chart.render();
+
+  const load = (days) => {
+    const url = new URL(container.dataset.url, window.location.origin);
+    url.searchParams.set("days", days);
+    fetch(url, { credentials: "same-origin", headers: { Accept: "application/json" } })
+      .then((response) => response.ok ? response.json() : Promise.reject(response))
+      .then((trend) => {
+        const points = (values) => trend.days.map((day, i) => [day, Number(values[i])]);
+        chart.updateSeries(
+          counts.map(([field, name]) => ({ name: name, type: "line", data: points(trend[field]) }))
+            .concat([{ name: "Spend", type: "area", data: points(trend.spend) }])
+        );
+      })
+      .catch(() => chart.updateOptions({ noData: { text: "Could not load activity." } }));
+  };
+
+  buttons.forEach((button) => {
+    button.addEventListener("click", () => {
+      buttons.forEach((other) => other.classList.toggle("active", other === button));
+      load(button.dataset.days);
+    });
+  });
+  load(30);
+})();
@@ -0,0 +1,104 @@
+/**
+* DataTables setup shared by the table pages.
+*
+* Tables with a data-url attribute are paged, sorted and searched by the server
+* (apps/inventry/datatables.py), so a page costs the same at any table size.
+* Each header cell names its field in the JSON rows with data-data; data-link
+* names the field holding the URL the cell links to, and data-button turns the
+* column into a button to the URL in the field (asking data-confirm first).
+*
+* Only the current page is in the browser, so the CSV and Excel buttons
+* download the whole table from the streaming exports at the table's data-csv
+* and data-xlsx URLs (apps/inventry/exports.py) instead of building the file
+* from the rows on screen.
+*
+* pdfmake and its fonts are 2 MB, so the PDF export button downloads them on
+* first use, from the URL in the data-pdfmake attribute of this bundle's
+* script tag, instead of every table page loading them up front.
+*/
+(function($) {
+  "use strict";
+
+  const pdfmakeUrl = document.currentScript && document.currentScript.dataset.pdfmake;
+  const pdfHtml5 = $.fn.dataTable.ext.buttons.pdfHtml5;
+  let loading = null;
+
+  const loadPdfMake = () => {
+    if (!loading) {
+      loading = $.ajax({
+        url: pdfmakeUrl,
+        dataType: "script",
+        cache: true
+      });
+    }
+    return loading;
+  }
+
+  $.fn.dataTable.ext.buttons.pdf = $.extend({}, pdfHtml5, {
+    available: () => window.FileReader !== undefined && Boolean(pdfmakeUrl),
+    action: function(e, dt, button, config) {
+      loadPdfMake().then(() => pdfHtml5.action.call(this, e, dt, button, config));
+    }
+  });
+
+  const escape = $.fn.dataTable.render.text().display;
+
+  const column = (th) => {
+    const { data, link, button, confirm } = th.dataset;
+    if (button) {
+      return {
+        data: data,
+        orderable: false,
+        searchable: false,
+        className: "text-center",
+        render: (url) => {
+          const prompt = confirm ? ` data-confirm="${escape(confirm)}"` : "";
+          return `<a href="${escape(url)}" class="btn btn-primary"${prompt}>${escape(button)}</a>`;
+        }
+      };
+    }
+    return {
+      data: data,
+      render: (value, type, row) => {
+        const text = escape(value === null || value === undefined ? "" : value);
+        return link && type === "display" ? `<a href="${escape(row[link])}">${text}</a>` : text;
+      }
+    };
+  };
+
+  const download = (text, url) => ({
+    text: text,
+    action: () => { window.location.href = url; }
+  });
+
+  const buttons = (table) => {
+    const { csv, xlsx } = table.dataset;
+    return [
+      "copy",
+      csv ? download("CSV", csv) : "csv",
+      xlsx ? download("Excel", xlsx) : "excel",
+      "pdf",
+      "print"
+    ];
+  };
+
+  $(document).on("click", "a[data-confirm]", function() {
+    return window.confirm(this.dataset.confirm);
+  });
+
+  $(function() {
+    $("table[data-url]").each(function() {
+      $(this).DataTable({
+        serverSide: true,
+        processing: true,
+        ajax: this.dataset.url,
+        columns: $(this).find("thead th").get().map(column),
+        search: { search: this.dataset.search || "" },
+        pageLength: 50,
+        order: [],
+        dom: "Bfrtip",
+        buttons: buttons(this)
+      });
+    });
+  });
+})(jQuery);